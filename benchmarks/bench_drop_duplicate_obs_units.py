@@ -0,0 +1,132 @@
+"""Benchmark dropping duplicate observational units across batches.
+
+Compares `_drop_duplicate_obs_units()` with the previous approach of sorting
+all rows by their timestamp and keeping the last row of each primary key, in
+any order. With a primary key, `_drop_duplicate_obs_units()` sorts the rows
+too, but keeps their order, so the result is the same each time. Without a
+primary key, it drops identical rows without sorting, and `maintain_order`
+decides whether the rows keep their order. `maintain_order` has no effect
+with a primary key, so it is only compared without one.
+
+The batches are in the order of their timestamps by default, as they are
+when read with `read_resource_batches()`. Use `--shuffle` to mix the rows of
+all batches.
+
+Run with:
+
+    uv run python benchmarks/bench_drop_duplicate_obs_units.py --rows 10000000
+"""
+
+import argparse
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from time import perf_counter
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_DATA_TYPE,
+)
+from seedcase_sprout.join_resource_batches import _drop_duplicate_obs_units
+
+
+def create_data(
+    rows: int, batches: int, duplicate_ratio: float, shuffle: bool
+) -> pl.DataFrame:
+    """Creates batch data where a share of the rows have a duplicate primary key.
+
+    Args:
+        rows: The number of rows.
+        batches: The number of batches, each with its own timestamp.
+        duplicate_ratio: The share of rows that repeat an earlier primary key.
+        shuffle: Whether to mix the rows of all batches, rather than having the
+            batches in the order of their timestamps.
+
+    Returns:
+        The data, with an `id` primary key and a timestamp column.
+    """
+    unique_ids = max(1, int(rows * (1 - duplicate_ratio)))
+    timestamps = [
+        datetime(2025, 1, 1, tzinfo=UTC) + timedelta(hours=batch)
+        for batch in range(batches)
+    ]
+    batch_timestamps = pl.Series(timestamps, dtype=BATCH_TIMESTAMP_DATA_TYPE).sample(
+        rows, with_replacement=True, seed=1
+    )
+    if not shuffle:
+        batch_timestamps = batch_timestamps.sort()
+    return pl.DataFrame(
+        {
+            "id": pl.int_range(rows, eager=True) % unique_ids,
+            "value": pl.int_range(rows, eager=True).cast(pl.Float64),
+            BATCH_TIMESTAMP_COLUMN_NAME: batch_timestamps,
+        }
+    )
+
+
+def sort_then_unique(data: pl.DataFrame, primary_key: str | None) -> pl.DataFrame:
+    """The previous approach, sorting all rows by their timestamp."""
+    data = data.sort(BATCH_TIMESTAMP_COLUMN_NAME)
+    data = data.drop(BATCH_TIMESTAMP_COLUMN_NAME)
+    return data.unique(subset=primary_key, keep="last")
+
+
+def time_it(fn: Callable[[], pl.DataFrame], repeat: int) -> tuple[float, pl.DataFrame]:
+    """Runs the function `repeat` times and returns the fastest time."""
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        result = fn()
+        times.append(perf_counter() - start)
+    return min(times), result
+
+
+def main() -> None:
+    """Runs the benchmark and prints the fastest time of each approach."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batches", type=int, default=100)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--shuffle", action="store_true", help="Mix the rows of all batches."
+    )
+    args = parser.parse_args()
+
+    data = create_data(args.rows, args.batches, args.duplicate_ratio, args.shuffle)
+    print(
+        f"{args.rows:,} rows, {args.batches} batches, "
+        f"{args.duplicate_ratio:.0%} duplicates, "
+        f"{'shuffled' if args.shuffle else 'in timestamp order'}"
+    )
+    for primary_key in ["id", None]:
+        print(f"\nprimary_key={primary_key!r}")
+        old_time, old_result = time_it(
+            partial(sort_then_unique, data, primary_key), args.repeat
+        )
+        print(f"  sort then unique:           {old_time:.3f}s")
+        variants = (
+            {"new": False}
+            if primary_key
+            else {
+                "new, maintain_order=False": False,
+                "new, maintain_order=True": True,
+            }
+        )
+        for name, maintain_order in variants.items():
+            new_time, new_result = time_it(
+                partial(_drop_duplicate_obs_units, data, primary_key, maintain_order),
+                args.repeat,
+            )
+            assert_frame_equal(old_result.sort(pl.all()), new_result.sort(pl.all()))
+            print(
+                f"  {name + ':':<27} {new_time:.3f}s "
+                f"({old_time / new_time:.1f}x faster)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Benchmark the read, check, join, and write pipeline of a resource's data.
+
+Builds a synthetic data package with batch files of the given size, using the
+fields of `example_resource_properties_all_types()` and data from
+`generate_data()`, and times each step of building the resource's data
+separately:
+
+1. `read_resource_batches()`
+2. `check_data()` on the joined batches
+3. `join_resource_batches()`
+4. `write_resource_data()`
+5. `read_resource_data()`
+
+The results, including the peak memory used in each step, are saved as JSON,
+so they can be compared across versions with `compare_benchmarks.py`.
+
+Run with:
+
+    uv run python benchmarks/bench_pipeline.py --rows 1000000 --output new.json
+"""
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from importlib.metadata import version
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import polars as pl
+
+from seedcase_sprout import (
+    FieldProperties,
+    PackagePath,
+    ResourceProperties,
+    TableSchemaProperties,
+    check_data,
+    example_resource_properties_all_types,
+    generate_data,
+    join_resource_batches,
+    read_resource_batches,
+    read_resource_data,
+    write_resource_data,
+)
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_FORMAT,
+)
+from seedcase_sprout.pipeline_spans import _PeakMemory
+
+RESOURCE_NAME = "benchmark"
+
+
+def create_properties(columns: int) -> ResourceProperties:
+    """Creates resource properties with an `id` primary key and `columns` fields.
+
+    The fields are taken from `example_resource_properties_all_types()`. If more
+    columns are asked for than there are types, the fields are repeated with a
+    number added to their names.
+
+    Args:
+        columns: The number of fields, not counting the `id` field.
+
+    Returns:
+        The resource properties.
+    """
+    example_fields = example_resource_properties_all_types().schema.fields
+    fields = [FieldProperties(name="id", type="integer")]
+    for number in range(columns):
+        field = example_fields[number % len(example_fields)]
+        repeat = number // len(example_fields)
+        fields.append(
+            FieldProperties(
+                name=f"{field.name}_{repeat}" if repeat else field.name,
+                type=field.type,
+            )
+        )
+    return ResourceProperties(
+        name=RESOURCE_NAME,
+        title="Benchmark",
+        description="Synthetic data for benchmarking.",
+        schema=TableSchemaProperties(fields=fields, primary_key=["id"]),
+    )
+
+
+def create_data(
+    properties: ResourceProperties, rows: int, duplicate_ratio: float, seed: int
+) -> pl.DataFrame:
+    """Creates data for the properties with `generate_data()`.
+
+    Args:
+        properties: The properties created by `create_properties()`.
+        rows: The number of rows.
+        duplicate_ratio: The share of rows with an `id` used by another row.
+        seed: The seed for the generated values.
+
+    Returns:
+        The data, with rows in random order.
+    """
+    unique_ids = max(1, round(rows * (1 - duplicate_ratio)))
+    return (
+        generate_data(properties, rows, seed=seed)
+        .with_columns(pl.int_range(rows).alias("id") % unique_ids)
+        .sample(fraction=1, shuffle=True, seed=seed)
+    )
+
+
+def write_batch_files(
+    data: pl.DataFrame, batches: int, package_path: PackagePath
+) -> list[Path]:
+    """Splits the data into batch files with increasing timestamps.
+
+    Args:
+        data: The data to split.
+        batches: The number of batch files.
+        package_path: The package to write the batch files to.
+
+    Returns:
+        The paths to the batch files.
+    """
+    batch_path = package_path.resource_batch(RESOURCE_NAME)
+    batch_path.mkdir(parents=True)
+    batch_size = -(-data.height // batches)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    paths = []
+    for number, batch in enumerate(data.iter_slices(batch_size)):
+        timestamp = (start + timedelta(hours=number)).strftime(BATCH_TIMESTAMP_FORMAT)
+        path = batch_path / f"{timestamp}-{number}.parquet"
+        batch.write_parquet(path)
+        paths.append(path)
+    return paths
+
+
+def run_step(fn: Callable[[], Any], repeat: int) -> tuple[Any, dict[str, Any]]:
+    """Runs a step `repeat` times, timing it and tracking its peak memory.
+
+    Args:
+        fn: The step to run.
+        repeat: The number of times to run it.
+
+    Returns:
+        The result of the last run and the timings and memory of all runs.
+    """
+    seconds = []
+    peak_bytes = []
+    added_bytes = []
+    for _ in range(repeat):
+        memory = _PeakMemory()
+        memory.start()
+        start_bytes = memory.peak
+        start = perf_counter()
+        result = fn()
+        seconds.append(perf_counter() - start)
+        peak = memory.stop()
+        if peak is not None and start_bytes is not None:
+            peak_bytes.append(peak)
+            added_bytes.append(peak - start_bytes)
+    return result, {
+        "seconds": seconds,
+        "min_seconds": min(seconds),
+        "median_seconds": statistics.median(seconds),
+        "peak_memory_bytes": max(peak_bytes, default=None),
+        "added_memory_bytes": max(added_bytes, default=None),
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    """Builds the package and runs each step of the pipeline.
+
+    Args:
+        args: The parsed command line arguments.
+
+    Returns:
+        The configuration, environment, and results of the benchmark.
+    """
+    properties = create_properties(args.columns)
+    data = create_data(properties, args.rows, args.duplicate_ratio, args.seed)
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        package_path = PackagePath(Path(temp_dir))
+        paths = write_batch_files(data, args.batches, package_path)
+        del data
+
+        # Each step's input is created before timing it, and freed after, so
+        # the memory of one step doesn't count towards the next.
+        batches, results["read_resource_batches"] = run_step(
+            partial(read_resource_batches, properties, paths), args.repeat
+        )
+        batch_data = pl.concat(batches).drop(BATCH_TIMESTAMP_COLUMN_NAME)
+        _, results["check_data"] = run_step(
+            partial(check_data, batch_data, properties), args.repeat
+        )
+        del batch_data
+        joined, results["join_resource_batches"] = run_step(
+            partial(join_resource_batches, batches, properties), args.repeat
+        )
+        del batches
+        _, results["write_resource_data"] = run_step(
+            partial(write_resource_data, joined, properties, package_path.root()),
+            args.repeat,
+        )
+        del joined
+        _, results["read_resource_data"] = run_step(
+            partial(read_resource_data, RESOURCE_NAME, package_path.root()),
+            args.repeat,
+        )
+
+    return {
+        "created": datetime.now(UTC).isoformat(),
+        "versions": {
+            "seedcase_sprout": version("seedcase-sprout"),
+            "polars": pl.__version__,
+            "python": platform.python_version(),
+        },
+        "platform": platform.platform(),
+        "config": {
+            "rows": args.rows,
+            "columns": args.columns,
+            "batches": args.batches,
+            "duplicate_ratio": args.duplicate_ratio,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+        "max_memory_bytes": max_memory(),
+    }
+
+
+def max_memory() -> int:
+    """Gets the peak resident memory of the whole process in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def main() -> None:
+    """Runs the benchmarks and prints and saves the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--columns",
+        type=int,
+        default=len(example_resource_properties_all_types().schema.fields),
+    )
+    parser.add_argument("--batches", type=int, default=100)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="The JSON file to save to.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args)
+    for step, result in report["results"].items():
+        added_memory = result["added_memory_bytes"]
+        memory = "" if added_memory is None else f", +{added_memory / 2**20:.0f} MiB"
+        print(f"{step:<24} {result['min_seconds']:8.3f}s{memory}")
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
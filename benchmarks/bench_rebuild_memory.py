@@ -0,0 +1,135 @@
+"""Benchmark the peak memory of rebuilding a resource's data from its batches.
+
+Compares the streaming `rebuild_resource_data()` with reading, joining, and
+writing all the data in memory. Each approach runs in a new Python process, so
+the peak memory of one doesn't count towards the other. The peak is the
+highest resident memory of the process while it runs the approach, minus the
+memory used before it started.
+
+With `--max-memory-ratio`, the benchmark exits with an error if the rebuild
+needs more memory than that share of the size of the data in memory. This way,
+it can check that the rebuild runs out-of-core.
+
+Run with:
+
+    uv run python benchmarks/bench_rebuild_memory.py --rows 12500000
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from bench_pipeline import create_data, create_properties, write_batch_files
+
+from seedcase_sprout import PackagePath
+
+# Runs one approach in a new process and prints the peak added memory.
+RUN_APPROACH = """
+import sys
+from pathlib import Path
+
+from bench_pipeline import create_properties
+
+from seedcase_sprout.check_properties import check_resource_properties
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.pipeline_spans import _PeakMemory
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.rebuild_resource_data import rebuild_resource_data
+from seedcase_sprout.write_resource_data import write_resource_data
+
+approach, package_path = sys.argv[1], Path(sys.argv[2])
+columns, chunk_size = int(sys.argv[3]), int(sys.argv[4])
+properties = create_properties(columns)
+check_resource_properties(properties)
+memory = _PeakMemory()
+memory.start()
+start = memory.peak
+if approach == "rebuild":
+    rebuild_resource_data(properties, package_path, chunk_size=chunk_size)
+else:
+    batches = read_resource_batches(
+        properties, PackagePath(package_path).resource_batch_files(properties.name)
+    )
+    data = join_resource_batches(batches, properties)
+    del batches
+    write_resource_data(data, properties, package_path)
+print(memory.stop() - start)
+"""
+
+
+def run_approach(
+    approach: str, package_path: Path, columns: int, chunk_size: int
+) -> int:
+    """Runs the approach in a new process and gets its peak added memory."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUN_APPROACH,
+            approach,
+            str(package_path),
+            str(columns),
+            str(chunk_size),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent,
+    )
+    return int(result.stdout.strip())
+
+
+def main() -> None:
+    """Builds the package, runs both approaches, and prints their peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=12_500_000)
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--batches", type=int, default=4)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-memory-ratio",
+        type=float,
+        help="The most memory the rebuild may use, as a share of the data size.",
+    )
+    args = parser.parse_args()
+
+    properties = create_properties(args.columns)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        package_path = PackagePath(Path(temp_dir))
+        data = create_data(properties, args.rows, args.duplicate_ratio, args.seed)
+        data_bytes = data.estimated_size()
+        write_batch_files(data, args.batches, package_path)
+        del data
+        print(
+            f"{args.rows:,} rows, {args.batches} batches, "
+            f"{data_bytes / 2**20:.0f} MiB in memory"
+        )
+        rebuild_bytes = 0
+        for approach in ["in-memory", "rebuild"]:
+            added_bytes = run_approach(
+                approach, package_path.root(), args.columns, args.chunk_size
+            )
+            print(
+                f"{approach:<10} +{added_bytes / 2**20:6.0f} MiB "
+                f"({added_bytes / data_bytes:.2f}x the data)"
+            )
+            if approach == "rebuild":
+                rebuild_bytes = added_bytes
+
+    if (
+        args.max_memory_ratio is not None
+        and rebuild_bytes > args.max_memory_ratio * data_bytes
+    ):
+        sys.exit(
+            f"The rebuild used more than {args.max_memory_ratio:.2f}x the "
+            "size of the data in memory."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare two benchmark results saved by `bench_pipeline.py`.
+
+Prints the fastest time and added memory of each step in both results, and how
+much they changed. Exits with an error if any step got slower by more than the
+threshold, so it can be used to check for regressions.
+
+Run with:
+
+    uv run python benchmarks/compare_benchmarks.py old.json new.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def format_memory(memory: int | None) -> str:
+    """Formats bytes as mebibytes, or as a dash if unknown."""
+    return "-" if memory is None else f"{memory / 2**20:.0f} MiB"
+
+
+def compare(old: dict[str, Any], new: dict[str, Any], threshold: float) -> list[str]:
+    """Prints the change of each step and returns the steps that got slower.
+
+    Args:
+        old: The earlier benchmark results.
+        new: The later benchmark results.
+        threshold: How much slower, as a ratio, a step can get before it
+            counts as a regression.
+
+    Returns:
+        The names of the steps that got slower by more than the threshold.
+    """
+    if old["config"] != new["config"]:
+        print("Warning: the benchmarks were run with different configurations.")
+    print(f"old: {old['versions']}\nnew: {new['versions']}\n")
+
+    regressions = []
+    for step, new_result in new["results"].items():
+        old_result = old["results"].get(step)
+        if old_result is None:
+            print(f"{step:<24} new step")
+            continue
+        ratio = new_result["min_seconds"] / old_result["min_seconds"]
+        print(
+            f"{step:<24} {old_result['min_seconds']:8.3f}s -> "
+            f"{new_result['min_seconds']:8.3f}s ({ratio - 1:+.0%}), "
+            f"{format_memory(old_result['added_memory_bytes'])} -> "
+            f"{format_memory(new_result['added_memory_bytes'])}"
+        )
+        if ratio > 1 + threshold:
+            regressions.append(step)
+    return regressions
+
+
+def main() -> None:
+    """Compares the results and exits with an error if there are regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    regressions = compare(
+        json.loads(args.old.read_text()),
+        json.loads(args.new.read_text()),
+        args.threshold,
+    )
+    if regressions:
+        sys.exit(
+            f"\nSlower by more than {args.threshold:.0%}: {', '.join(regressions)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,238 @@
 """External-facing functions of Seedcase Sprout."""
 # This exposes only the functions we want exposed when
 # the package is imported via `from seedcase_sprout import *`.
+#
+# The functions and classes are imported from their modules when they are
+# first used, through `__getattr__()`, so importing the package doesn't import
+# Polars, check-datapackage, and the other dependencies until they're needed.
 
+import sys
+from importlib import import_module
 from pprint import pprint
 from textwrap import dedent
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-from .check_data import check_data
-from .check_properties import DataResourceError
-from .create_properties_script import create_properties_script
-from .create_resource_properties_script import create_resource_properties_script
-from .examples import (
-    ExamplePackage,
-    example_data,
-    example_data_all_types,
-    example_package_properties,
-    example_resource_properties,
-    example_resource_properties_all_types,
-)
-from .extract_field_properties import extract_field_properties
-from .join_resource_batches import join_resource_batches
-from .paths import PackagePath
-from .properties import (
-    ConstraintsProperties,
-    ContributorProperties,
-    FieldProperties,
-    FieldsMatchType,
-    FieldType,
-    LicenseProperties,
-    ReferenceProperties,
-    ResourceProperties,
-    SourceProperties,
-    SproutProperties,
-    TableSchemaForeignKeyProperties,
-    TableSchemaProperties,
-)
-from .read_properties import read_properties
-from .read_resource_batches import read_resource_batches
-from .read_resource_data import read_resource_data
-from .write_file import write_file
-from .write_properties import write_properties
-from .write_resource_data import write_resource_data
+if TYPE_CHECKING:
+    from .check_data import DataChecker, check_data
+    from .check_foreign_keys import (
+        ForeignKeyCacheInfo,
+        check_foreign_keys,
+        check_foreign_keys_cache_info,
+    )
+    from .check_keys import check_keys
+    from .check_properties import (
+        DataResourceError,
+        PropertiesCacheInfo,
+        check_resource_properties_cache_info,
+    )
+    from .compact_resource_batches import compact_resource_batches
+    from .create_properties_script import create_properties_script
+    from .create_resource_properties_script import create_resource_properties_script
+    from .data_cache import (
+        DataCacheInfo,
+        data_cache_info,
+        disable_data_cache,
+        enable_data_cache,
+    )
+    from .examples import (
+        ExamplePackage,
+        example_data,
+        example_data_all_types,
+        example_package_properties,
+        example_resource_properties,
+        example_resource_properties_all_types,
+    )
+    from .extract_field_properties import extract_field_properties
+    from .generate_data import generate_data, generate_resource_batches
+    from .join_resource_batches import join_resource_batches
+    from .parquet_write_profile import ParquetWriteProfile
+    from .paths import PackagePath
+    from .pipeline_spans import (
+        PipelineSpan,
+        add_pipeline_span_callback,
+        record_pipeline_spans,
+        remove_pipeline_span_callback,
+    )
+    from .properties import (
+        ConstraintsProperties,
+        ContributorProperties,
+        FieldProperties,
+        FieldsMatchType,
+        FieldType,
+        LicenseProperties,
+        ReferenceProperties,
+        ResourceProperties,
+        SourceProperties,
+        SproutProperties,
+        TableSchemaForeignKeyProperties,
+        TableSchemaProperties,
+    )
+    from .read_properties import read_properties
+    from .read_resource_batches import read_resource_batches
+    from .read_resource_data import read_resource_data
+    from .rebuild_resource_data import rebuild_resource_data
+    from .scan_resource_batches import scan_resource_batches
+    from .scan_resource_data import scan_resource_data
+    from .update_resource_data import update_resource_data
+    from .write_file import write_file
+    from .write_properties import write_properties
+    from .write_resource_data import write_resource_data
+
+# The module that each of the lazily imported names is imported from.
+_LAZY_EXPORTS = {
+    "ConstraintsProperties": "properties",
+    "ContributorProperties": "properties",
+    "DataCacheInfo": "data_cache",
+    "DataChecker": "check_data",
+    "DataResourceError": "check_properties",
+    "ExamplePackage": "examples",
+    "FieldProperties": "properties",
+    "FieldType": "properties",
+    "FieldsMatchType": "properties",
+    "ForeignKeyCacheInfo": "check_foreign_keys",
+    "LicenseProperties": "properties",
+    "PackagePath": "paths",
+    "ParquetWriteProfile": "parquet_write_profile",
+    "PipelineSpan": "pipeline_spans",
+    "PropertiesCacheInfo": "check_properties",
+    "ReferenceProperties": "properties",
+    "ResourceProperties": "properties",
+    "SourceProperties": "properties",
+    "SproutProperties": "properties",
+    "TableSchemaForeignKeyProperties": "properties",
+    "TableSchemaProperties": "properties",
+    "add_pipeline_span_callback": "pipeline_spans",
+    "check_data": "check_data",
+    "check_foreign_keys": "check_foreign_keys",
+    "check_foreign_keys_cache_info": "check_foreign_keys",
+    "check_keys": "check_keys",
+    "check_resource_properties_cache_info": "check_properties",
+    "compact_resource_batches": "compact_resource_batches",
+    "create_properties_script": "create_properties_script",
+    "create_resource_properties_script": "create_resource_properties_script",
+    "data_cache_info": "data_cache",
+    "disable_data_cache": "data_cache",
+    "enable_data_cache": "data_cache",
+    "example_data": "examples",
+    "example_data_all_types": "examples",
+    "example_package_properties": "examples",
+    "example_resource_properties": "examples",
+    "example_resource_properties_all_types": "examples",
+    "extract_field_properties": "extract_field_properties",
+    "generate_data": "generate_data",
+    "generate_resource_batches": "generate_data",
+    "join_resource_batches": "join_resource_batches",
+    "read_properties": "read_properties",
+    "read_resource_batches": "read_resource_batches",
+    "read_resource_data": "read_resource_data",
+    "rebuild_resource_data": "rebuild_resource_data",
+    "record_pipeline_spans": "pipeline_spans",
+    "remove_pipeline_span_callback": "pipeline_spans",
+    "scan_resource_batches": "scan_resource_batches",
+    "scan_resource_data": "scan_resource_data",
+    "update_resource_data": "update_resource_data",
+    "write_file": "write_file",
+    "write_properties": "write_properties",
+    "write_resource_data": "write_resource_data",
+}
 
 __all__ = [
     "ConstraintsProperties",
     "ContributorProperties",
+    "DataCacheInfo",
+    "DataChecker",
     "DataResourceError",
     "ExamplePackage",
     "FieldProperties",
     "FieldType",
     "FieldsMatchType",
+    "ForeignKeyCacheInfo",
     "LicenseProperties",
     "PackagePath",
+    "ParquetWriteProfile",
+    "PipelineSpan",
+    "PropertiesCacheInfo",
     "ReferenceProperties",
     "ResourceProperties",
     "SourceProperties",
     "SproutProperties",
     "TableSchemaForeignKeyProperties",
     "TableSchemaProperties",
+    "add_pipeline_span_callback",
     "check_data",
+    "check_foreign_keys",
+    "check_foreign_keys_cache_info",
+    "check_keys",
+    "check_resource_properties_cache_info",
+    "compact_resource_batches",
     "create_properties_script",
     "create_resource_properties_script",
+    "data_cache_info",
     "dedent",
+    "disable_data_cache",
+    "enable_data_cache",
     "example_data",
     "example_data_all_types",
     "example_package_properties",
     "example_resource_properties",
     "example_resource_properties_all_types",
     "extract_field_properties",
+    "generate_data",
+    "generate_resource_batches",
     "join_resource_batches",
     "pprint",
     "read_properties",
     "read_resource_batches",
     "read_resource_data",
+    "rebuild_resource_data",
+    "record_pipeline_spans",
+    "remove_pipeline_span_callback",
+    "scan_resource_batches",
+    "scan_resource_data",
+    "update_resource_data",
     "write_file",
     "write_properties",
     "write_resource_data",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a function or class from its module when it is first used."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Lists the names in the package, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(ModuleType):
+    """The package, keeping the functions named after the module they're in.
+
+    Importing a module, e.g., `seedcase_sprout.check_data`, sets it as an
+    attribute of the package. For modules named after the function they
+    export, the function is set instead, so `check_data` stays the function.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute, using the exported function instead of a module."""
+        if name in _LAZY_EXPORTS and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+# Python's import system sets each imported submodule as an attribute of the
+# package, e.g., `import seedcase_sprout.check_data` sets `check_data` to the
+# module. Before the exports were lazy, the `from .check_data import
+# check_data` above set it back to the function. Now the submodule is often
+# imported later, e.g., by another module of the package, which would replace
+# the function with the module, and `__getattr__()` isn't called for names that
+# are already set. A module-level `__setattr__()` isn't used by Python, so the
+# package's class is changed to one that overrides it.
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,208 @@
+"""An index of the batch files in a resource's `batch/` folder.
+
+The index lists each batch file together with the timestamp in its file name,
+sorted by timestamp. The timestamps of all batch files are extracted and
+checked in one pass over all file names, rather than one file at a time.
+
+Since listing a folder with many batch files takes time, the index of each
+`batch/` folder is cached. Adding, removing, or renaming a file in a folder
+changes the folder's modification time, which is used to know when the cached
+index is no longer up to date. Since file systems only update the modification
+time every few milliseconds, the index of a folder that was modified very
+recently isn't cached, as the folder could still change without its
+modification time changing.
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from time import time_ns
+from typing import NamedTuple
+from uuid import uuid4
+
+import polars as pl
+
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_DATA_TYPE,
+    BATCH_TIMESTAMP_FORMAT,
+    BATCH_TIMESTAMP_PATTERN,
+)
+
+# The maximum number of incorrect batch file names to list in an error message.
+_MAX_INCORRECT_NAMES = 5
+
+# How long after a folder has been modified before its index is cached.
+_RECENTLY_MODIFIED_NS = 1_000_000_000
+
+
+class _IndexEntry(NamedTuple):
+    """A cached index and the version of the folder it was created from.
+
+    Attributes:
+        mtime_ns: The modification time of the `batch/` folder.
+        index: The index of the batch files in the folder.
+    """
+
+    mtime_ns: int
+    index: pl.DataFrame
+
+
+class _BatchIndexCache:
+    """A cache of batch file indexes, keyed by the resolved `batch/` folder."""
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self.entries: dict[Path, _IndexEntry] = {}
+        self.lock = Lock()
+
+    def get(self, batch_path: Path) -> pl.DataFrame:
+        """Get the index of the folder, creating it if the folder has changed."""
+        if not batch_path.is_dir():
+            return _create_batch_index([])
+
+        key = batch_path.resolve()
+        mtime_ns = batch_path.stat().st_mtime_ns
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry.index
+
+        index = _create_batch_index(list(batch_path.glob("*.parquet")))
+        if time_ns() - mtime_ns > _RECENTLY_MODIFIED_NS:
+            with self.lock:
+                self.entries[key] = _IndexEntry(mtime_ns, index)
+        return index
+
+    def clear(self) -> None:
+        """Remove all cached indexes."""
+        with self.lock:
+            self.entries.clear()
+
+
+_batch_index_cache = _BatchIndexCache()
+
+
+def _get_batch_index(
+    batch_path: Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> pl.DataFrame:
+    """Gets the index of the batch files in a folder, within a time range.
+
+    Args:
+        batch_path: The path to the `batch/` folder.
+        start: Only include batch files with this timestamp or later. Times
+            without a time zone are taken to be in UTC.
+        end: Only include batch files with this timestamp or earlier. Times
+            without a time zone are taken to be in UTC.
+
+    Returns:
+        The index, with a `path` and a `timestamp` column, sorted by timestamp.
+
+    Raises:
+        ValueError: If any of the batch file names don't contain a correct
+            timestamp.
+    """
+    index = _batch_index_cache.get(batch_path)
+    if start is not None:
+        index = index.filter(pl.col("timestamp") >= _as_utc(start))
+    if end is not None:
+        index = index.filter(pl.col("timestamp") <= _as_utc(end))
+    return index
+
+
+def _create_batch_index(paths: list[Path]) -> pl.DataFrame:
+    """Creates the index of the batch files, sorted by timestamp.
+
+    Batch files with the same timestamp are sorted by their path.
+
+    Args:
+        paths: The paths to the batch files.
+
+    Returns:
+        The index, with a `path` and a `timestamp` column.
+
+    Raises:
+        ValueError: If any of the batch file names don't contain a correct
+            timestamp.
+    """
+    return pl.DataFrame(
+        {
+            "path": pl.Series([str(path) for path in paths], dtype=pl.String),
+            "timestamp": _parse_timestamps(_extract_batch_file_timestamps(paths)),
+        }
+    ).sort("timestamp", "path")
+
+
+def _extract_batch_file_timestamps(paths: list[Path]) -> pl.Series:
+    """Extracts and checks the timestamps in the names of all batch files.
+
+    If multiple timestamps are found in a file name, the first one is used.
+
+    Args:
+        paths: The paths to the batch files.
+
+    Returns:
+        The timestamps, as strings in the format of BATCH_TIMESTAMP_FORMAT, in
+            the same order as `paths`.
+
+    Raises:
+        ValueError: If any of the batch file names don't contain a timestamp
+            in the expected format, or the timestamp is not a correct calendar
+            date (e.g., 30 February).
+    """
+    names = pl.Series("name", [path.stem for path in paths], dtype=pl.String)
+    timestamps = names.str.extract(f"({BATCH_TIMESTAMP_PATTERN})")
+    incorrect_names = names.filter(_parse_timestamps(timestamps).is_null())
+    if not incorrect_names.is_empty():
+        raise ValueError(
+            f"{incorrect_names.len()} batch file name(s) don't contain a timestamp "
+            f"in the expected format '{BATCH_TIMESTAMP_FORMAT}' or the timestamp is "
+            "not a correct calendar date (e.g., 30 February). For example: "
+            f"{incorrect_names.head(_MAX_INCORRECT_NAMES).to_list()}"
+        )
+    return timestamps
+
+
+def _parse_timestamps(timestamps: pl.Series) -> pl.Series:
+    """Parses the batch file timestamps, with null for incorrect timestamps."""
+    return timestamps.str.strptime(
+        BATCH_TIMESTAMP_DATA_TYPE, BATCH_TIMESTAMP_FORMAT, strict=False
+    )
+
+
+def _create_batch_timestamp_column(timestamp: str) -> pl.Expr:
+    """Creates the timestamp column to add to the data from a batch file.
+
+    Args:
+        timestamp: The timestamp from the batch file name, in the format of
+            BATCH_TIMESTAMP_FORMAT.
+
+    Returns:
+        A literal column with the timestamp as a Datetime in UTC.
+    """
+    return pl.lit(
+        datetime.strptime(timestamp, BATCH_TIMESTAMP_FORMAT).replace(tzinfo=UTC),
+        dtype=BATCH_TIMESTAMP_DATA_TYPE,
+    ).alias(BATCH_TIMESTAMP_COLUMN_NAME)
+
+
+def _create_batch_file_name(timestamp: str) -> str:
+    """Creates a batch file name that starts with the timestamp.
+
+    Args:
+        timestamp: The timestamp, in the format of BATCH_TIMESTAMP_FORMAT.
+
+    Returns:
+        The file name, with a random ID after the timestamp so that batch
+            files with the same timestamp have different names.
+    """
+    return f"{timestamp}-{uuid4()}.parquet"
+
+
+def _as_utc(time: datetime) -> datetime:
+    """Converts the time to UTC, taking times without a time zone to be UTC."""
+    if time.tzinfo is None:
+        return time.replace(tzinfo=UTC)
+    return time.astimezone(UTC)
@@ -0,0 +1,88 @@
+"""Functions to keep track of the batch files merged into a resource's data.
+
+The manifest is a JSON file stored in the resource's folder that lists the
+batch files that have been merged into the resource's `data.parquet` file. It
+is used to find the batch files that have arrived since the data file was last
+built, so that only those need to be read.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from seedcase_soil import fmap, pairwise_fmap
+
+from seedcase_sprout.batch_index import _extract_batch_file_timestamps
+
+
+@dataclass(frozen=True)
+class _BatchFileEntry:
+    """A batch file that has been merged into the resource's data file.
+
+    Attributes:
+        name: The file name of the batch file.
+        timestamp: The timestamp from the batch file name.
+        size: The size of the batch file in bytes.
+        mtime_ns: The last modification time of the batch file in nanoseconds.
+    """
+
+    name: str
+    timestamp: str
+    size: int
+    mtime_ns: int
+
+
+def _create_batch_file_entry(path: Path, timestamp: str) -> _BatchFileEntry:
+    """Creates a manifest entry from the batch file's name and file stats.
+
+    Args:
+        path: The path to the batch file.
+        timestamp: The timestamp from the batch file name.
+
+    Returns:
+        The manifest entry for the batch file.
+    """
+    stat = path.stat()
+    return _BatchFileEntry(
+        name=path.name,
+        timestamp=timestamp,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+    )
+
+
+def _create_batch_manifest(paths: list[Path]) -> list[_BatchFileEntry]:
+    """Creates the manifest entries for all the given batch files."""
+    timestamps = _extract_batch_file_timestamps(paths).to_list()
+    return pairwise_fmap(paths, timestamps, _create_batch_file_entry)
+
+
+def _read_batch_manifest(path: Path) -> list[_BatchFileEntry] | None:
+    """Reads the manifest of merged batch files.
+
+    Args:
+        path: The path to the manifest file.
+
+    Returns:
+        The manifest entries, or None if there is no manifest.
+    """
+    if not path.is_file():
+        return None
+
+    manifest = json.loads(path.read_text())
+    return fmap(manifest["batch_files"], lambda entry: _BatchFileEntry(**entry))
+
+
+def _write_batch_manifest(entries: list[_BatchFileEntry], path: Path) -> Path:
+    """Writes the manifest of merged batch files.
+
+    Args:
+        entries: The manifest entries for all the merged batch files.
+        path: The path to the manifest file.
+
+    Returns:
+        The path to the manifest file.
+    """
+    manifest = {"batch_files": fmap(entries, asdict)}
+    path.write_text(json.dumps(manifest, indent=2))
+    return path
@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Any, NamedTuple, cast
 
 import polars as pl
 from seedcase_soil import fmap
@@ -11,15 +11,18 @@ from seedcase_sprout.map_data_types import (
     _get_allowed_polars_types,
     _polars_and_datapackage_types_match,
 )
+from seedcase_sprout.pipeline_spans import _span
 from seedcase_sprout.properties import (
+    ConstraintsProperties,
     FieldProperties,
+    FieldType,
     ResourceProperties,
 )
 
 
-def check_data(
-    data: pl.DataFrame, resource_properties: ResourceProperties
-) -> pl.DataFrame:
+def check_data[Frame: (pl.DataFrame, pl.LazyFrame)](
+    data: Frame, resource_properties: ResourceProperties
+) -> Frame:
     """Checks that the DataFrame matches the requirements in the properties.
 
     Run a few checks to compare between the data and the properties on the
@@ -28,7 +31,17 @@ def check_data(
     - Column names: `field.name`
     - Column types: `field.types`
     - Column values' types: `field.types`
-    - Column values' constraints: `field.constraints`
+    - Column values' constraints: `field.constraints` and `field.categories`
+
+    All constraints of all columns are checked together in a single pass over
+    the data. The `json_schema` constraint is not checked, nor are the
+    `min_length` and `max_length` constraints of `array` and `object` fields
+    stored as JSON text, since these count the items and not the characters.
+
+    The `data` can also be a Polars LazyFrame, e.g., from `pl.scan_parquet()`,
+    to check data that is larger than the available memory. The column names
+    and types are then checked from the schema of the LazyFrame, before any
+    data is read, and the constraints are checked on the streaming engine.
 
     The error messages are generally in the format of:
 
@@ -41,8 +54,11 @@ def check_data(
     - In the data: {mismatch}
     ```
 
+    To check many DataFrames against the same properties, use `DataChecker`
+    instead, so the properties are only prepared once.
+
     Args:
-        data: A Polars DataFrame.
+        data: A Polars DataFrame or LazyFrame.
         resource_properties: The specific `ResourceProperties` for the `data`.
 
     Returns:
@@ -52,6 +68,10 @@ def check_data(
         ExceptionGroup[CheckError]: If the resource properties are incorrect.
         ValueError: If column names in the data are incorrect.
         ExceptionGroup[ValueError]: If data types in the data are incorrect.
+        ExceptionGroup[ValueError]: If values in the data don't meet the
+            constraints. Each error includes the number of values that don't
+            meet the constraint and the first few row indices with those
+            values.
 
     Examples:
         ```{python}
@@ -63,115 +83,480 @@ def check_data(
         )
         ```
     """
-    check_resource_properties(resource_properties)
-    _check_column_names(data, resource_properties)
-    _check_column_types(data, resource_properties)
-    # _check_column_values_constraints(data, resource_properties)
+    return DataChecker(resource_properties).check(data)
 
-    return data
 
+class DataChecker:
+    """Check data against the properties of a resource, with the setup done once.
 
-def _check_column_names(
-    data: pl.DataFrame, resource_properties: ResourceProperties
-) -> pl.DataFrame:
-    """Checks that column names in `data` match those in the properties.
+    Use this class instead of `check_data()` when checking many DataFrames
+    against the same `resource_properties`, for example, one DataFrame per
+    batch file. The `resource_properties` are checked and prepared for checking
+    data once when creating the checker. After that, checking the schema of
+    each DataFrame only takes time in proportion to the number of columns.
 
-    Columns may appear in any order.
+    The checker runs the same checks as `check_data()`. Changes to the
+    `resource_properties` after creating the checker are not picked up, so
+    create a new checker if the properties change.
 
     Args:
-        data: The data to check.
-        resource_properties: The resource properties to check against.
-
-    Returns:
-        The data if the column names match.
+        resource_properties: The specific `ResourceProperties` to check data
+            against.
 
     Raises:
-        ValueError: If the column names don't match the names in
-            `resource_properties`.
+        ExceptionGroup[CheckError]: If the resource properties are incorrect.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        checker = sp.DataChecker(sp.example_resource_properties())
+        checker.check(sp.example_data())
+        ```
     """
-    columns_in_data = data.schema.names()
-    columns_in_resource = [
-        str(field.name)
-        for field in cast(
+
+    def __init__(self, resource_properties: ResourceProperties):
+        """Check the properties and prepare them for checking data."""
+        check_resource_properties(resource_properties)
+        fields = cast(
             list[FieldProperties],
             _get_nested_attr(resource_properties, "schema.fields", default=[]),
         )
-    ]
-    extra_columns_in_data = [
-        name for name in columns_in_data if name not in columns_in_resource
-    ]
-    missing_columns_in_data = [
-        name for name in columns_in_resource if name not in columns_in_data
-    ]
+        self._field_names = [str(field.name) for field in fields]
+        self._field_name_set = frozenset(self._field_names)
+        self._fields_by_name = {str(field.name): field for field in fields}
+        allowed_polars_types = {
+            field.type: frozenset(_get_allowed_polars_types(field.type))
+            for field in fields
+        }
+        self._allowed_polars_types_by_name = {
+            str(field.name): allowed_polars_types[field.type] for field in fields
+        }
+        self._constrained_fields = [
+            field
+            for field in fields
+            if field.constraints is not None or field.categories is not None
+        ]
+
+    def check[Frame: (pl.DataFrame, pl.LazyFrame)](self, data: Frame) -> Frame:
+        """Checks that the DataFrame matches the requirements in the properties.
+
+        See `check_data()` for how a LazyFrame is checked.
+
+        Args:
+            data: A Polars DataFrame or LazyFrame.
+
+        Returns:
+            The `data` if all checks pass.
+
+        Raises:
+            ValueError: If column names in the data are incorrect.
+            ExceptionGroup[ValueError]: If data types in the data are incorrect.
+            ExceptionGroup[ValueError]: If values in the data don't meet the
+                constraints.
+        """
+        with _span("check_data") as span:
+            self.check_schema(data.collect_schema())
+            with _span("check_data.constraints"):
+                self._check_column_values_constraints(data)
+            return span.add_rows(data)
+
+    def check_schema(self, schema: pl.Schema) -> pl.Schema:
+        """Checks that the column names and types match the properties.
+
+        Only the schema of the data is needed for these checks, so they can be
+        run on, e.g., the schema in the footer of a Parquet file without reading
+        any of the data.
+
+        Args:
+            schema: The Polars schema of the data.
+
+        Returns:
+            The `schema` if all checks pass.
+
+        Raises:
+            ValueError: If column names in the schema are incorrect.
+            ExceptionGroup[ValueError]: If data types in the schema are
+                incorrect.
+        """
+        self._check_column_names(schema)
+        self._check_column_types(schema)
+        return schema
+
+    def _check_column_names(self, schema: pl.Schema) -> pl.Schema:
+        """Checks that column names in `schema` match those in the properties.
+
+        Columns may appear in any order.
+
+        Args:
+            schema: The schema to check.
+
+        Returns:
+            The schema if the column names match.
+
+        Raises:
+            ValueError: If the column names don't match the names in the
+                properties.
+        """
+        columns_in_data = schema.names()
+        column_set_in_data = set(columns_in_data)
+        extra_columns_in_data = [
+            name for name in columns_in_data if name not in self._field_name_set
+        ]
+        missing_columns_in_data = [
+            name for name in self._field_names if name not in column_set_in_data
+        ]
+
+        if extra_columns_in_data or missing_columns_in_data:
+            raise ValueError(
+                _format_column_name_error_message(
+                    extra_columns_in_data, missing_columns_in_data
+                )
+            )
 
-    if extra_columns_in_data or missing_columns_in_data:
-        raise ValueError(
-            _format_column_name_error_message(
-                extra_columns_in_data, missing_columns_in_data
+        return schema
+
+    def _check_column_types(self, schema: pl.Schema) -> pl.Schema:
+        """Checks that column data types match the data types in the properties.
+
+        The resource properties specify a Frictionless data type for each
+        column. This checks if the Polars data type of each column in the data
+        matches the expected Frictionless data type.
+
+        Column names are expected to match the names specified in the resource
+        properties.
+
+        Args:
+            schema: The schema to check.
+
+        Returns:
+            The schema, if all column types are correct.
+
+        Raises:
+            ExceptionGroup: A group of `ValueError`s, one per incorrectly typed
+                column.
+        """
+        errors = [
+            _get_column_type_error(schema[name], field)
+            for name, field in self._fields_by_name.items()
+            if not self._column_type_matches(name, schema[name])
+        ]
+
+        if errors:
+            raise ExceptionGroup(
+                (
+                    "The following columns in the data have data types that do not "
+                    "match the data types in the resource properties:"
+                ),
+                errors,
+            )
+        return schema
+
+    def _column_type_matches(self, name: str, polars_type: pl.DataType) -> bool:
+        """Decides if the Polars type matches the Data Package type of the field.
+
+        Args:
+            name: The name of the field.
+            polars_type: The Polars type of the column.
+
+        Returns:
+            Whether the types match.
+        """
+        field_type = self._fields_by_name[name].type or "any"
+        if field_type == "any":
+            return True
+        if field_type == "geopoint":
+            return _polars_and_datapackage_types_match(polars_type, field_type)
+        return polars_type.base_type() in self._allowed_polars_types_by_name[name]
+
+    def _check_column_values_constraints[Frame: (pl.DataFrame, pl.LazyFrame)](
+        self, data: Frame
+    ) -> Frame:
+        """Checks that the values in the data meet the constraints of the fields.
+
+        Each constraint is turned into a Polars expression that marks the values
+        that don't meet it. The number of these values and the first few row
+        indices are then calculated for all constraints in one `select()`, so
+        the data is only scanned once. A LazyFrame is collected on the
+        streaming engine, so only the results are kept in memory.
+
+        Args:
+            data: The data to check. The column names and types are expected to
+                match the properties.
+
+        Returns:
+            The data, if all values meet the constraints.
+
+        Raises:
+            ExceptionGroup: A group of `ValueError`s, one per constraint that
+                isn't met.
+        """
+        schema = data.collect_schema()
+        checks = [
+            check
+            for field in self._constrained_fields
+            for check in _get_constraint_checks(field, schema[str(field.name)])
+        ]
+        if not checks:
+            return data
+
+        results = data.lazy().select(
+            expression
+            for index, check in enumerate(checks)
+            for expression in (
+                check.violations.sum().alias(f"count_{index}"),
+                check.violations.arg_true()
+                .head(_MAX_VIOLATING_ROWS)
+                .implode()
+                .alias(f"rows_{index}"),
             )
         )
+        results = results.collect(engine="streaming").row(0, named=True)
 
-    return data
+        errors = [
+            _get_constraint_error(
+                check, results[f"count_{index}"], results[f"rows_{index}"]
+            )
+            for index, check in enumerate(checks)
+            if results[f"count_{index}"]
+        ]
+        if errors:
+            raise ExceptionGroup(
+                (
+                    "The following columns in the data have values that do not meet "
+                    "the constraints in the resource properties:"
+                ),
+                errors,
+            )
+        return data
 
 
-def _format_column_name_error_message(
-    extra_columns_in_data: list[str], missing_columns_in_data: list[str]
-) -> str:
-    message = (
-        "Column names in the data do not match column names in the resource properties:"
-    )
-    if extra_columns_in_data:
-        message += f"\n- Unexpected column(s) in data: {extra_columns_in_data}"
-    if missing_columns_in_data:
-        message += f"\n- Missing column(s) in data: {missing_columns_in_data}"
-    return message
+# The number of row indices to show in the error message for each constraint.
+_MAX_VIOLATING_ROWS = 5
 
 
-def _check_column_types(
-    data: pl.DataFrame, resource_properties: ResourceProperties
-) -> pl.DataFrame:
-    """Checks that column data types match the data types in the properties.
+class _ConstraintCheck(NamedTuple):
+    """A check of a constraint on the values of a column.
 
-    The resource properties specify a Frictionless data type for each column.
-    This function checks if the Polars data type of each column in the data
-    matches the expected Frictionless data type.
+    Attributes:
+        name: The name of the column.
+        constraint: The name of the constraint.
+        value: The value of the constraint in the properties.
+        violations: An expression that is `True` for the values that don't meet
+            the constraint.
+    """
 
-    Column names are expected to match the names specified in the resource
-    properties.
+    name: str
+    constraint: str
+    value: Any
+    violations: pl.Expr
+
+
+def _get_constraint_checks(
+    field: FieldProperties, polars_type: pl.DataType
+) -> list[_ConstraintCheck]:
+    """Turns the constraints and categories of a field into Polars expressions.
+
+    Constraints that don't apply to the Polars type of the column, like
+    `pattern` on a numeric column, are not checked. Neither are `min_length`
+    and `max_length` on `array` and `object` fields in String columns, since
+    the length of the JSON text isn't the number of items.
 
     Args:
-        data: The data frame to check.
-        resource_properties: The resource properties to check against.
+        field: The field properties with the constraints.
+        polars_type: The Polars type of the column.
 
     Returns:
-        The data frame, if all column types are correct.
-
-    Raises:
-        ExceptionGroup: A group of `ValueError`s, one per incorrectly typed
-            column.
+        The checks for each of the constraints of the field.
     """
-    fields = cast(
-        list[FieldProperties],
-        _get_nested_attr(resource_properties, "schema.fields", default=[]),
-    )
-    polars_schema = data.schema
-    errors = [
-        _get_column_type_error(polars_schema[str(field.name)], field)
-        for field in fields
-        if not _polars_and_datapackage_types_match(
-            polars_schema[str(field.name)], field.type
+    name = str(field.name)
+    column = pl.col(name)
+    if isinstance(polars_type, (pl.Categorical, pl.Enum)):
+        column = column.cast(pl.String)
+        polars_type = pl.String()
+    constraints = field.constraints or ConstraintsProperties()
+    is_string = polars_type == pl.String
+    is_ordered = polars_type.is_numeric() or polars_type.is_temporal()
+    is_json_text = is_string and field.type in ("array", "object")
+    has_length = (is_string and not is_json_text) or isinstance(polars_type, pl.List)
+
+    def bound(value: Any) -> pl.Expr:
+        return _as_polars_value(pl.lit(value), polars_type, field.type)
+
+    def is_not_in(values: list[Any]) -> pl.Expr:
+        return ~column.is_in(
+            _as_polars_value(
+                pl.lit(pl.Series(values)), polars_type, field.type
+            ).implode()
         )
+
+    def length() -> pl.Expr:
+        return column.str.len_chars() if is_string else column.list.len()
+
+    candidates: list[tuple[str, Any, bool, Any]] = [
+        ("required", constraints.required, True, lambda _: column.is_null()),
+        (
+            "unique",
+            constraints.unique,
+            True,
+            lambda _: column.is_duplicated() & column.is_not_null(),
+        ),
+        (
+            "pattern",
+            constraints.pattern,
+            is_string,
+            lambda value: ~column.str.contains(f"^(?:{value})$"),
+        ),
+        (
+            "enum",
+            constraints.enum,
+            True,
+            is_not_in,
+        ),
+        (
+            "min_length",
+            constraints.min_length,
+            has_length,
+            lambda value: length() < value,
+        ),
+        (
+            "max_length",
+            constraints.max_length,
+            has_length,
+            lambda value: length() > value,
+        ),
+        ("minimum", constraints.minimum, is_ordered, lambda v: column < bound(v)),
+        ("maximum", constraints.maximum, is_ordered, lambda v: column > bound(v)),
+        (
+            "exclusive_minimum",
+            constraints.exclusive_minimum,
+            is_ordered,
+            lambda v: column <= bound(v),
+        ),
+        (
+            "exclusive_maximum",
+            constraints.exclusive_maximum,
+            is_ordered,
+            lambda v: column >= bound(v),
+        ),
+        (
+            "categories",
+            field.categories,
+            True,
+            is_not_in,
+        ),
     ]
 
-    if errors:
-        raise ExceptionGroup(
-            (
-                "The following columns in the data have data types that do not match "
-                "the data types in the resource properties:"
-            ),
-            errors,
+    return [
+        _ConstraintCheck(
+            name=name,
+            constraint=constraint,
+            value=value,
+            violations=get_violations(value).fill_null(False),
         )
-    return data
+        for constraint, value, applies, get_violations in candidates
+        if value is not None and value is not False and applies
+    ]
+
+
+def _as_polars_value(
+    value: pl.Expr, polars_type: pl.DataType, field_type: FieldType | None
+) -> pl.Expr:
+    """Converts a constraint value from the properties to the type of the column.
+
+    Dates, times, and datetimes are given as strings in the properties, so these
+    are parsed with the format of their Data Package type instead of cast. A
+    datetime with a time zone, e.g., `"2025-01-01T00:00:00Z"`, is converted to
+    the time zone of the column, while a datetime without a time zone is taken
+    to be in UTC, as are the values of a column without a time zone.
+
+    Args:
+        value: The constraint value as a Polars literal.
+        polars_type: The Polars type of the column.
+        field_type: The Data Package type of the field, e.g., to tell a
+            `yearmonth` from a `date` in a Date column.
+
+    Returns:
+        An expression with the constraint value as the type of the column.
+    """
+    if isinstance(polars_type, pl.Datetime):
+        return _parse_datetime(value.cast(pl.String), polars_type)
+    if polars_type == pl.Date:
+        date_format = _YEARMONTH_FORMAT if field_type == "yearmonth" else _DATE_FORMAT
+        return value.cast(pl.String).str.strptime(polars_type, date_format)
+    if polars_type == pl.Time:
+        return value.cast(pl.String).str.strptime(polars_type, _TIME_FORMAT)
+    return value.cast(polars_type)
+
+
+# The formats of dates and times in the properties.
+_DATE_FORMAT = "%Y-%m-%d"
+_YEARMONTH_FORMAT = "%Y-%m"
+_TIME_FORMAT = "%H:%M:%S%.f"
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%.f%z"
+
+
+def _parse_datetime(value: pl.Expr, polars_type: pl.Datetime) -> pl.Expr:
+    """Parses datetime strings into the time unit and time zone of the column.
+
+    Args:
+        value: The datetime strings, with or without a time zone.
+        polars_type: The Datetime type of the column.
+
+    Returns:
+        An expression with the datetimes in the time zone of the column.
+    """
+    value = value.str.replace(r"Z$", "+00:00")
+    value = (
+        pl.when(value.str.contains(r"[+-]\d{2}:?\d{2}$"))
+        .then(value)
+        .otherwise(value + "+00:00")
+    )
+    parsed = value.str.strptime(
+        pl.Datetime(polars_type.time_unit, "UTC"), _DATETIME_FORMAT
+    )
+    if polars_type.time_zone is None:
+        return parsed.dt.replace_time_zone(None)
+    return parsed.dt.convert_time_zone(polars_type.time_zone)
+
+
+def _get_constraint_error(
+    check: _ConstraintCheck, count: int, rows: list[int]
+) -> ValueError:
+    """Creates an error when values in a column don't meet a constraint.
+
+    Args:
+        check: The check of the constraint.
+        count: The number of values that don't meet the constraint.
+        rows: The first few row indices of the values that don't meet the
+            constraint.
+
+    Returns:
+        A `ValueError`.
+    """
+    constraint = (
+        check.constraint
+        if check.value is True
+        else f"{check.constraint}={check.value!r}"
+    )
+    first_rows = "at row(s)" if count <= len(rows) else "for example at row(s)"
+    return ValueError(
+        f"Expected values of column '{check.name}' to meet the constraint "
+        f"`{constraint}` but found {count} value(s) that don't, {first_rows} {rows}."
+    )
+
+
+def _format_column_name_error_message(
+    extra_columns_in_data: list[str], missing_columns_in_data: list[str]
+) -> str:
+    message = (
+        "Column names in the data do not match column names in the resource properties:"
+    )
+    if extra_columns_in_data:
+        message += f"\n- Unexpected column(s) in data: {extra_columns_in_data}"
+    if missing_columns_in_data:
+        message += f"\n- Missing column(s) in data: {missing_columns_in_data}"
+    return message
 
 
 def _get_column_type_error(
@@ -0,0 +1,265 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple, cast
+
+import polars as pl
+
+from seedcase_sprout.check_properties import check_properties
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import (
+    ResourceProperties,
+    SproutProperties,
+    TableSchemaForeignKeyProperties,
+)
+from seedcase_sprout.read_resource_data import _get_cache_path
+from seedcase_sprout.scan_resource_data import scan_resource_data
+
+# The number of orphaned keys to show in the error message for each foreign key.
+_MAX_ORPHANED_KEYS = 5
+
+
+def check_foreign_keys(
+    properties: SproutProperties, package_path: Path | None = None
+) -> SproutProperties:
+    """Checks that the foreign keys in the data refer to existing keys.
+
+    For each foreign key (`schema.foreign_keys`) of each resource in the
+    package, the values of its fields in the resource's `data.parquet` file must
+    exist in the referenced fields of the referenced resource's `data.parquet`
+    file. Rows with missing values in any of the fields of the foreign key are
+    not checked. A foreign key without a referenced resource refers to the
+    resource itself.
+
+    The data files are scanned lazily with `scan_resource_data()`, so only the
+    fields used in the foreign keys are read, and partitioned data is read
+    from all its partitions. The keys of each referenced resource are kept in a cache,
+    based on the path, size, modification time, and inode of its data file, or
+    of its folder of partitioned data. So when
+    many resources refer to the same large resource, its keys are only read
+    once, until its data file changes.
+
+    Args:
+        properties: The properties of the data package with the resources and
+            their foreign keys. Use `read_properties()` to read them from the
+            `datapackage.json` file.
+        package_path: The path to the data package root folder (where
+            `datapackage.json` is located). Defaults to the current working
+            directory.
+
+    Returns:
+        The `properties` if all foreign keys refer to existing keys.
+
+    Raises:
+        ExceptionGroup[CheckError]: If the properties are incorrect.
+        FileNotFoundError: If the data file of a resource with a foreign key, or
+            of a referenced resource, doesn't exist.
+        ExceptionGroup[ValueError]: If any foreign keys refer to keys that don't
+            exist. Each error includes the number of rows and the first few
+            orphaned keys.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            sp.check_foreign_keys(sp.read_properties())
+        ```
+    """
+    check_properties(properties)
+    package_path_object = PackagePath(package_path)
+    resources = cast(list[ResourceProperties], properties.resources or [])
+
+    results = [
+        _check_foreign_key(foreign_key, str(resource.name), package_path_object)
+        for resource in resources
+        for foreign_key in cast(
+            list[TableSchemaForeignKeyProperties],
+            _get_nested_attr(resource, "schema.foreign_keys", default=[]),
+        )
+    ]
+    errors = [error for error in results if error is not None]
+    if errors:
+        raise ExceptionGroup(
+            "The following foreign keys in the data refer to keys that don't exist:",
+            errors,
+        )
+    return properties
+
+
+class ForeignKeyCacheInfo(NamedTuple):
+    """Statistics about the cache of keys of referenced resources.
+
+    Attributes:
+        hits: The number of times the keys were taken from the cache.
+        misses: The number of times the keys had to be read from the data file.
+        max_size: The maximum number of key sets kept in the cache.
+        size: The current number of key sets in the cache.
+    """
+
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class _ReferencedKeysCache:
+    """A bounded cache of the unique keys of referenced resources.
+
+    The keys are stored by the data file path and the fields of the key. Each
+    entry also records the size, modification time, and inode of the data
+    file, so
+    keys from a data file that has since changed are read again. When the
+    cache is full, the least recently used keys are removed.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create an empty cache that keeps at most `max_size` key sets."""
+        self.max_size = max_size
+        self.keys: OrderedDict[
+            tuple[Path, tuple[str, ...]], tuple[tuple[int, int, int], pl.DataFrame]
+        ] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, resource_name: str, package_path: PackagePath, fields: list[str]
+    ) -> pl.DataFrame:
+        """Get the unique keys of the resource's data, reading them if needed."""
+        data = scan_resource_data(resource_name, package_path.root())
+        data_path = _get_cache_path(resource_name, package_path.root())
+        stat = data_path.stat()
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cache_key = (data_path.resolve(), tuple(fields))
+
+        cached = self.keys.get(cache_key)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            self.keys.move_to_end(cache_key)
+            return cached[1]
+
+        self.misses += 1
+        keys = data.select(fields).drop_nulls().unique().collect(engine="streaming")
+        self.keys[cache_key] = (version, keys)
+        self.keys.move_to_end(cache_key)
+        if len(self.keys) > self.max_size:
+            self.keys.popitem(last=False)
+        return keys
+
+    def info(self) -> ForeignKeyCacheInfo:
+        """Get the hit and miss counts and size of the cache."""
+        return ForeignKeyCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            max_size=self.max_size,
+            size=len(self.keys),
+        )
+
+    def clear(self) -> None:
+        """Remove all keys and reset the counts."""
+        self.keys.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_referenced_keys_cache = _ReferencedKeysCache(max_size=32)
+
+
+def check_foreign_keys_cache_info() -> ForeignKeyCacheInfo:
+    """Get statistics about the cache used by `check_foreign_keys()`.
+
+    Returns:
+        The number of hits and misses, and the maximum and current size of the
+            cache.
+    """
+    return _referenced_keys_cache.info()
+
+
+def clear_check_foreign_keys_cache() -> None:
+    """Remove all cached keys used by `check_foreign_keys()`."""
+    _referenced_keys_cache.clear()
+
+
+def _check_foreign_key(
+    foreign_key: TableSchemaForeignKeyProperties,
+    resource_name: str,
+    package_path: PackagePath,
+) -> ValueError | None:
+    """Checks that the values of a foreign key exist in the referenced resource.
+
+    Args:
+        foreign_key: The foreign key to check.
+        resource_name: The name of the resource with the foreign key.
+        package_path: The path to the data package.
+
+    Returns:
+        A `ValueError` if there are orphaned keys, otherwise None.
+    """
+    fields = foreign_key.fields or []
+    referenced_fields = cast(
+        list[str], _get_nested_attr(foreign_key, "reference.fields", default=[])
+    )
+    referenced_resource_name = (
+        _get_nested_attr(foreign_key, "reference.resource") or resource_name
+    )
+
+    data = scan_resource_data(resource_name, package_path.root())
+    referenced_keys = _referenced_keys_cache.get(
+        referenced_resource_name, package_path, referenced_fields
+    ).rename(dict(zip(referenced_fields, fields)))
+
+    results = (
+        data.select(fields)
+        .drop_nulls()
+        .join(referenced_keys.lazy(), on=fields, how="anti")
+        .select(
+            pl.len().alias("count"),
+            pl.struct(fields)
+            .unique(maintain_order=True)
+            .head(_MAX_ORPHANED_KEYS)
+            .implode()
+            .alias("sample"),
+        )
+        .collect(engine="streaming")
+        .row(0, named=True)
+    )
+    if not results["count"]:
+        return None
+
+    return _get_foreign_key_error(
+        resource_name,
+        fields,
+        referenced_resource_name,
+        referenced_fields,
+        results["count"],
+        results["sample"],
+    )
+
+
+def _get_foreign_key_error(
+    resource_name: str,
+    fields: list[str],
+    referenced_resource_name: str,
+    referenced_fields: list[str],
+    count: int,
+    sample: list[dict[str, Any]],
+) -> ValueError:
+    """Creates an error when values of a foreign key don't exist.
+
+    Args:
+        resource_name: The name of the resource with the foreign key.
+        fields: The fields of the foreign key.
+        referenced_resource_name: The name of the referenced resource.
+        referenced_fields: The referenced fields.
+        count: The number of rows with orphaned keys.
+        sample: The first few orphaned keys.
+
+    Returns:
+        A `ValueError`.
+    """
+    return ValueError(
+        f"Expected the values of the fields {fields} in resource '{resource_name}' "
+        f"to exist in the fields {referenced_fields} in resource "
+        f"'{referenced_resource_name}', but found {count} row(s) with values that "
+        f"don't, for example: {sample}."
+    )
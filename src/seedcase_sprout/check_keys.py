@@ -0,0 +1,186 @@
+from typing import Any, NamedTuple, cast
+
+import polars as pl
+
+from seedcase_sprout.check_properties import check_resource_properties
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.pipeline_spans import _span
+from seedcase_sprout.properties import ResourceProperties
+
+# The number of duplicate keys to show in the error message for each key.
+_MAX_DUPLICATE_KEYS = 5
+
+
+def check_keys[Frame: (pl.DataFrame, pl.LazyFrame)](
+    data: Frame, resource_properties: ResourceProperties
+) -> Frame:
+    """Checks that the keys in the data are unique, as set in the properties.
+
+    The primary key (`schema.primary_key`) must be unique and can't have any
+    missing values. Each unique key (`schema.unique_keys`) must be unique for
+    the rows where none of its fields are missing.
+
+    All keys are checked together in a single pass over the data, by hashing
+    the values of the fields in each key. Only the fields used in the keys are
+    read, so the `data` can also be a Polars LazyFrame, e.g., from
+    `pl.scan_parquet()`, to check data that is larger than the available
+    memory.
+
+    Args:
+        data: A Polars DataFrame or LazyFrame.
+        resource_properties: The specific `ResourceProperties` for the `data`.
+
+    Returns:
+        The `data` if all keys are unique.
+
+    Raises:
+        ExceptionGroup[CheckError]: If the resource properties are incorrect.
+        ExceptionGroup[ValueError]: If any of the keys have missing values or
+            aren't unique. Each error includes the number of rows and the
+            first few duplicate keys.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        resource_properties = sp.example_resource_properties()
+        resource_properties.schema.primary_key = "id"
+        sp.check_keys(
+            data=sp.example_data(),
+            resource_properties=resource_properties,
+        )
+        ```
+    """
+    check_resource_properties(resource_properties)
+    keys = _get_keys(resource_properties)
+    if not keys:
+        return data
+
+    with _span("check_keys") as span:
+        results = (
+            data.lazy()
+            .select(
+                expression
+                for index, key in enumerate(keys)
+                for expression in _get_key_check_expressions(key, index)
+            )
+            .collect(engine="streaming")
+            .row(0, named=True)
+        )
+        span.add_rows(data)
+
+    errors = [
+        error
+        for index, key in enumerate(keys)
+        for error in _get_key_errors(
+            key,
+            results[f"missing_{index}"],
+            results[f"duplicates_{index}"],
+            results[f"sample_{index}"],
+        )
+    ]
+    if errors:
+        raise ExceptionGroup(
+            "The following keys in the data are not unique or have missing values:",
+            errors,
+        )
+    return data
+
+
+class _Key(NamedTuple):
+    """A key that must be unique in the data.
+
+    Attributes:
+        name: The name of the key in the properties, e.g., `primary_key`.
+        fields: The names of the fields in the key.
+        required: Whether the fields in the key can't have missing values.
+    """
+
+    name: str
+    fields: list[str]
+    required: bool
+
+
+def _get_keys(resource_properties: ResourceProperties) -> list[_Key]:
+    """Gets the primary key and unique keys from the properties.
+
+    Args:
+        resource_properties: The resource properties with the keys.
+
+    Returns:
+        The keys, starting with the primary key.
+    """
+    primary_key = cast(
+        list[str] | str | None,
+        _get_nested_attr(resource_properties, "schema.primary_key"),
+    )
+    unique_keys = cast(
+        list[list[str]],
+        _get_nested_attr(resource_properties, "schema.unique_keys", default=[]),
+    )
+
+    keys = [_Key(name="unique_keys", fields=key, required=False) for key in unique_keys]
+    if primary_key:
+        fields = [primary_key] if isinstance(primary_key, str) else primary_key
+        keys.insert(0, _Key(name="primary_key", fields=fields, required=True))
+    return [key for key in keys if key.fields]
+
+
+def _get_key_check_expressions(key: _Key, index: int) -> list[pl.Expr]:
+    """Creates the expressions that check the uniqueness of a key.
+
+    Rows with missing values in any of the fields of the key are not counted
+    as duplicates.
+
+    Args:
+        key: The key to check.
+        index: The position of the key, used to name the results.
+
+    Returns:
+        Expressions for the number of rows with missing values, the number of
+            rows with duplicate keys, and a sample of the duplicate keys.
+    """
+    values = pl.struct(key.fields)
+    is_missing = pl.any_horizontal(pl.col(field).is_null() for field in key.fields)
+    is_duplicated = values.is_duplicated() & ~is_missing
+    return [
+        is_missing.sum().alias(f"missing_{index}"),
+        is_duplicated.sum().alias(f"duplicates_{index}"),
+        values.filter(is_duplicated)
+        .unique(maintain_order=True)
+        .head(_MAX_DUPLICATE_KEYS)
+        .implode()
+        .alias(f"sample_{index}"),
+    ]
+
+
+def _get_key_errors(
+    key: _Key, missing: int, duplicates: int, sample: list[dict[str, Any]]
+) -> list[ValueError]:
+    """Creates the errors for a key with missing values or duplicates.
+
+    Args:
+        key: The key that was checked.
+        missing: The number of rows with missing values in the key.
+        duplicates: The number of rows with duplicate keys.
+        sample: The first few duplicate keys.
+
+    Returns:
+        A list of `ValueError`s, which is empty if the key is unique.
+    """
+    errors = []
+    if key.required and missing:
+        errors.append(
+            ValueError(
+                f"Expected the {key.name} {key.fields} to have no missing values but "
+                f"found {missing} row(s) with missing values."
+            )
+        )
+    if duplicates:
+        errors.append(
+            ValueError(
+                f"Expected the {key.name} {key.fields} to be unique but found "
+                f"{duplicates} row(s) with duplicate keys, for example: {sample}."
+            )
+        )
+    return errors
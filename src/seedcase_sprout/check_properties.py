@@ -1,11 +1,19 @@
+import hashlib
+import json
+from collections import OrderedDict
 from dataclasses import replace
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 import check_datapackage as cdp
 from seedcase_soil import fmap
 
 from seedcase_sprout.internals.create import _create_resource_data_path
-from seedcase_sprout.properties import ResourceProperties, SproutProperties
+from seedcase_sprout.pipeline_spans import _span
+from seedcase_sprout.properties import (
+    BaseProperties,
+    ResourceProperties,
+    SproutProperties,
+)
 from seedcase_sprout.sprout_checks.is_resource_name_correct import (
     _is_resource_name_correct,
 )
@@ -98,6 +106,88 @@ class DataResourceError(Exception):
         super().__init__(message)
 
 
+class PropertiesCacheInfo(NamedTuple):
+    """Statistics about the cache of resource properties check results.
+
+    Attributes:
+        hits: The number of checks that used a cached result.
+        misses: The number of checks that had to run in full.
+        max_size: The maximum number of results kept in the cache.
+        size: The current number of results in the cache.
+    """
+
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class _PropertiesCheckCache:
+    """A bounded cache of check results, keyed by a properties fingerprint.
+
+    When the cache is full, the least recently used result is removed.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create an empty cache that keeps at most `max_size` results."""
+        self.max_size = max_size
+        self.results: OrderedDict[str, list[cdp.Issue]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fingerprint: str) -> list[cdp.Issue] | None:
+        """Get the cached issues for the fingerprint, if there are any."""
+        issues = self.results.get(fingerprint)
+        if issues is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.results.move_to_end(fingerprint)
+        return issues
+
+    def add(self, fingerprint: str, issues: list[cdp.Issue]) -> list[cdp.Issue]:
+        """Add the issues for the fingerprint to the cache."""
+        self.results[fingerprint] = issues
+        self.results.move_to_end(fingerprint)
+        if len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+        return issues
+
+    def info(self) -> PropertiesCacheInfo:
+        """Get the hit and miss counts and size of the cache."""
+        return PropertiesCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            max_size=self.max_size,
+            size=len(self.results),
+        )
+
+    def clear(self) -> None:
+        """Remove all results and reset the counts."""
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_resource_properties_cache = _PropertiesCheckCache(max_size=128)
+
+
+def check_resource_properties_cache_info() -> PropertiesCacheInfo:
+    """Get statistics about the cache used by `check_resource_properties()`.
+
+    Returns:
+        The number of hits and misses, and the maximum and current size of the
+            cache.
+    """
+    return _resource_properties_cache.info()
+
+
+def clear_check_resource_properties_cache() -> None:
+    """Remove all cached results used by `check_resource_properties()`."""
+    _resource_properties_cache.clear()
+
+
 def check_resource_properties(properties: Any) -> ResourceProperties:
     """Checks the resource properties against Sprout's requirements.
 
@@ -110,6 +200,11 @@ def check_resource_properties(properties: Any) -> ResourceProperties:
     - `path` includes resource name.
     - `data` is not set.
 
+    The results of the checks are cached, based on the content of the
+    `properties`. So checking the same, unchanged properties again is almost
+    instant. Use `check_resource_properties_cache_info()` to see how often the
+    cache is used.
+
     Args:
         properties: The resource properties to check.
 
@@ -119,18 +214,41 @@ def check_resource_properties(properties: Any) -> ResourceProperties:
     Raises:
         DataResourceError: an error flagging issues in the resource properties.
     """
-    resource_properties = _check_is_resource_properties_type(properties)
-    issues = _generic_check_properties(
-        SproutProperties(resources=[resource_properties]),
-        exclusions=[cdp.Exclusion(jsonpath="$.*")],
-        error=False,
-    )
+    with _span("check_resource_properties"):
+        resource_properties = _check_is_resource_properties_type(properties)
+        fingerprint = _get_properties_fingerprint(resource_properties)
+        issues = _resource_properties_cache.get(fingerprint)
+        if issues is None:
+            issues = _resource_properties_cache.add(
+                fingerprint,
+                _generic_check_properties(
+                    SproutProperties(resources=[resource_properties]),
+                    exclusions=[cdp.Exclusion(jsonpath="$.*")],
+                    error=False,
+                ),
+            )
     if issues:
         raise DataResourceError(issues) from None
 
     return resource_properties
 
 
+def _get_properties_fingerprint(properties: BaseProperties) -> str:
+    """Creates a stable hash of the content of the properties.
+
+    Properties with the same content always get the same fingerprint, no
+    matter the order of the keys.
+
+    Args:
+        properties: The properties to create the fingerprint for.
+
+    Returns:
+        The SHA-256 hash of the properties as a hexadecimal string.
+    """
+    content = json.dumps(properties.compact_dict, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def _generic_check_properties(
     properties: SproutProperties,
     exclusions: Optional[list[cdp.Exclusion]] = None,
@@ -205,7 +323,8 @@ def _generic_check_properties(
         jsonpath="$.resources[*]",
         message=(
             "Resource path must have the format "
-            "`resources/<resource-name>/data.parquet`."
+            "`resources/<resource-name>/data.parquet`, or "
+            "`resources/<resource-name>/data` for partitioned data."
         ),
         check=_check_resource_path_format,
         type="resource-path-format",
@@ -285,8 +404,11 @@ def _check_resource_path_format(resource_properties: Any) -> bool:
     ):
         return True
 
-    expected_path = _create_resource_data_path(str(name))
-    return path == expected_path
+    expected_paths = [
+        _create_resource_data_path(str(name)),
+        _create_resource_data_path(str(name), partitioned=True),
+    ]
+    return path in expected_paths
 
 
 def _check_is_package_properties_type(properties: Any) -> SproutProperties:
@@ -0,0 +1,185 @@
+from datetime import datetime
+from pathlib import Path
+from typing import cast
+
+import polars as pl
+
+from seedcase_sprout.batch_index import _create_batch_file_name
+from seedcase_sprout.batch_manifest import (
+    _create_batch_manifest,
+    _read_batch_manifest,
+    _write_batch_manifest,
+)
+from seedcase_sprout.check_properties import check_resource_properties
+from seedcase_sprout.constants import BATCH_TIMESTAMP_FORMAT
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.join_resource_batches import _stream_latest_obs_units
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _get_write_options,
+    _get_write_profile,
+    _sort_by_primary_key,
+)
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+
+
+def compact_resource_batches(
+    resource_properties: ResourceProperties,
+    package_path: Path | None = None,
+    end: datetime | None = None,
+    write_profile: ParquetWriteProfile | str | None = None,
+) -> Path:
+    """Merge the resource's oldest batch files into one batch file.
+
+    Use this function when many small batch files have built up in the
+    resource's `batch/` folder, to make later rebuilds of the data faster. All
+    batch files with a timestamp up to `end` are merged into one batch file,
+    and duplicate observational units are dropped with the same rule as
+    `join_resource_batches()`, where the most recent observational unit is
+    kept. The merged batch file is given the timestamp of the most recent of
+    the merged batch files, so it stays older than all later batch files.
+    Joining the batch files after compacting them gives the same data as
+    joining them before.
+
+    The merged batch files are deleted once the new batch file has been
+    written. If all the merged batch files had already been merged into the
+    resource's `data.parquet` file, the `batch-manifest.json` file is updated
+    too, so `update_resource_data()` doesn't need to rebuild the data file.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource to compact the batch files of.
+        package_path: The path to the data package root folder (where
+            `datapackage.json` is located). Defaults to the current working
+            directory.
+        end: Only merge batch files with this timestamp or earlier. Times
+            without a time zone are taken to be in UTC. Defaults to merging
+            all batch files.
+        write_profile: The settings to write the merged batch file with. Uses
+            the settings recorded in the resource's data file if None. As
+            with `rebuild_resource_data()`, sorting the rows by the primary key
+            for the `"fast-read"` profile needs all the merged data in memory.
+            See `write_resource_data()` for more details.
+
+    Returns:
+        The path of the merged batch file. If there was only one batch file to
+            merge, its path is returned and it is left as is.
+
+    Raises:
+        ValueError: If there are no batch files to merge.
+        ValueError: If there is no write profile with the given name.
+        ValueError: If any of the batch file names don't contain a correct
+            timestamp.
+        ExceptionGroup: If the column names or types of any of the batch files
+            don't match the `resource_properties`.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            batch_path = sp.PackagePath().resource_batch("example-resource")
+            batch_path.mkdir()
+            for timestamp in ["2025-03-26T100346Z", "2025-03-27T100346Z"]:
+                sp.example_data().write_parquet(
+                    batch_path / f"{timestamp}-example.parquet"
+                )
+            sp.compact_resource_batches(sp.example_resource_properties())
+        ```
+    """
+    check_resource_properties(resource_properties)
+    resource_name = str(resource_properties.name)
+    package_path_object = PackagePath(package_path)
+
+    index = package_path_object.resource_batch_index(resource_name, end=end)
+    paths = [Path(path) for path in index["path"]]
+    if len(paths) == 1:
+        return paths[0]
+
+    data = scan_resource_batches(resource_properties, paths)
+    primary_key = _get_nested_attr(resource_properties, "schema.primary_key")
+    data = _stream_latest_obs_units(data, primary_key)
+
+    latest_timestamp = cast(datetime, index["timestamp"].max())
+    compacted_path = package_path_object.resource_batch(
+        resource_name
+    ) / _create_batch_file_name(latest_timestamp.strftime(BATCH_TIMESTAMP_FORMAT))
+    partitioned_data_path = package_path_object.resource_partitioned_data(resource_name)
+    write_profile = _get_write_profile(
+        write_profile,
+        partitioned_data_path
+        if partitioned_data_path.is_dir()
+        else package_path_object.resource_data(resource_name),
+    )
+    data = _sort_by_primary_key(data, write_profile, resource_properties)
+    _sink_batch_file(data, compacted_path, write_profile)
+
+    _replace_in_batch_manifest(
+        paths,
+        compacted_path,
+        package_path_object.resource_batch_manifest(resource_name),
+    )
+    for path in paths:
+        path.unlink()
+    return compacted_path
+
+
+def _sink_batch_file(
+    data: pl.LazyFrame, path: Path, write_profile: ParquetWriteProfile
+) -> Path:
+    """Writes the data to a batch file, via a temporary file.
+
+    The temporary file doesn't have a `.parquet` extension, so it isn't seen
+    as a batch file until it has been completely written.
+
+    Args:
+        data: The query to write to the batch file.
+        path: The path to the batch file.
+        write_profile: The settings to write the batch file with.
+
+    Returns:
+        The path to the batch file.
+    """
+    temporary_path = path.with_suffix(".parquet.tmp")
+    try:
+        data.sink_parquet(
+            temporary_path, engine="streaming", **_get_write_options(write_profile)
+        )
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+    return temporary_path.replace(path)
+
+
+def _replace_in_batch_manifest(
+    paths: list[Path], compacted_path: Path, manifest_path: Path
+) -> Path:
+    """Replaces the merged batch files in the manifest with the merged file.
+
+    The manifest is only changed if all the merged batch files are listed in
+    it unchanged, i.e., they have all been merged into the data file. If not,
+    the data file is rebuilt by the next `update_resource_data()`, since the
+    manifest then lists batch files that no longer exist.
+
+    Args:
+        paths: The paths to the batch files that have been merged.
+        compacted_path: The path to the merged batch file.
+        manifest_path: The path to the manifest file.
+
+    Returns:
+        The path to the manifest file.
+    """
+    merged_entries = _read_batch_manifest(manifest_path)
+    if merged_entries is None:
+        return manifest_path
+
+    compacted_entries = _create_batch_manifest(paths)
+    if not set(compacted_entries).issubset(merged_entries):
+        return manifest_path
+
+    entries = [entry for entry in merged_entries if entry not in compacted_entries]
+    return _write_batch_manifest(
+        entries + _create_batch_manifest([compacted_path]), manifest_path
+    )
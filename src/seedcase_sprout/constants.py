@@ -1,6 +1,8 @@
 from importlib.resources import files
 from pathlib import Path
 
+import polars as pl
+
 """Constants in the seedcase_sprout module."""
 
 """The format of the timestamp used in batch file names."""
@@ -13,4 +15,9 @@ BATCH_TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{6}Z"
 """The name of the timestamp column added to the batch data (only used internally)."""
 BATCH_TIMESTAMP_COLUMN_NAME = "_batch_file_timestamp_"
 
+"""The data type of the timestamp column added to the batch data. Storing the
+timestamp as a Datetime (a 64-bit integer) rather than a string keeps the column
+small and quick to compare."""
+BATCH_TIMESTAMP_DATA_TYPE = pl.Datetime("us", "UTC")
+
 TEMPLATES_PATH = Path(str(files("seedcase_sprout").joinpath("templates")))
@@ -0,0 +1,194 @@
+"""An opt-in, in-process cache of the data read from Parquet files.
+
+When the cache is enabled, `read_resource_data()` and `read_resource_batches()`
+keep the DataFrames they read in memory, so reading the same unchanged file
+again doesn't touch the disk. The cache is limited by the estimated size of the
+DataFrames in memory, and the least recently used DataFrames are removed when
+the limit is exceeded.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+from typing import NamedTuple
+
+import polars as pl
+
+
+class DataCacheInfo(NamedTuple):
+    """Statistics about the data cache.
+
+    Attributes:
+        enabled: Whether the cache is enabled.
+        hits: The number of reads that used a cached DataFrame.
+        misses: The number of reads that had to read the file.
+        max_bytes: The maximum estimated size of all cached DataFrames.
+        bytes: The current estimated size of all cached DataFrames.
+        size: The current number of cached DataFrames.
+    """
+
+    enabled: bool
+    hits: int
+    misses: int
+    max_bytes: int
+    bytes: int
+    size: int
+
+
+class _CacheEntry(NamedTuple):
+    """A cached DataFrame and the version of the file it was read from.
+
+    Attributes:
+        version: The modification time, size, and inode of the file.
+        data: The DataFrame read from the file.
+        bytes: The estimated size of the DataFrame.
+    """
+
+    version: tuple[int, int, int]
+    data: pl.DataFrame
+    bytes: int
+
+
+class _DataCache:
+    """A cache of DataFrames, keyed by the resolved path of the file.
+
+    Each entry also records the modification time, size, and inode of the
+    file, so a file that has changed or been replaced is read again. The
+    cache can be used from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty, disabled cache."""
+        self.enabled = False
+        self.max_bytes = 0
+        self.bytes = 0
+        self.entries: OrderedDict[Path, _CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def read(self, path: Path, read: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+        """Get the DataFrame for the file, reading it with `read` if needed.
+
+        Cached DataFrames are returned as clones, which don't copy the data,
+        so changes to the returned DataFrame don't change the cached one.
+        """
+        if not self.enabled:
+            return read()
+
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        key = path.resolve()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.version == version:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return entry.data.clone()
+            self.misses += 1
+
+        data = read()
+        self._add(key, _CacheEntry(version, data, int(data.estimated_size())))
+        return data.clone()
+
+    def _add(self, key: Path, entry: _CacheEntry) -> None:
+        """Add the entry and remove the least recently used ones if needed."""
+        with self.lock:
+            self._remove(key)
+            if entry.bytes > self.max_bytes:
+                return
+            self.entries[key] = entry
+            self.bytes += entry.bytes
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: Path) -> None:
+        """Remove the entry for the key, if there is one."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.bytes
+
+    def info(self) -> DataCacheInfo:
+        """Get the hit and miss counts and size of the cache."""
+        with self.lock:
+            return DataCacheInfo(
+                enabled=self.enabled,
+                hits=self.hits,
+                misses=self.misses,
+                max_bytes=self.max_bytes,
+                bytes=self.bytes,
+                size=len(self.entries),
+            )
+
+    def configure(self, enabled: bool, max_bytes: int) -> None:
+        """Enable or disable the cache, removing all entries and counts."""
+        with self.lock:
+            self.enabled = enabled
+            self.max_bytes = max_bytes
+            self.entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+_data_cache = _DataCache()
+
+
+def enable_data_cache(max_bytes: int = 1_000_000_000) -> DataCacheInfo:
+    """Keep the data read by Sprout in memory, up to a maximum size.
+
+    Once enabled, `read_resource_data()` and `read_resource_batches()` keep
+    each DataFrame they read from a file in memory. Reading the same file
+    again then returns the cached DataFrame, as long as the file hasn't been
+    changed or replaced since. `read_resource_data()` only uses the cache when
+    reading all of the data, i.e., without `keys`, `columns`, `filter`, or
+    `n_rows`.
+
+    When the estimated size of all cached DataFrames exceeds `max_bytes`,
+    the least recently used DataFrames are removed from the cache. Enabling
+    the cache again removes all cached DataFrames.
+
+    Args:
+        max_bytes: The maximum estimated size, in bytes, of all cached
+            DataFrames. Defaults to 1 GB.
+
+    Returns:
+        Statistics about the now empty cache.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        sp.enable_data_cache(max_bytes=100_000_000)
+        with sp.ExamplePackage():
+            sp.read_resource_data("example-resource")
+            sp.read_resource_data("example-resource")
+        print(sp.data_cache_info())
+        sp.disable_data_cache()
+        ```
+    """
+    _data_cache.configure(enabled=True, max_bytes=max_bytes)
+    return _data_cache.info()
+
+
+def disable_data_cache() -> DataCacheInfo:
+    """Stop keeping the data read by Sprout in memory.
+
+    All cached DataFrames are removed. The cache is disabled by default.
+
+    Returns:
+        Statistics about the now empty cache.
+    """
+    _data_cache.configure(enabled=False, max_bytes=0)
+    return _data_cache.info()
+
+
+def data_cache_info() -> DataCacheInfo:
+    """Get statistics about the data cache.
+
+    Returns:
+        Whether the cache is enabled, the number of hits and misses, and the
+            maximum and current size of the cache.
+    """
+    return _data_cache.info()
@@ -0,0 +1,572 @@
+import math
+import random
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, cast
+
+import polars as pl
+
+from seedcase_sprout.batch_index import _create_batch_file_name
+from seedcase_sprout.check_data import _as_polars_value
+from seedcase_sprout.check_properties import check_resource_properties
+from seedcase_sprout.constants import BATCH_TIMESTAMP_FORMAT
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _get_write_options,
+    _get_write_profile,
+)
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import (
+    ConstraintsProperties,
+    FieldProperties,
+    FieldType,
+    ResourceProperties,
+)
+
+
+def generate_data(
+    resource_properties: ResourceProperties,
+    n_rows: int,
+    seed: int | None = None,
+) -> pl.DataFrame:
+    """Generate random data that matches the resource properties.
+
+    Use this function to create data of any size for testing or trying out a
+    resource, without writing the data by hand. The data has a column for each
+    field in the `resource_properties`, with the Polars type that matches the
+    field's type. The values meet the field's `categories` and `enum`,
+    `minimum` and `maximum` (including exclusive), `min_length` and
+    `max_length`, `required`, and `unique` constraints. The primary key and the
+    unique keys are unique. A key with more than one field is made unique by
+    giving one of its fields unique values.
+
+    All columns are generated at once from the row numbers, without looping
+    over the rows, so tens of millions of rows take only seconds.
+
+    Args:
+        resource_properties: The properties of the resource to generate data
+            for.
+        n_rows: The number of rows to generate.
+        seed: The seed for the random values. The same seed gives the same data
+            with the same version of Polars. Defaults to a random seed.
+
+    Returns:
+        The generated data, which passes `check_data()`.
+
+    Raises:
+        ExceptionGroup[CheckError]: If the resource properties are incorrect.
+        ValueError: If values can't be generated for a field, e.g., because a
+            field has a `pattern` constraint without `enum` or `categories`, a
+            `min_length` larger than its `max_length`, or there aren't enough
+            distinct values for a unique field or key.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        sp.generate_data(sp.example_resource_properties(), n_rows=5, seed=1)
+        ```
+    """
+    check_resource_properties(resource_properties)
+    fields = cast(
+        list[FieldProperties],
+        _get_nested_attr(resource_properties, "schema.fields", default=[]),
+    )
+    unique_names = _get_unique_field_names(resource_properties, fields, n_rows)
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    rows = pl.select(pl.int_range(n_rows, dtype=pl.Int64).alias(_ROW_COLUMN_NAME))
+    return rows.select(
+        _generate_column(
+            field, n_rows, seed + 2 * number, str(field.name) in unique_names
+        ).alias(str(field.name))
+        for number, field in enumerate(fields)
+    )
+
+
+def generate_resource_batches(
+    resource_properties: ResourceProperties,
+    n_rows: int,
+    n_batches: int,
+    seed: int | None = None,
+    package_path: Path | None = None,
+    write_profile: ParquetWriteProfile | str | None = None,
+) -> list[Path]:
+    """Generate random data and write it to batch files of the resource.
+
+    The data is generated with `generate_data()` and split into `n_batches`
+    batch files of about the same size in the resource's `batch/` folder. The
+    batch files are given timestamps one second apart, starting from the
+    current time or after the most recent existing batch file, whichever is
+    later. This way, the new batch files are the most recent ones.
+
+    Args:
+        resource_properties: The properties of the resource to generate data
+            for.
+        n_rows: The total number of rows to generate.
+        n_batches: The number of batch files to split the rows into.
+        seed: The seed for the random values. Defaults to a random seed.
+        package_path: The path to the data package root folder (where
+            `datapackage.json` is located). Defaults to the current working
+            directory.
+        write_profile: The settings to write the batch files with. Uses the
+            settings recorded in the resource's data file if None. See
+            `write_resource_data()` for more details.
+
+    Returns:
+        The paths to the new batch files, from the oldest to the most recent.
+
+    Raises:
+        ValueError: If `n_batches` is less than 1.
+        ValueError: If there is no write profile with the given name.
+        ValueError: If values can't be generated for a field. See
+            `generate_data()`.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            sp.generate_resource_batches(
+                sp.example_resource_properties(), n_rows=100, n_batches=4
+            )
+        ```
+    """
+    if n_batches < 1:
+        raise ValueError(f"`n_batches` must be at least 1, but was {n_batches}.")
+
+    data = generate_data(resource_properties, n_rows, seed)
+    package_path_object = PackagePath(package_path)
+    batch_path = package_path_object.resource_batch(str(resource_properties.name))
+    batch_path.mkdir(parents=True, exist_ok=True)
+    partitioned_data_path = package_path_object.resource_partitioned_data(
+        str(resource_properties.name)
+    )
+    write_options = _get_write_options(
+        _get_write_profile(
+            write_profile,
+            partitioned_data_path
+            if partitioned_data_path.is_dir()
+            else package_path_object.resource_data(str(resource_properties.name)),
+        )
+    )
+
+    start = datetime.now(UTC).replace(microsecond=0)
+    index = package_path_object.resource_batch_index(str(resource_properties.name))
+    if not index.is_empty():
+        start = max(start, index["timestamp"].max() + timedelta(seconds=1))
+
+    paths = []
+    for number in range(n_batches):
+        offset = number * n_rows // n_batches
+        length = (number + 1) * n_rows // n_batches - offset
+        timestamp = (start + timedelta(seconds=number)).strftime(BATCH_TIMESTAMP_FORMAT)
+        path = batch_path / _create_batch_file_name(timestamp)
+        data.slice(offset, length).write_parquet(path, **write_options)
+        paths.append(path)
+    return paths
+
+
+# The name of the temporary column with the row numbers.
+_ROW_COLUMN_NAME = "_sprout_row_"
+
+# The default range of values for each type, in the units of `_to_units()`.
+_DEFAULT_RANGES: dict[str, tuple[int, int]] = {
+    "integer": (0, 2**31 - 1),
+    "year": (1900, 2100),
+    "date": (
+        date(2000, 1, 1).toordinal() - date(1970, 1, 1).toordinal(),
+        date(2030, 12, 31).toordinal() - date(1970, 1, 1).toordinal(),
+    ),
+    "yearmonth": (2000 * 12, 2030 * 12 + 11),
+    "datetime": (946_684_800_000_000, 1_924_991_999_999_999),
+    "time": (0, 86_400_000_000_000 - 1),
+}
+_DEFAULT_NUMBER_RANGE = (0.0, 1000.0)
+
+# The Polars type of the generated values for each type.
+_POLARS_TYPES: dict[str, pl.DataType] = {
+    "integer": pl.Int64(),
+    "year": pl.Int64(),
+    "any": pl.Int64(),
+    "number": pl.Float64(),
+    "boolean": pl.Boolean(),
+    "date": pl.Date(),
+    "yearmonth": pl.Date(),
+    "datetime": pl.Datetime("us"),
+    "time": pl.Time(),
+}
+
+
+def _get_unique_field_names(
+    resource_properties: ResourceProperties,
+    fields: list[FieldProperties],
+    n_rows: int,
+) -> set[str]:
+    """Gets the names of the fields that need unique values.
+
+    These are the fields with a `unique` constraint, and one field of each of
+    the primary key and the unique keys. A key is only given a field with
+    unique values if none of its fields already have unique values. The field
+    given unique values is the first field of the key that can have at least
+    `n_rows` distinct values.
+
+    Args:
+        resource_properties: The properties with the keys.
+        fields: The fields of the resource.
+        n_rows: The number of rows to generate.
+
+    Returns:
+        The names of the fields that need unique values.
+
+    Raises:
+        ValueError: If none of the fields of a key can have `n_rows` distinct
+            values.
+    """
+    fields_by_name = {str(field.name): field for field in fields}
+    unique_names = {
+        str(field.name)
+        for field in fields
+        if field.constraints is not None and field.constraints.unique
+    }
+
+    primary_key = _get_nested_attr(resource_properties, "schema.primary_key")
+    unique_keys = _get_nested_attr(resource_properties, "schema.unique_keys") or []
+    keys = [primary_key, *unique_keys] if primary_key else unique_keys
+    for key in keys:
+        key_names = [key] if isinstance(key, str) else list(key)
+        if unique_names.intersection(key_names):
+            continue
+        name = next(
+            (
+                name
+                for name in key_names
+                if _count_distinct_values(fields_by_name[name]) >= n_rows
+            ),
+            None,
+        )
+        if name is None:
+            raise ValueError(
+                f"Can't generate {n_rows} unique values for the key {key_names}, "
+                "because none of its fields can have that many distinct values."
+            )
+        unique_names.add(name)
+    return unique_names
+
+
+def _count_distinct_values(field: FieldProperties) -> float:
+    """Counts the distinct values that can be generated for the field.
+
+    Numbers and the text types without a `max_length` can have any number of
+    distinct values, while geopoints and GeoJSON values are always random, so
+    they can't be made unique.
+
+    Args:
+        field: The field to count the values of.
+
+    Returns:
+        The number of distinct values, which is infinite if there is no limit.
+    """
+    field_type = field.type or "any"
+    constraints = field.constraints or ConstraintsProperties()
+    values = constraints.enum if constraints.enum is not None else field.categories
+    if values is not None:
+        return len(values)
+    if field_type == "boolean":
+        return 2
+    if field_type in ("geopoint", "geojson"):
+        return 0
+    if field_type == "string" and constraints.max_length is not None:
+        return 10**constraints.max_length
+    if field_type in ("number", "string", "array", "object", "duration"):
+        return math.inf
+    units_type = "integer" if field_type == "any" else field_type
+    low, high = _get_range(units_type, constraints)
+    return max(high - low + 1, 0)
+
+
+def _generate_column(
+    field: FieldProperties, n_rows: int, seed: int, unique: bool
+) -> pl.Expr:
+    """Generates the values of a field from the row numbers.
+
+    Args:
+        field: The field to generate values for.
+        n_rows: The number of rows.
+        seed: The seed for the random values of this field.
+        unique: Whether all values must be different.
+
+    Returns:
+        An expression with the generated values.
+
+    Raises:
+        ValueError: If values can't be generated for the field.
+    """
+    field_type: FieldType = field.type or "any"
+    constraints = field.constraints or ConstraintsProperties()
+    values = constraints.enum if constraints.enum is not None else field.categories
+    if values is not None:
+        return _generate_from_values(field, values, n_rows, seed, unique)
+    if constraints.pattern is not None and field_type == "string":
+        raise ValueError(
+            f"Can't generate values for the field '{field.name}' that match the "
+            f"pattern '{constraints.pattern}'. Add `enum` or `categories` to the "
+            "field to generate values for it."
+        )
+
+    if field_type == "boolean":
+        if unique and n_rows > 2:
+            raise ValueError(
+                f"Can't generate {n_rows} unique values for the boolean field "
+                f"'{field.name}'."
+            )
+        if unique:
+            return pl.col(_ROW_COLUMN_NAME).shuffle(seed) == 1
+        return _random_integer(seed, 2) == 1
+    if field_type == "number":
+        return _generate_number(constraints, n_rows, seed, unique)
+    if field_type == "geopoint":
+        return pl.concat_list(
+            _scale(_random_fraction(seed), -180, 180).round(6),
+            _scale(_random_fraction(seed + 1), -90, 90).round(6),
+        ).list.to_array(2)
+    if field_type in ("string", "array", "object", "geojson", "duration"):
+        return _generate_text(field, field_type, n_rows, seed, unique)
+
+    units_type = "integer" if field_type == "any" else field_type
+    low, high = _get_range(units_type, constraints)
+    units = _generate_integer(field, low, high, n_rows, seed, unique)
+    return _from_units(units, units_type)
+
+
+def _generate_from_values(
+    field: FieldProperties, values: list[Any], n_rows: int, seed: int, unique: bool
+) -> pl.Expr:
+    """Generates values by picking from the `enum` or `categories` of a field."""
+    if unique and n_rows > len(values):
+        raise ValueError(
+            f"Can't generate {n_rows} unique values for the field '{field.name}' "
+            f"from its {len(values)} allowed values."
+        )
+    positions = (
+        pl.col(_ROW_COLUMN_NAME).shuffle(seed)
+        if unique
+        else _random_integer(seed, len(values))
+    )
+    picked = pl.lit(pl.Series(values)).gather(positions)
+    polars_type = _POLARS_TYPES.get(field.type or "any", pl.String())
+    if field.type in (None, "any"):
+        return picked
+    return _as_polars_value(picked, polars_type, field.type)
+
+
+def _generate_number(
+    constraints: ConstraintsProperties, n_rows: int, seed: int, unique: bool
+) -> pl.Expr:
+    """Generates numbers within the minimum and maximum of the field.
+
+    The numbers are never equal to the bounds, so they also meet exclusive
+    minimums and maximums.
+    """
+    low = _first_not_none(constraints.minimum, constraints.exclusive_minimum)
+    high = _first_not_none(constraints.maximum, constraints.exclusive_maximum)
+    low_value, high_value = _fill_range(
+        None if low is None else float(low),
+        None if high is None else float(high),
+        *_DEFAULT_NUMBER_RANGE,
+    )
+    fraction = _random_fraction(seed)
+    if unique:
+        fraction = (pl.col(_ROW_COLUMN_NAME).shuffle(seed) + fraction) / max(n_rows, 1)
+    return _scale(fraction, low_value, high_value)
+
+
+def _generate_text(
+    field: FieldProperties, field_type: str, n_rows: int, seed: int, unique: bool
+) -> pl.Expr:
+    """Generates strings, within the minimum and maximum length of the field.
+
+    Strings are numbers padded with zeros, while the other types are small JSON
+    values or ISO 8601 durations.
+    """
+    constraints = field.constraints or ConstraintsProperties()
+    numbers = (
+        pl.col(_ROW_COLUMN_NAME).shuffle(seed)
+        if unique
+        else _random_integer(seed, max(n_rows, 1))
+    )
+    text = numbers.cast(pl.String)
+    if field_type == "array":
+        return pl.concat_str(pl.lit("["), text, pl.lit("]"))
+    if field_type == "object":
+        return pl.concat_str(pl.lit('{"value": '), text, pl.lit("}"))
+    if field_type == "geojson":
+        return pl.concat_str(
+            pl.lit('{"type": "Point", "coordinates": ['),
+            _scale(_random_fraction(seed + 1), -180, 180).round(6).cast(pl.String),
+            pl.lit(", "),
+            _scale(_random_fraction(seed + 2), -90, 90).round(6).cast(pl.String),
+            pl.lit("]}"),
+        )
+    if field_type == "duration":
+        return pl.concat_str(pl.lit("P"), text, pl.lit("D"))
+
+    if (
+        constraints.min_length is not None
+        and constraints.max_length is not None
+        and constraints.min_length > constraints.max_length
+    ):
+        raise ValueError(
+            f"Can't generate values for the field '{field.name}', because its "
+            f"`min_length` ({constraints.min_length}) is larger than its "
+            f"`max_length` ({constraints.max_length})."
+        )
+    width = max(constraints.min_length or 1, len(str(max(n_rows - 1, 0))))
+    if constraints.max_length is not None and width > constraints.max_length:
+        if unique:
+            raise ValueError(
+                f"Can't generate {n_rows} unique values for the field "
+                f"'{field.name}' that are at most {constraints.max_length} "
+                "characters long."
+            )
+        width = constraints.max_length
+        text = (numbers % 10**width).cast(pl.String)
+    return text.str.zfill(width)
+
+
+def _generate_integer(
+    field: FieldProperties, low: int, high: int, n_rows: int, seed: int, unique: bool
+) -> pl.Expr:
+    """Generates integers between `low` and `high`, both included.
+
+    Unique integers are spread evenly over the range, in a random order.
+    """
+    size = high - low + 1
+    if size < 1 or (unique and size < n_rows):
+        raise ValueError(
+            f"Can't generate {n_rows} {'unique ' if unique else ''}values for "
+            f"the field '{field.name}' within its minimum and maximum."
+        )
+    if unique:
+        step = size // max(n_rows, 1)
+        return pl.lit(low, dtype=pl.Int64) + pl.col(_ROW_COLUMN_NAME).shuffle(
+            seed
+        ) * pl.lit(step, dtype=pl.Int64)
+    return pl.lit(low, dtype=pl.Int64) + _random_integer(seed, size).cast(pl.Int64)
+
+
+def _get_range(units_type: str, constraints: ConstraintsProperties) -> tuple[int, int]:
+    """Gets the range of allowed values of the field, in integer units.
+
+    Missing bounds are filled in with `_fill_range()`.
+
+    Args:
+        units_type: The type of the field, with `any` as `integer`.
+        constraints: The constraints of the field.
+
+    Returns:
+        The lowest and highest allowed values, both included.
+    """
+    low = _first_not_none(
+        _to_units(constraints.minimum, units_type),
+        _plus(_to_units(constraints.exclusive_minimum, units_type), 1),
+    )
+    high = _first_not_none(
+        _to_units(constraints.maximum, units_type),
+        _plus(_to_units(constraints.exclusive_maximum, units_type), -1),
+    )
+    return _fill_range(low, high, *_DEFAULT_RANGES[units_type])
+
+
+def _fill_range[T: (int, float)](
+    low: T | None, high: T | None, default_low: T, default_high: T
+) -> tuple[T, T]:
+    """Fills in missing bounds of a range with the default bounds.
+
+    If the given bound is outside the default range, the missing bound is
+    instead set so the range is as wide as the default range.
+
+    Args:
+        low: The lowest allowed value, if any.
+        high: The highest allowed value, if any.
+        default_low: The default lowest value.
+        default_high: The default highest value.
+
+    Returns:
+        The lowest and highest values.
+    """
+    span = default_high - default_low
+    if low is None:
+        low = default_low if high is None or high >= default_low else high - span
+    if high is None:
+        high = default_high if low <= default_high else low + span
+    return low, high
+
+
+def _to_units(value: str | float | None, units_type: str) -> int | None:
+    """Converts a constraint value to integer units of the type.
+
+    The units are days since 1970 for dates, months since year 0 for year and
+    months, microseconds since 1970 for datetimes, and nanoseconds since
+    midnight for times.
+    """
+    if value is None:
+        return None
+    if units_type in ("integer", "year"):
+        return int(value)
+    text = str(value)
+    if units_type == "date":
+        return date.fromisoformat(text).toordinal() - date(1970, 1, 1).toordinal()
+    if units_type == "yearmonth":
+        year, month = text.split("-")[:2]
+        return int(year) * 12 + int(month) - 1
+    if units_type == "datetime":
+        parsed = datetime.fromisoformat(text)
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+        return (parsed - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+    parsed_time = time.fromisoformat(text)
+    seconds = parsed_time.hour * 3600 + parsed_time.minute * 60 + parsed_time.second
+    return (seconds * 1_000_000 + parsed_time.microsecond) * 1000
+
+
+def _from_units(units: pl.Expr, units_type: str) -> pl.Expr:
+    """Converts integer units, see `_to_units()`, to values of the type."""
+    if units_type == "date":
+        return units.cast(pl.Int32).cast(pl.Date)
+    if units_type == "yearmonth":
+        return pl.date(units // 12, units % 12 + 1, 1)
+    if units_type == "datetime":
+        return units.cast(pl.Datetime("us"))
+    if units_type == "time":
+        return units.cast(pl.Time)
+    return units
+
+
+def _random_integer(seed: int, size: int) -> pl.Expr:
+    """Random integers from 0 up to, but not including, `size`."""
+    return pl.col(_ROW_COLUMN_NAME).hash(seed) % size
+
+
+def _random_fraction(seed: int) -> pl.Expr:
+    """Random numbers between 0 and 1, never equal to 0 or 1."""
+    return ((pl.col(_ROW_COLUMN_NAME).hash(seed) // 2**11).cast(pl.Float64) + 0.5) / (
+        2**53
+    )
+
+
+def _scale(fraction: pl.Expr, low: float, high: float) -> pl.Expr:
+    """Scales numbers between 0 and 1 to numbers between `low` and `high`."""
+    return fraction * (high - low) + low
+
+
+def _first_not_none[T](*values: T | None) -> T | None:
+    """Gets the first value that isn't None."""
+    return next((value for value in values if value is not None), None)
+
+
+def _plus(value: int | None, amount: int) -> int | None:
+    """Adds the amount to the value, if it isn't None."""
+    return None if value is None else value + amount
@@ -3,17 +3,22 @@ from pathlib import Path
 from seedcase_sprout.internals.to import _to_snake_case
 
 
-def _create_resource_data_path(resource_name: str) -> str:
+def _create_resource_data_path(resource_name: str, partitioned: bool = False) -> str:
     """Creates a relative path to the resource data file.
 
     Args:
         resource_name: The name of the resource.
+        partitioned: Whether to create the path to the folder of the
+            partitioned data files instead.
 
     Returns:
         The relative path from the package root to the resource data file.
-            E.g., "resources/test-resource/data.parquet"
+            E.g., "resources/test-resource/data.parquet", or
+            "resources/test-resource/data" if partitioned.
     """
-    return str(Path("resources", resource_name, "data.parquet"))
+    return str(
+        Path("resources", resource_name, "data" if partitioned else "data.parquet")
+    )
 
 
 def _create_resource_properties_script_filename(resource_name: str = "") -> str:
@@ -0,0 +1,114 @@
+"""Functions to keep an Arrow IPC copy of a resource's data file.
+
+The sidecar is an uncompressed Arrow IPC file stored next to the resource's
+`data.parquet` file, with the same data. Unlike Parquet, it can be memory-mapped
+and read without decompressing or decoding the data, and the operating system
+can share the mapped pages between processes reading the same resource.
+
+When the sidecar is written, a fingerprint of the Parquet file is stored next
+to it. The fingerprint is the file's size, its modification time, and a hash of
+its footer, which holds the schema and the statistics of each row group. Any
+later change to the Parquet file, e.g., from rebuilding the data or copying
+another file over it while keeping the modification time, gives it a new
+fingerprint, so the sidecar is no longer used.
+"""
+
+import hashlib
+from pathlib import Path
+
+import polars as pl
+
+# The last bytes of a Parquet file: the length of the footer and the magic bytes.
+_PARQUET_TAIL_SIZE = 8
+_PARQUET_MAGIC = b"PAR1"
+
+
+def _write_ipc_sidecar(data: pl.DataFrame, sidecar_path: Path, data_path: Path) -> Path:
+    """Writes the data to the sidecar and links it to the Parquet data file.
+
+    The sidecar is written to a temporary file first, which then replaces the
+    sidecar. The fingerprint of the Parquet data file is written after the
+    sidecar, so readers never see a partly written sidecar or a fingerprint
+    that doesn't belong to it.
+
+    Args:
+        data: The data that was written to the Parquet data file.
+        sidecar_path: The path to the sidecar.
+        data_path: The path to the Parquet data file.
+
+    Returns:
+        The path to the sidecar.
+    """
+    fingerprint_path = _get_fingerprint_path(sidecar_path)
+    fingerprint_path.unlink(missing_ok=True)
+
+    temporary_path = sidecar_path.with_suffix(".arrow.tmp")
+    data.write_ipc(temporary_path, compression="uncompressed")
+    temporary_path.replace(sidecar_path)
+
+    temporary_fingerprint_path = fingerprint_path.with_suffix(".fingerprint.tmp")
+    temporary_fingerprint_path.write_text(_get_parquet_fingerprint(data_path))
+    temporary_fingerprint_path.replace(fingerprint_path)
+    return sidecar_path
+
+
+def _remove_ipc_sidecar(sidecar_path: Path) -> None:
+    """Removes the sidecar and the fingerprint of its Parquet data file, if any.
+
+    Args:
+        sidecar_path: The path to the sidecar.
+    """
+    _get_fingerprint_path(sidecar_path).unlink(missing_ok=True)
+    sidecar_path.unlink(missing_ok=True)
+
+
+def _is_ipc_sidecar_current(sidecar_path: Path, data_path: Path) -> bool:
+    """Checks if the sidecar has the same data as the Parquet data file.
+
+    Args:
+        sidecar_path: The path to the sidecar.
+        data_path: The path to the Parquet data file.
+
+    Returns:
+        Whether both files exist and the fingerprint of the Parquet data file
+            is the same as when the sidecar was written.
+    """
+    fingerprint_path = _get_fingerprint_path(sidecar_path)
+    if not (
+        sidecar_path.is_file() and fingerprint_path.is_file() and data_path.is_file()
+    ):
+        return False
+    return fingerprint_path.read_text() == _get_parquet_fingerprint(data_path)
+
+
+def _get_fingerprint_path(sidecar_path: Path) -> Path:
+    """Gets the path to the fingerprint of the sidecar's Parquet data file."""
+    return sidecar_path.with_suffix(".arrow.fingerprint")
+
+
+def _get_parquet_fingerprint(data_path: Path) -> str:
+    """Gets the fingerprint of a Parquet file.
+
+    Only the footer is read, so this is quick even for large files. If the
+    file doesn't end like a Parquet file, its last bytes are hashed instead.
+
+    Args:
+        data_path: The path to the Parquet file.
+
+    Returns:
+        The size, the modification time in nanoseconds, and a hash of the
+            footer of the file.
+    """
+    stat = data_path.stat()
+    with data_path.open("rb") as file:
+        tail_size = min(_PARQUET_TAIL_SIZE, stat.st_size)
+        file.seek(stat.st_size - tail_size)
+        tail = file.read(tail_size)
+        footer = tail
+        if tail_size == _PARQUET_TAIL_SIZE and tail.endswith(_PARQUET_MAGIC):
+            footer_size = int.from_bytes(tail[:4], "little")
+            if footer_size <= stat.st_size - tail_size:
+                file.seek(stat.st_size - tail_size - footer_size)
+                footer = file.read(footer_size) + tail
+    footer_hash = hashlib.sha256(footer).hexdigest()
+    return f"{stat.st_size}-{stat.st_mtime_ns}-{footer_hash}"
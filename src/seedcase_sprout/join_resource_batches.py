@@ -1,23 +1,35 @@
 import polars as pl
 
 from seedcase_sprout.check_data import check_data
+from seedcase_sprout.check_keys import check_keys
 from seedcase_sprout.check_properties import (
     check_resource_properties,
 )
 from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
 from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.pipeline_spans import _span
 from seedcase_sprout.properties import ResourceProperties
 
+# Temporary columns used to find the latest version of each observational unit.
+_ROW_NUMBER_COLUMN_NAME = "_sprout_row_number_"
+_VERSION_COLUMN_NAME = "_sprout_version_"
+# More rows than any batch data will have, so versions from different batches
+# never overlap.
+_MAX_ROWS = 2**40
+
 
 def join_resource_batches(
-    data_list: list[pl.DataFrame], resource_properties: ResourceProperties
+    data_list: list[pl.DataFrame],
+    resource_properties: ResourceProperties,
+    maintain_order: bool = False,
 ) -> pl.DataFrame:
     """Join all the batch DataFrames into one.
 
     This function takes a list of DataFrames, joins them together and drops any
     duplicate observational units based on the primary key from
     `resource_properties`. Then, it confirms that the data are correct against
-    the `resource_properties` after the join.
+    the `resource_properties` after the join, including that the primary key
+    has no missing values and that the unique keys are unique.
 
     The observational unit is the primary key of the resource. For example, if
     a person is part of a research study and has multiple observations, the
@@ -27,7 +39,9 @@ def join_resource_batches(
     recent observational unit will be kept based on the timestamp of the batch
     file. This way, if there are any errors or mistakes in older batch files
     that have been corrected in later files, the mistake will be kept in the
-    batch file, but won't be included in the `data.parquet` file.
+    batch file, but won't be included in the `data.parquet` file. If there are
+    duplicate observational units with the same timestamp, the one that comes
+    last in `data_list` is kept.
 
     Args:
         data_list: A list of Polars DataFrames for all the batch files. Use
@@ -35,6 +49,11 @@ def join_resource_batches(
             been checked against the properties individually.
         resource_properties: The `ResourceProperties` object that contains the
             properties of the resource to check the data against.
+        maintain_order: Whether to keep the rows in the same order as in
+            `data_list` when the resource has no primary key. This makes the
+            order of the rows the same each time, but is slower. With a primary
+            key, the rows are always in the order of their batch's timestamp
+            and then of `data_list`, so this has no effect. Defaults to False.
 
     Returns:
         A single DataFrame object of all the batch data with duplicate
@@ -46,30 +65,100 @@ def join_resource_batches(
             different shapes, such as mismatched column names or numbers.
         polars.exceptions.SchemaError: If the dataframes in data_list have
             different schemas, e.g., their column data types don't match.
+        ExceptionGroup[ValueError]: If the primary key has missing values or
+            the unique keys aren't unique.
     """
-    check_resource_properties(resource_properties)
-
-    if data_list == []:
-        raise ValueError(
-            "Could not join resource batches because an empty `data_list` was "
-            f"provided. The batch folder for the resource '{resource_properties.name}' "
-            "may be empty."
+    with _span("join_resource_batches") as span:
+        check_resource_properties(resource_properties)
+
+        if data_list == []:
+            raise ValueError(
+                "Could not join resource batches because an empty `data_list` was "
+                "provided. The batch folder for the resource "
+                f"'{resource_properties.name}' may be empty."
+            )
+
+        with _span("join_resource_batches.concat") as concat_span:
+            data = concat_span.add_data(pl.concat(data_list))
+        primary_key = _get_nested_attr(resource_properties, "schema.primary_key")
+        with _span("join_resource_batches.drop_duplicates") as drop_span:
+            data = drop_span.add_rows(
+                _drop_duplicate_obs_units(data, primary_key, maintain_order)
+            )
+
+        check_data(data, resource_properties)
+        check_keys(data, resource_properties)
+
+        return span.add_data(data)
+
+
+def _drop_duplicate_obs_units[Frame: (pl.DataFrame, pl.LazyFrame)](
+    data: Frame, primary_key: list[str] | str | None, maintain_order: bool = False
+) -> Frame:
+    """Drop duplicates based on the primary key and keep the latest one.
+
+    Works on both DataFrames and LazyFrames, so the same rule is used when
+    joining batches in memory and when streaming them.
+
+    The rows are sorted by their batch's timestamp, keeping the order of rows
+    with the same timestamp, and the last row of each primary key is kept. The
+    kept rows stay in this order, so the result is the same each time. Without
+    a primary key, only identical rows are dropped, so it doesn't matter which
+    one of them is kept and the rows don't need to be sorted. Then
+    `maintain_order` decides whether the rows stay in the same order.
+    """
+    if not primary_key:
+        return data.drop(BATCH_TIMESTAMP_COLUMN_NAME).unique(
+            keep="any", maintain_order=maintain_order
         )
 
-    data = pl.concat(data_list)
-    primary_key = _get_nested_attr(resource_properties, "schema.primary_key")
-    data = _drop_duplicate_obs_units(data, primary_key)
-
-    check_data(data, resource_properties)
-
-    return data
-
-
-def _drop_duplicate_obs_units(
-    data: pl.DataFrame, primary_key: list[str] | str | None
-) -> pl.DataFrame:
-    """Drop duplicates based on the primary key and keep the latest one."""
-    data = data.sort(BATCH_TIMESTAMP_COLUMN_NAME)
+    data = data.sort(BATCH_TIMESTAMP_COLUMN_NAME, maintain_order=True)
     data = data.drop(BATCH_TIMESTAMP_COLUMN_NAME)
-
-    return data.unique(subset=primary_key, keep="last")
+    return data.unique(subset=primary_key, keep="last", maintain_order=True)
+
+
+def _stream_latest_obs_units(
+    data: pl.LazyFrame, primary_key: list[str] | str | None
+) -> pl.LazyFrame:
+    """Drop duplicates based on the primary key without holding all the rows.
+
+    Keeps the same rows as `_drop_duplicate_obs_units()`, but in two passes
+    over the data, so the rows never need to be in memory at once. The first
+    pass only reads the primary key, the batch timestamp, and the position of
+    each row, and finds the position of the latest row of each primary key.
+    This runs when the function is called and uses memory in proportion to the
+    number of unique primary keys rather than the size of the data. The second
+    pass runs when the returned LazyFrame is sunk or collected and streams the
+    rows, keeping only the rows at those positions.
+
+    Without a primary key, identical rows are dropped as in
+    `_drop_duplicate_obs_units()`, which needs memory in proportion to the
+    number of unique rows.
+    """
+    if not primary_key:
+        return _drop_duplicate_obs_units(data, primary_key)
+
+    primary_key = [primary_key] if isinstance(primary_key, str) else primary_key
+    data = data.with_row_index(_ROW_NUMBER_COLUMN_NAME)
+    timestamp = pl.col(BATCH_TIMESTAMP_COLUMN_NAME).cast(pl.Int64)
+    timestamps = (
+        data.select(timestamp.unique()).collect(engine="streaming").to_series().sort()
+    )
+    batch_number = timestamp.replace_strict(
+        timestamps, pl.int_range(timestamps.len(), eager=True), return_dtype=pl.Int64
+    )
+    version = batch_number * _MAX_ROWS + pl.col(_ROW_NUMBER_COLUMN_NAME).cast(pl.Int64)
+    latest_rows = (
+        data.select(*primary_key, version.alias(_VERSION_COLUMN_NAME))
+        .group_by(primary_key)
+        .agg(pl.col(_VERSION_COLUMN_NAME).max())
+        .select(
+            (pl.col(_VERSION_COLUMN_NAME) % _MAX_ROWS)
+            .cast(pl.get_index_type())
+            .alias(_ROW_NUMBER_COLUMN_NAME)
+        )
+        .collect(engine="streaming")
+    )
+    return data.join(latest_rows.lazy(), on=_ROW_NUMBER_COLUMN_NAME, how="semi").drop(
+        BATCH_TIMESTAMP_COLUMN_NAME, _ROW_NUMBER_COLUMN_NAME
+    )
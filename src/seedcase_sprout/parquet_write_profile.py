@@ -0,0 +1,188 @@
+"""Settings used when writing Parquet files in Sprout.
+
+The settings used to write a resource's `data.parquet` file decide how fast
+it can later be read and how much space it takes on disk. The settings are
+recorded in the key-value metadata of each Parquet file written by Sprout, so
+that later rebuilds of the file can use the same settings.
+"""
+
+import json
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Literal, Self, cast
+
+import polars as pl
+
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.properties import ResourceProperties
+
+# The name of the key in the Parquet metadata that holds the write profile.
+_WRITE_PROFILE_METADATA_KEY = "seedcase_sprout.write_profile"
+
+ParquetCompression = Literal["uncompressed", "snappy", "gzip", "lz4", "zstd", "brotli"]
+
+
+@dataclass(frozen=True)
+class ParquetWriteProfile:
+    """Settings for writing a resource's data to a Parquet file.
+
+    Use `ParquetWriteProfile.from_name()` to get one of the named profiles:
+
+    - `"balanced"`: Zstandard compression at a low level, with medium row
+      groups. A good fit for most resources and the default.
+    - `"fast-read"`: LZ4 compression and smaller row groups, sorted by the
+      primary key. Files are larger, but are quicker to decompress, and the
+      sorted, smaller row groups let filters and key lookups skip more data.
+    - `"small"`: Zstandard compression at a high level, with large row
+      groups. Files take the least space, but are slower to write.
+
+    Attributes:
+        compression: The compression codec used for the data pages.
+        compression_level: The compression level. Higher levels give smaller
+            files but take longer to write. Uses the codec's default if None.
+        row_group_size: The number of rows in each row group. Uses the Polars
+            default if None.
+        data_page_size: The size of each data page in bytes. Uses the Polars
+            default if None.
+        statistics: Whether to write the minimum, maximum, and null count of
+            each column in each row group. These are used to skip row groups
+            when filtering. Use `"full"` to also write the number of distinct
+            values.
+        sort_by_primary_key: Whether to sort the rows by the primary key
+            (`schema.primary_key`) before writing. Each row group then covers a
+            narrow range of keys, so `read_resource_data()` can skip most row
+            groups when looking up observational units by their `keys`.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        sp.ParquetWriteProfile.from_name("small", row_group_size=100_000)
+        ```
+    """
+
+    compression: ParquetCompression = "zstd"
+    compression_level: int | None = 3
+    row_group_size: int | None = 262_144
+    data_page_size: int | None = None
+    statistics: bool | Literal["full"] = True
+    sort_by_primary_key: bool = False
+
+    @classmethod
+    def from_name(cls, name: str, **overrides: Any) -> Self:
+        """Gets a named profile, with any settings overridden.
+
+        Args:
+            name: The name of the profile, one of `"balanced"`, `"fast-read"`,
+                and `"small"`.
+            **overrides: Settings to change in the named profile.
+
+        Returns:
+            The write profile.
+
+        Raises:
+            ValueError: If there is no profile with the given name.
+        """
+        profiles = {
+            "balanced": cls(),
+            "fast-read": cls(
+                compression="lz4",
+                compression_level=None,
+                row_group_size=131_072,
+                sort_by_primary_key=True,
+            ),
+            "small": cls(compression_level=19, row_group_size=1_048_576),
+        }
+        if name not in profiles:
+            raise ValueError(
+                f"There is no Parquet write profile named '{name}'. Use one of: "
+                f"{', '.join(profiles)}."
+            )
+        return replace(profiles[name], **overrides)
+
+
+def _get_write_profile(
+    write_profile: ParquetWriteProfile | str | None, data_path: Path
+) -> ParquetWriteProfile:
+    """Gets the profile to write the data file with.
+
+    Args:
+        write_profile: The profile, or the name of a profile. If None, the
+            profile recorded in the existing data file is used, or the
+            `"balanced"` profile if there is none.
+        data_path: The path to the data file that will be written.
+
+    Returns:
+        The write profile.
+    """
+    if isinstance(write_profile, ParquetWriteProfile):
+        return write_profile
+    if write_profile is not None:
+        return ParquetWriteProfile.from_name(write_profile)
+    return _read_write_profile(data_path) or ParquetWriteProfile.from_name("balanced")
+
+
+def _read_write_profile(data_path: Path) -> ParquetWriteProfile | None:
+    """Reads the write profile recorded in the metadata of a Parquet file.
+
+    For partitioned data, the profile is read from one of the data files.
+
+    Args:
+        data_path: The path to the Parquet file, or to the folder of
+            partitioned data files.
+
+    Returns:
+        The recorded write profile, or None if the file doesn't exist or has
+            no valid recorded profile.
+    """
+    if data_path.is_dir():
+        data_path = next(data_path.rglob("*.parquet"), data_path)
+    if not data_path.is_file():
+        return None
+    try:
+        metadata = pl.read_parquet_metadata(data_path)
+        return ParquetWriteProfile(**json.loads(metadata[_WRITE_PROFILE_METADATA_KEY]))
+    except (KeyError, TypeError, ValueError, pl.exceptions.PolarsError):
+        return None
+
+
+def _get_write_options(write_profile: ParquetWriteProfile) -> dict[str, Any]:
+    """Gets the arguments for Polars' Parquet writers from the profile.
+
+    The profile is also added to the key-value metadata of the file.
+
+    Args:
+        write_profile: The write profile.
+
+    Returns:
+        The keyword arguments for `write_parquet()` and `sink_parquet()`.
+    """
+    options = asdict(write_profile)
+    metadata = {_WRITE_PROFILE_METADATA_KEY: json.dumps(options)}
+    del options["sort_by_primary_key"]
+    return options | {"metadata": metadata}
+
+
+def _sort_by_primary_key[Frame: (pl.DataFrame, pl.LazyFrame)](
+    data: Frame,
+    write_profile: ParquetWriteProfile,
+    resource_properties: ResourceProperties,
+) -> Frame:
+    """Sorts the data by the primary key, if the profile asks for it.
+
+    Args:
+        data: The data to write.
+        write_profile: The write profile.
+        resource_properties: The properties with the primary key.
+
+    Returns:
+        The sorted data, or the data as is if the profile doesn't sort or
+            there is no primary key.
+    """
+    primary_key = cast(
+        list[str] | str | None,
+        _get_nested_attr(resource_properties, "schema.primary_key"),
+    )
+    if not write_profile.sort_by_primary_key or not primary_key:
+        return data
+    return data.sort(primary_key)
@@ -6,8 +6,12 @@ package. Specifically, they are used in the context of a data package stored in
 the working directory ("local" first approach).
 """
 
+from datetime import datetime
 from pathlib import Path
 
+import polars as pl
+
+from seedcase_sprout.batch_index import _get_batch_index
 from seedcase_sprout.internals import _create_resource_properties_script_filename
 
 
@@ -20,7 +24,9 @@ class PackagePath:
     within your data package.  These functions have these characteristics in
     common:
 
-    -   All of these functions output a `Path` object.
+    -   All of these functions output a `Path` object, except for
+        `resource_batch_files()` and `resource_batch_index()`, which output
+        all the batch files of a resource.
     -   The base class has an optional `path` argument that defaults to
         the current working directory available from the base class.
     -   If the wrong `resource_name` is given, an error message will include a
@@ -82,6 +88,28 @@ class PackagePath:
         """
         return self.resource(resource_name) / "data.parquet"
 
+    def resource_data_sidecar(self, resource_name: str) -> Path:
+        """Path to the specific resource's Arrow IPC copy of its data file.
+
+        Args:
+            resource_name: The name of the resource. Use
+                `ResourceProperties.name` to get the correct resource name.
+        """
+        return self.resource(resource_name) / "data.arrow"
+
+    def resource_partitioned_data(self, resource_name: str) -> Path:
+        """Path to the specific resource's partitioned `data/` folder.
+
+        Resources that are written with `partition_by` store their data in
+        this folder as `<field>=<value>/*.parquet` files, instead of in one
+        `data.parquet` file.
+
+        Args:
+            resource_name: The name of the resource. Use
+                `ResourceProperties.name` to get the correct resource name.
+        """
+        return self.resource(resource_name) / "data"
+
     def resource_batch(self, resource_name: str) -> Path:
         """Path to the specific resource's `batch/` folder.
 
@@ -94,11 +122,55 @@ class PackagePath:
     def resource_batch_files(self, resource_name: str) -> list[Path]:
         """Paths to all the files in the specific resource's `batch/` folder.
 
+        The paths are sorted by the timestamp in their file name, which is the
+        order in which they were created. They are taken from the cached index
+        of the folder, see `resource_batch_index()`.
+
+        Args:
+            resource_name: The name of the resource. Use
+                `ResourceProperties.name` to get the correct resource name.
+
+        Raises:
+            ValueError: If any of the batch file names don't contain a correct
+                timestamp.
+        """
+        return [Path(path) for path in self.resource_batch_index(resource_name)["path"]]
+
+    def resource_batch_index(
+        self,
+        resource_name: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pl.DataFrame:
+        """Index of the files in the specific resource's `batch/` folder.
+
+        The index has a `path` column with the path to each batch file and a
+        `timestamp` column with the timestamp from its file name, in UTC. It is
+        sorted by timestamp. The index is cached until a file is added to,
+        removed from, or renamed in the `batch/` folder.
+
+        Args:
+            resource_name: The name of the resource. Use
+                `ResourceProperties.name` to get the correct resource name.
+            start: Only include batch files with this timestamp or later.
+                Times without a time zone are taken to be in UTC.
+            end: Only include batch files with this timestamp or earlier.
+                Times without a time zone are taken to be in UTC.
+
+        Raises:
+            ValueError: If any of the batch file names don't contain a correct
+                timestamp.
+        """
+        return _get_batch_index(self.resource_batch(resource_name), start, end)
+
+    def resource_batch_manifest(self, resource_name: str) -> Path:
+        """Path to the manifest of batch files merged into the data file.
+
         Args:
             resource_name: The name of the resource. Use
                 `ResourceProperties.name` to get the correct resource name.
         """
-        return list(self.resource_batch(resource_name).glob("*.parquet"))
+        return self.resource(resource_name) / "batch-manifest.json"
 
     def properties_script(self) -> Path:
         """Path to the properties script."""
@@ -0,0 +1,338 @@
+"""Opt-in timing of the stages of Sprout's data pipeline.
+
+Each stage of reading, checking, joining, and writing a resource's data is
+wrapped in a span. When a callback has been added with
+`add_pipeline_span_callback()`, or while in `record_pipeline_spans()`, each
+span is timed and passed to the callbacks as a `PipelineSpan` when the stage
+finishes. The spans also record the number of rows and bytes handled in the
+stage and, if asked for, the peak memory of the process during the stage.
+
+Without any callbacks, entering a span returns a shared object that does
+nothing, so the stages aren't timed and the rows, bytes, and memory aren't
+measured.
+"""
+
+import mmap
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import NamedTuple, Self
+
+import polars as pl
+
+
+class PipelineSpan(NamedTuple):
+    """The time and size of a stage of the data pipeline.
+
+    Attributes:
+        name: The name of the stage, e.g., `"join_resource_batches.concat"`.
+            Stages within a function are named after the function, followed
+            by a dot and the name of the stage.
+        seconds: How long the stage took.
+        rows: The number of rows handled in the stage, or None if it isn't
+            known, e.g., for a LazyFrame.
+        bytes: The size of the files read or written in the stage, or else the
+            estimated size of the data in memory. None if it isn't known.
+        peak_memory_bytes: The highest resident memory of the process during
+            the stage, if memory is tracked. Only available on Linux.
+    """
+
+    name: str
+    seconds: float
+    rows: int | None
+    bytes: int | None
+    peak_memory_bytes: int | None
+
+
+type PipelineSpanCallback = Callable[[PipelineSpan], object]
+
+
+class _Spans:
+    """The callbacks that receive the finished spans.
+
+    The callbacks are kept in a tuple that is replaced when a callback is
+    added or removed, so spans can be finished from several threads at once
+    without a lock.
+    """
+
+    def __init__(self) -> None:
+        """Create the spans without any callbacks."""
+        self.callbacks: tuple[tuple[PipelineSpanCallback, bool], ...] = ()
+        self.track_memory = False
+        self.lock = Lock()
+
+    def add(self, callback: PipelineSpanCallback, track_memory: bool) -> None:
+        """Add a callback, and whether it needs the memory to be tracked."""
+        with self.lock:
+            self._set_callbacks((*self.callbacks, (callback, track_memory)))
+
+    def remove(self, callback: PipelineSpanCallback) -> None:
+        """Remove the first registration of the callback, if any."""
+        with self.lock:
+            callbacks = list(self.callbacks)
+            for index, (added_callback, _) in enumerate(callbacks):
+                if added_callback == callback:
+                    del callbacks[index]
+                    break
+            self._set_callbacks(tuple(callbacks))
+
+    def emit(self, span: PipelineSpan) -> None:
+        """Pass the finished span to all callbacks."""
+        for callback, _ in self.callbacks:
+            callback(span)
+
+    def _set_callbacks(
+        self, callbacks: tuple[tuple[PipelineSpanCallback, bool], ...]
+    ) -> None:
+        self.track_memory = any(track_memory for _, track_memory in callbacks)
+        self.callbacks = callbacks
+
+
+_spans = _Spans()
+
+
+def add_pipeline_span_callback(
+    callback: PipelineSpanCallback, track_memory: bool = False
+) -> PipelineSpanCallback:
+    """Call a function with the time and size of each stage of the pipeline.
+
+    Use this function to see where the time goes when reading, checking,
+    joining, or writing a resource's data, e.g., in `read_resource_batches()`,
+    `check_data()`, `join_resource_batches()`, and `write_resource_data()`.
+    Once added, the `callback` is called with a `PipelineSpan` each time a
+    stage finishes. Stages that raise an error aren't passed to the callback.
+
+    The callback may be called from several threads at once, e.g., when
+    `read_resource_batches()` reads files in parallel, and it is called before
+    the rest of the pipeline continues, so it should be quick.
+
+    Args:
+        callback: The function to call with each finished span.
+        track_memory: Whether to track the peak memory of the process during
+            each stage. This checks the memory every few milliseconds in a
+            separate thread while a stage runs, so it adds a little time to
+            each stage. Defaults to False.
+
+    Returns:
+        The `callback`, so it can be removed with
+            `remove_pipeline_span_callback()`.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        callback = sp.add_pipeline_span_callback(print)
+        sp.check_data(sp.example_data(), sp.example_resource_properties())
+        sp.remove_pipeline_span_callback(callback)
+        ```
+    """
+    _spans.add(callback, track_memory)
+    return callback
+
+
+def remove_pipeline_span_callback(callback: PipelineSpanCallback) -> None:
+    """Stop calling a function added by `add_pipeline_span_callback()`.
+
+    Once no callbacks are left, the stages aren't timed anymore.
+
+    Args:
+        callback: The function to remove. Nothing happens if it wasn't added.
+    """
+    _spans.remove(callback)
+
+
+@contextmanager
+def record_pipeline_spans(track_memory: bool = False) -> Iterator[list[PipelineSpan]]:
+    """Record the time and size of each stage of the pipeline within the context.
+
+    This is a shorter way of adding a callback with
+    `add_pipeline_span_callback()` that collects the spans into a list, and
+    removing it again at the end of the context.
+
+    Args:
+        track_memory: Whether to track the peak memory of the process during
+            each stage. Defaults to False.
+
+    Yields:
+        The list that the finished spans are added to, in the order they
+            finished.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.record_pipeline_spans() as spans:
+            sp.check_data(sp.example_data(), sp.example_resource_properties())
+        spans
+        ```
+    """
+    spans: list[PipelineSpan] = []
+    callback = spans.append
+    _spans.add(callback, track_memory)
+    try:
+        yield spans
+    finally:
+        _spans.remove(callback)
+
+
+class _Span:
+    """A stage of the pipeline that is being timed.
+
+    Use as a context manager around the stage. The rows and bytes are added
+    within the stage, and the span is passed to the callbacks when the
+    context exits without an error.
+    """
+
+    __slots__ = ("_memory", "_start", "bytes", "name", "rows")
+
+    def __init__(self, name: str, track_memory: bool) -> None:
+        """Create the span for the stage with the name."""
+        self.name = name
+        self.rows: int | None = None
+        self.bytes: int | None = None
+        self._memory = _PeakMemory() if track_memory else None
+        self._start = 0.0
+
+    def __enter__(self) -> Self:
+        """Start timing the stage."""
+        if self._memory is not None:
+            self._memory.start()
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, error_type: type[BaseException] | None, *_: object) -> None:
+        """Stop timing the stage and pass the span to the callbacks."""
+        seconds = perf_counter() - self._start
+        peak_memory_bytes = None
+        if self._memory is not None:
+            peak_memory_bytes = self._memory.stop()
+        if error_type is None:
+            _spans.emit(
+                PipelineSpan(
+                    self.name, seconds, self.rows, self.bytes, peak_memory_bytes
+                )
+            )
+
+    def add_data[Data: (pl.DataFrame, pl.LazyFrame)](self, data: Data) -> Data:
+        """Add the rows and estimated size of a DataFrame to the span.
+
+        Nothing is added for a LazyFrame, as its size isn't known without
+        reading the data.
+        """
+        if isinstance(data, pl.DataFrame):
+            self.rows = (self.rows or 0) + data.height
+            self.bytes = (self.bytes or 0) + data.estimated_size()
+        return data
+
+    def add_rows[Data: (pl.DataFrame, pl.LazyFrame)](self, data: Data) -> Data:
+        """Add the rows of a DataFrame to the span, but not its size."""
+        if isinstance(data, pl.DataFrame):
+            self.rows = (self.rows or 0) + data.height
+        return data
+
+    def add_file(self, path: Path) -> Path:
+        """Add the size of a file, or of all files in a folder, to the span."""
+        paths = path.rglob("*") if path.is_dir() else [path]
+        self.bytes = (self.bytes or 0) + sum(
+            file.stat().st_size for file in paths if file.is_file()
+        )
+        return path
+
+
+class _NoSpan:
+    """A span that does nothing, used when no callbacks have been added."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        """Do nothing."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Do nothing."""
+
+    def add_data[Data: (pl.DataFrame, pl.LazyFrame)](self, data: Data) -> Data:
+        """Do nothing and return the data."""
+        return data
+
+    def add_rows[Data: (pl.DataFrame, pl.LazyFrame)](self, data: Data) -> Data:
+        """Do nothing and return the data."""
+        return data
+
+    def add_file(self, path: Path) -> Path:
+        """Do nothing and return the path."""
+        return path
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _span(name: str) -> _Span | _NoSpan:
+    """Creates a span for a stage of the pipeline.
+
+    Args:
+        name: The name of the stage.
+
+    Returns:
+        A span that times the stage if any callbacks have been added, or else
+            a span that does nothing.
+    """
+    if not _spans.callbacks:
+        return _NO_SPAN
+    return _Span(name, _spans.track_memory)
+
+
+# How often the memory of the process is checked, in seconds.
+_MEMORY_INTERVAL = 0.005
+
+
+class _PeakMemory:
+    """Tracks the peak resident memory of the process in a separate thread.
+
+    The memory is read from `/proc/self/statm`, so it is only tracked on
+    Linux. On other systems, the peak is None.
+    """
+
+    __slots__ = ("_stop", "_thread", "peak")
+
+    def __init__(self) -> None:
+        """Create the tracker."""
+        self.peak: int | None = None
+        self._stop = Event()
+        self._thread = Thread(target=self._track, daemon=True)
+
+    def start(self) -> None:
+        """Start tracking the memory."""
+        self.peak = _current_memory()
+        if self.peak is not None:
+            self._thread.start()
+
+    def stop(self) -> int | None:
+        """Stop tracking the memory and get the peak."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._update()
+        return self.peak
+
+    def _track(self) -> None:
+        """Check the memory until stopped."""
+        while not self._stop.wait(_MEMORY_INTERVAL):
+            self._update()
+
+    def _update(self) -> None:
+        """Update the peak with the current memory."""
+        memory = _current_memory()
+        if memory is not None and self.peak is not None:
+            self.peak = max(self.peak, memory)
+
+
+def _current_memory() -> int | None:
+    """Gets the resident memory of the process in bytes, if available."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * mmap.PAGESIZE
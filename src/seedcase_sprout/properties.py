@@ -379,12 +379,15 @@ class ResourceProperties(BaseProperties):
     schema: TableSchemaProperties | None = None
 
     def __post_init__(self) -> None:
-        """Generates the path from the resource name after object creation."""
-        self.path = (
-            _create_resource_data_path(str(self.name))
-            if _is_resource_name_correct(self.name)
-            else None
-        )
+        """Generates the path from the resource name after object creation.
+
+        A path to the folder of partitioned data is kept, so the layout set by
+        `write_resource_data()` stays when the properties are read again.
+        """
+        if not _is_resource_name_correct(self.name):
+            self.path = None
+        elif self.path != _create_resource_data_path(str(self.name), partitioned=True):
+            self.path = _create_resource_data_path(str(self.name))
 
 
 @dataclass
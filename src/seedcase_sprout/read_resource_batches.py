@@ -1,26 +1,27 @@
-import re
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import cast
 
 import polars as pl
 from seedcase_soil import fmap, pairwise_fmap
 
-from seedcase_sprout.check_data import check_data
-from seedcase_sprout.check_properties import (
-    check_resource_properties,
-)
-from seedcase_sprout.constants import (
-    BATCH_TIMESTAMP_COLUMN_NAME,
-    BATCH_TIMESTAMP_FORMAT,
-    BATCH_TIMESTAMP_PATTERN,
+from seedcase_sprout.batch_index import (
+    _create_batch_timestamp_column,
+    _extract_batch_file_timestamps,
 )
+from seedcase_sprout.check_data import DataChecker
+from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.data_cache import _data_cache
 from seedcase_sprout.internals import _check_is_file
 from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.pipeline_spans import _span
 from seedcase_sprout.properties import ResourceProperties
 
 
 def read_resource_batches(
-    resource_properties: ResourceProperties, paths: list[Path] | None = None
+    resource_properties: ResourceProperties,
+    paths: list[Path] | None = None,
+    max_workers: int = 1,
 ) -> list[pl.DataFrame]:
     """Read all batch resource file(s) into a list of DataFrames.
 
@@ -32,6 +33,10 @@ def read_resource_batches(
     correctly structured and tidy, this function still runs checks to ensure
     the data are correct by comparing to the properties.
 
+    If the data cache has been enabled with `enable_data_cache()`, batch files
+    that have been read before, and haven't changed since, are taken from the
+    cache. They are still checked against the `resource_properties`.
+
     Args:
         resource_properties: The `ResourceProperties` object that contains the
             properties of the resource you want to check the data against.
@@ -39,83 +44,187 @@ def read_resource_batches(
             `batch/` folder. Use `PackagePath().resource_batch_files()` to help
             provide the correct paths to the batch files. Defaults to the batch
             files of the given resource.
+        max_workers: The number of batch files to read at the same time. When
+            more than 1, the files are read in parallel threads, which speeds
+            up reading many files on fast or networked storage. The DataFrames
+            are always returned in the same order as `paths`. Defaults to 1.
 
     Returns:
         A list of DataFrame objects from all the batch files.
 
     Raises:
-        ValueError: If the batch file name is not in the expected pattern.
+        ValueError: If any of the batch file names don't contain a correct
+            timestamp. This is checked for all batch files before any data is
+            read.
         ValueError: If the timestamp column name matches an existing column in
             the DataFrame.
+        ExceptionGroup: If the column names or types of any of the batch files
+            don't match the `resource_properties`. This is checked for all
+            batch files before any data is read.
+        ExceptionGroup: If `max_workers` is more than 1 and any of the batch
+            files fail to be read or checked. The group contains the error for
+            each of the failing batch files.
     """
-    check_resource_properties(resource_properties)
-    if paths is None:
-        paths = PackagePath().resource_batch_files(str(resource_properties.name))
+    with _span("read_resource_batches") as span:
+        checker = DataChecker(resource_properties)
+        if paths is None:
+            paths = PackagePath().resource_batch_files(str(resource_properties.name))
 
-    fmap(paths, _check_is_file)
-    return pairwise_fmap(paths, [resource_properties], _read_parquet_batch_file)
+        fmap(paths, _check_is_file)
+        timestamps = _extract_batch_file_timestamps(paths).to_list()
+        with _span("read_resource_batches.check_schemas"):
+            _check_batch_file_schemas(paths, checker)
+        if max_workers > 1:
+            data_list = _read_parquet_batch_files_in_parallel(
+                paths, timestamps, checker, max_workers
+            )
+        else:
+            data_list = [
+                _read_parquet_batch_file(path, timestamp, checker)
+                for path, timestamp in zip(paths, timestamps)
+            ]
+        return fmap(data_list, span.add_data)
 
 
-def _read_parquet_batch_file(
-    path: Path, resource_properties: ResourceProperties
-) -> pl.DataFrame:
-    """Reads a Parquet batch file and adds the timestamp as a column.
+def _check_batch_file_schemas(paths: list[Path], checker: DataChecker) -> list[Path]:
+    """Checks the schema of all batch files against the properties.
 
-    This function reads a Parquet batch file into a Polars DataFrame and adds a
-    timestamp column to the DataFrame, extracted from the file name.
+    Only the footer of each Parquet file is read, so the schemas can be checked
+    without reading any data. All batch files are checked before raising, so
+    every batch file with incorrect column names or types is reported.
 
     Args:
-        path: Path to the Parquet batch file.
-        resource_properties: The resource properties to check the data against.
+        paths: Paths to the Parquet batch files.
+        checker: The checker for the resource properties to check the schemas
+            against.
 
     Returns:
-        The Parquet file as a DataFrame with a timestamp column added.
+        The paths, if the schemas of all batch files are correct.
+
+    Raises:
+        ValueError: If a batch file doesn't have a `.parquet` extension.
+        ExceptionGroup: If the schema of any of the batch files doesn't match
+            the properties. The group contains the error for each of the
+            failing batch files.
     """
-    if path.suffix != ".parquet":
-        raise ValueError(
-            "Failed to read batch file. Expected a file with a "
-            f"`.parquet` extension but found {path}."
+    errors = [
+        error
+        for error in pairwise_fmap(paths, [checker], _get_batch_file_schema_error)
+        if error is not None
+    ]
+    if errors:
+        raise ExceptionGroup(
+            f"The schemas of {len(errors)} of the {len(paths)} batch files don't "
+            "match the resource properties:",
+            errors,
         )
-    data = pl.read_parquet(path)
-    check_data(data, resource_properties)
+    return paths
+
+
+def _get_batch_file_schema_error(path: Path, checker: DataChecker) -> Exception | None:
+    """Checks the schema in the footer of a Parquet batch file.
+
+    Args:
+        path: Path to the Parquet batch file.
+        checker: The checker for the resource properties to check the schema
+            against.
 
-    timestamp = _extract_timestamp_from_batch_file_path(path)
-    _check_batch_file_timestamp(timestamp)
-    data = _add_timestamp_as_column(data, timestamp)
-    return data
+    Returns:
+        The error, noting the batch file's path, or None if the schema is
+            correct.
+    """
+    _check_is_parquet_file(path)
+    try:
+        checker.check_schema(pl.Schema(pl.read_parquet_schema(path)))
+    except (ValueError, ExceptionGroup) as error:
+        error.add_note(f"Batch file: {path}")
+        return error
+    return None
+
+
+def _read_parquet_batch_files_in_parallel(
+    paths: list[Path], timestamps: list[str], checker: DataChecker, max_workers: int
+) -> list[pl.DataFrame]:
+    """Reads the Parquet batch files in parallel threads.
 
+    Polars releases the GIL while reading and decoding files, so opening and
+    decoding of multiple files overlaps when using threads. All files are read
+    before any errors are raised, so the errors of every failing file are
+    reported together.
 
-def _extract_timestamp_from_batch_file_path(path: Path) -> str:
-    """Extracts the timestamp from the file name.
+    Args:
+        paths: Paths to the Parquet batch files.
+        timestamps: The timestamps from the names of the batch files, in the
+            same order as `paths`.
+        checker: The checker for the resource properties to check the data
+            against.
+        max_workers: The maximum number of threads to use.
 
-    Since the batch file name has been created by `_create_batch_file_name()`,
-    it should contain a timestamp in the format defined by
-    BATCH_TIMESTAMP_PATTERN.
+    Returns:
+        The Parquet files as DataFrames, in the same order as `paths`.
 
-    If multiple timestamps are found in the file name, the first one is used.
+    Raises:
+        ExceptionGroup: If any of the batch files fail to be read or checked.
     """
-    timestamp_list: list[str] = re.findall(BATCH_TIMESTAMP_PATTERN, path.stem)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_read_parquet_batch_file, path, timestamp, checker)
+            for path, timestamp in zip(paths, timestamps)
+        ]
 
-    if not timestamp_list:
-        raise ValueError(
-            f"Batch file name '{path.stem}' does not contain a timestamp in the "
-            f"expected format '{BATCH_TIMESTAMP_PATTERN}'."
+    errors = [
+        _add_batch_file_note(future, path)
+        for future, path in zip(futures, paths)
+        if future.exception() is not None
+    ]
+    if errors:
+        raise ExceptionGroup(
+            f"Failed to read {len(errors)} of the {len(paths)} batch files:", errors
         )
 
-    return timestamp_list[0]
+    return [future.result() for future in futures]
 
 
-def _check_batch_file_timestamp(timestamp: str) -> str:
-    """Checks the timestamp format and that it is a correct calendar date."""
-    try:
-        datetime.strptime(timestamp, BATCH_TIMESTAMP_FORMAT).astimezone()
-        return timestamp
-    except ValueError as error:
+def _add_batch_file_note(future: Future[pl.DataFrame], path: Path) -> Exception:
+    """Gets the error from a failed batch file read, noting the file's path."""
+    error = cast(Exception, future.exception())
+    error.add_note(f"Batch file: {path}")
+    return error
+
+
+def _read_parquet_batch_file(
+    path: Path, timestamp: str, checker: DataChecker
+) -> pl.DataFrame:
+    """Reads a Parquet batch file and adds the timestamp as a column.
+
+    This function reads a Parquet batch file into a Polars DataFrame and adds a
+    timestamp column to the DataFrame, with the timestamp from the file name.
+
+    Args:
+        path: Path to the Parquet batch file.
+        timestamp: The timestamp from the batch file name.
+        checker: The checker for the resource properties to check the data
+            against.
+
+    Returns:
+        The Parquet file as a DataFrame with a timestamp column added.
+    """
+    _check_is_parquet_file(path)
+    with _span("read_resource_batches.read_parquet") as span:
+        data = span.add_rows(_data_cache.read(path, lambda: pl.read_parquet(path)))
+        span.add_file(path)
+    checker.check(data)
+    return _add_timestamp_as_column(data, timestamp)
+
+
+def _check_is_parquet_file(path: Path) -> Path:
+    """Checks that the batch file has a `.parquet` extension."""
+    if path.suffix != ".parquet":
         raise ValueError(
-            f"Timestamp '{timestamp}' in the batch file name is not in the "
-            f"expected format '{BATCH_TIMESTAMP_FORMAT}' or is not a correct calendar "
-            "date (e.g., 30 February)."
-        ) from error
+            "Failed to read batch file. Expected a file with a "
+            f"`.parquet` extension but found {path}."
+        )
+    return path
 
 
 def _add_timestamp_as_column(data: pl.DataFrame, timestamp: str) -> pl.DataFrame:
@@ -123,7 +232,8 @@ def _add_timestamp_as_column(data: pl.DataFrame, timestamp: str) -> pl.DataFrame
 
     Args:
         data: Data to add timestamp column to.
-        timestamp: Timestamp to add as values in the timestamp column.
+        timestamp: Timestamp to add as values in the timestamp column. It is
+            stored as a Datetime in UTC.
 
     Returns:
         Data with added timestamp column.
@@ -143,4 +253,4 @@ def _add_timestamp_as_column(data: pl.DataFrame, timestamp: str) -> pl.DataFrame
             "rename it in the batch files and resource properties to read the resource "
             "batches."
         )
-    return data.with_columns(pl.lit(timestamp).alias(BATCH_TIMESTAMP_COLUMN_NAME))
+    return data.with_columns(_create_batch_timestamp_column(timestamp))
@@ -1,19 +1,42 @@
 from pathlib import Path
+from typing import Any
 
 import polars as pl
 
+from seedcase_sprout.data_cache import _data_cache
 from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.scan_resource_data import scan_resource_data
 
 
 def read_resource_data(
     resource_name: str,
     path: Path | None = None,
+    keys: pl.DataFrame | dict[str, list[Any]] | None = None,
+    columns: list[str] | None = None,
+    filter: pl.Expr | None = None,
+    n_rows: int | None = None,
 ) -> pl.DataFrame:
     """Read the resource's `data.parquet` file.
 
     Use this function to read in the data file for a specific resource in a
     data package as a Polars DataFrame.
 
+    Use `columns`, `filter`, and `n_rows` to only read the part of the data
+    that you need. These are applied while the file is read, so only the
+    selected columns are read, row groups that can't match the `filter` are
+    skipped, and reading stops after `n_rows` rows. For more complex queries,
+    use `scan_resource_data()`.
+
+    When reading all of the data, the data cache is used if it has been
+    enabled with `enable_data_cache()`.
+
+    Use `keys` to only read the rows of specific observational units, e.g., the
+    records of one participant. The file is then filtered while it is read,
+    using the minimum and maximum values stored for each row group, so row
+    groups that can't contain any of the `keys` are skipped. This works best
+    when the data is sorted by the key, e.g., when it was written with a
+    `ParquetWriteProfile` with `sort_by_primary_key=True`.
+
     Args:
         resource_name: The name of the resource. This should match the name
             found in the `datapackage.json` file under the `resource.name` key
@@ -22,6 +45,16 @@ def read_resource_data(
             file is located. If not provided, it defaults to the current
             working directory. Use `PackagePath().properties()` to help get the
             correct path.
+        keys: The values of the key fields of the rows to read, as a DataFrame
+            or a dictionary with a list of values per field. Each row of `keys`
+            is one combination of values to look up. Defaults to reading all
+            rows.
+        columns: The names of the columns to read. Defaults to all columns.
+        filter: A Polars expression that the rows to read must match, e.g.,
+            `pl.col("date") >= date(2025, 1, 1)`. It can use columns that
+            aren't in `columns`. Defaults to reading all rows.
+        n_rows: The maximum number of rows to read, after applying `keys` and
+            `filter`. Defaults to reading all rows.
 
     Returns:
         A Polars DataFrame containing the data from the resource's data file.
@@ -38,11 +71,66 @@ def read_resource_data(
             print(data)
         ```
     """
-    data_path = PackagePath(path).resource_data(resource_name)
-    if not data_path.is_file():
-        raise FileNotFoundError(
-            f"Resource '{resource_name}' not found in the package, so we couldn't",
-            "read the data.",
-        )
+    data = scan_resource_data(resource_name, path)
+    if keys is None and filter is None and columns is None and n_rows is None:
+        return _data_cache.read(_get_cache_path(resource_name, path), data.collect)
+
+    if keys is not None:
+        data = _filter_by_keys(data, pl.DataFrame(keys))
+    if filter is not None:
+        data = data.filter(filter)
+    if columns is not None:
+        data = data.select(columns)
+    if n_rows is not None:
+        data = data.head(n_rows)
+
+    return data.collect()
 
-    return pl.read_parquet(data_path)
+
+def _get_cache_path(resource_name: str, path: Path | None) -> Path:
+    """Gets the path that identifies the resource's data in the data cache.
+
+    Args:
+        resource_name: The name of the resource.
+        path: The path to the data package folder.
+
+    Returns:
+        The path to the folder of partitioned data files, if the data is
+            partitioned, otherwise the path to the `data.parquet` file.
+    """
+    package_path = PackagePath(path)
+    partitioned_data_path = package_path.resource_partitioned_data(resource_name)
+    if partitioned_data_path.is_dir():
+        return partitioned_data_path
+    return package_path.resource_data(resource_name)
+
+
+def _filter_by_keys(data: pl.LazyFrame, keys: pl.DataFrame) -> pl.LazyFrame:
+    """Filters the data to the rows matching any of the keys.
+
+    The range and values of each key field are added as filters that can be
+    checked against the row group statistics, so non-matching row groups are
+    skipped when the data is read. When there is more than one key field, the
+    exact combinations of values are then matched with a semi join.
+
+    Args:
+        data: The data to filter.
+        keys: The values of the key fields to keep.
+
+    Returns:
+        The filtered data.
+    """
+    schema = data.collect_schema()
+    keys = keys.cast({name: schema[name] for name in keys.columns})
+    keys = keys.drop_nulls().unique()
+    data = data.filter(
+        pl.col(name).is_between(
+            pl.lit(keys[name].min(), dtype=keys[name].dtype),
+            pl.lit(keys[name].max(), dtype=keys[name].dtype),
+        )
+        & pl.col(name).is_in(pl.lit(keys[name]).implode())
+        for name in keys.columns
+    )
+    if keys.width > 1:
+        data = data.join(keys.lazy(), on=keys.columns, how="semi")
+    return data
@@ -0,0 +1,212 @@
+import shutil
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.batch_manifest import (
+    _create_batch_manifest,
+    _write_batch_manifest,
+)
+from seedcase_sprout.check_data import DataChecker
+from seedcase_sprout.check_keys import check_keys
+from seedcase_sprout.check_properties import check_resource_properties
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.ipc_sidecar import _remove_ipc_sidecar
+from seedcase_sprout.join_resource_batches import _stream_latest_obs_units
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _get_write_options,
+    _get_write_profile,
+    _sort_by_primary_key,
+)
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+from seedcase_sprout.write_resource_data import _get_partition_field
+
+
+def rebuild_resource_data(
+    resource_properties: ResourceProperties,
+    package_path: Path | None = None,
+    chunk_size: int | None = None,
+    write_profile: ParquetWriteProfile | str | None = None,
+) -> Path:
+    """Rebuild the resource's `data.parquet` file from its batch files.
+
+    This function gives the same data file as running `read_resource_batches()`,
+    `join_resource_batches()`, and `write_resource_data()` one after the other,
+    but runs on the streaming engine. The batch files are scanned twice: first only
+    the primary key of each row, to find the latest version of each
+    observational unit, and then all the rows, which are written straight to
+    the `data.parquet` file if they are the latest version. This way, only
+    the keys are held in memory rather than all the data, so use this
+    function to rebuild resources that are larger than the available memory.
+    Writing with the `"fast-read"` write profile is the exception, as sorting
+    the rows by the primary key needs all the data in memory. So is rebuilding
+    partitioned data, since the latest observational units are collected into
+    memory before they are written to the partitions.
+
+    As with `join_resource_batches()`, only the most recent observational unit
+    is kept when there are duplicates, based on the timestamp of the batch
+    file. The schema of each batch file is checked against the
+    `resource_properties` before any data is read. The rebuilt data is checked
+    with `check_data()` and its keys with `check_keys()` before it replaces
+    the existing `data.parquet` file, so it is only replaced by data that
+    meets all the constraints in the `resource_properties`.
+
+    The batch files used to build the data file are recorded in the resource's
+    `batch-manifest.json` file, so that `update_resource_data()` can later add
+    only the new batch files.
+
+    The data is rebuilt in the layout recorded in the `path` of the
+    `resource_properties`. If the data was partitioned with
+    `write_resource_data()`, it is partitioned by the same field again.
+    Otherwise, it is rebuilt as a single `data.parquet` file, which replaces
+    any partitioned data.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource you want to rebuild the data for.
+        package_path: The path to the data package root folder (where
+            `datapackage.json` is located). Defaults to the current working
+            directory.
+        chunk_size: The number of rows the streaming engine processes at a
+            time. Lower values reduce the peak memory used while rebuilding,
+            at the cost of speed. Defaults to the Polars default. Note that
+            dropping duplicates needs to keep track of every observational
+            unit, so memory use still grows with the number of unique keys.
+        write_profile: The settings to write the Parquet file with. See
+            `write_resource_data()` for more details.
+
+    Returns:
+        The path of the rebuilt Parquet file, or of the folder with the
+            partitioned data files.
+
+    Raises:
+        ValueError: If there are no batch files for the resource.
+        ValueError: If the `path` of the `resource_properties` is set to
+            partitioned data, but there is no partitioned data to get the
+            partition field from.
+        ExceptionGroup[ValueError]: If values in the rebuilt data don't meet
+            the constraints in the `resource_properties`.
+        ExceptionGroup[ValueError]: If the primary key of the rebuilt data has
+            missing values or the unique keys aren't unique.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            batch_path = sp.PackagePath().resource_batch("example-resource")
+            batch_path.mkdir()
+            sp.example_data().write_parquet(
+                batch_path / "2025-03-26T100346Z-example.parquet"
+            )
+            sp.rebuild_resource_data(sp.example_resource_properties())
+        ```
+    """
+    check_resource_properties(resource_properties)
+    resource_name = str(resource_properties.name)
+    package_path_object = PackagePath(package_path)
+
+    batch_paths = package_path_object.resource_batch_files(resource_name)
+    data = scan_resource_batches(resource_properties, batch_paths)
+    primary_key = _get_nested_attr(resource_properties, "schema.primary_key")
+    data = _stream_latest_obs_units(data, primary_key)
+
+    partition_by = _get_partition_field(resource_properties, package_path_object)
+    data_path = _sink_resource_data(
+        data,
+        package_path_object,
+        resource_properties,
+        chunk_size,
+        write_profile,
+        partition_by,
+    )
+    _write_batch_manifest(
+        _create_batch_manifest(batch_paths),
+        package_path_object.resource_batch_manifest(resource_name),
+    )
+    return data_path
+
+
+def _sink_resource_data(
+    data: pl.LazyFrame,
+    package_path: PackagePath,
+    resource_properties: ResourceProperties,
+    chunk_size: int | None,
+    write_profile: ParquetWriteProfile | str | None,
+    partition_by: str | None,
+) -> Path:
+    """Runs the query on the streaming engine and writes it to the data file.
+
+    The data is written to a temporary file first, which then replaces the data
+    file once its values and keys have been checked. This way, a failed query
+    or check keeps the old data file, and the query can also read from the
+    data file it replaces. Partitioned data is collected into memory and
+    written to a temporary folder in the same way, as Polars can only write
+    partitions on the streaming engine with an unstable API. Any Arrow IPC
+    sidecar of the old data file is removed, as it no longer has the same data.
+
+    Args:
+        data: The query to write to the data file.
+        package_path: The path to the data package.
+        resource_properties: The properties to check the data against.
+        chunk_size: The number of rows the streaming engine processes at a
+            time. Uses the Polars default if None.
+        write_profile: The settings to write the data file with. Uses the
+            settings recorded in the existing data file if None.
+        partition_by: The field to partition the data by, or None to write a
+            single `data.parquet` file.
+
+    Returns:
+        The path to the data file, or to the folder of partitioned data.
+    """
+    resource_name = str(resource_properties.name)
+    data_path = package_path.resource_data(resource_name)
+    partitioned_data_path = package_path.resource_partitioned_data(resource_name)
+    write_profile = _get_write_profile(
+        write_profile,
+        partitioned_data_path if partitioned_data_path.is_dir() else data_path,
+    )
+    data = _sort_by_primary_key(data, write_profile, resource_properties)
+    write_options = _get_write_options(write_profile)
+
+    if partition_by is None:
+        temporary_path = data_path.with_suffix(".parquet.tmp")
+    else:
+        temporary_path = partitioned_data_path.with_suffix(".tmp")
+        shutil.rmtree(temporary_path, ignore_errors=True)
+    try:
+        with pl.Config() as config:
+            if chunk_size is not None:
+                config.set_streaming_chunk_size(chunk_size)
+            if partition_by is None:
+                data.sink_parquet(temporary_path, engine="streaming", **write_options)
+            else:
+                data.collect(engine="streaming").write_parquet(
+                    temporary_path, partition_by=partition_by, **write_options
+                )
+            written_data = pl.scan_parquet(
+                temporary_path, hive_partitioning=partition_by is not None
+            )
+            DataChecker(resource_properties).check(written_data)
+            check_keys(written_data, resource_properties)
+    except BaseException:
+        _remove_path(temporary_path)
+        raise
+
+    _remove_ipc_sidecar(package_path.resource_data_sidecar(resource_name))
+    shutil.rmtree(partitioned_data_path, ignore_errors=True)
+    if partition_by is None:
+        return temporary_path.replace(data_path)
+    data_path.unlink(missing_ok=True)
+    return temporary_path.rename(partitioned_data_path)
+
+
+def _remove_path(path: Path) -> None:
+    """Removes the file or folder at the path, if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import cast
+
+import polars as pl
+from seedcase_soil import fmap, pairwise_fmap
+
+from seedcase_sprout.batch_index import (
+    _create_batch_timestamp_column,
+    _extract_batch_file_timestamps,
+)
+from seedcase_sprout.check_data import DataChecker
+from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.internals import _check_is_file, _get_nested_attr
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import FieldProperties, ResourceProperties
+from seedcase_sprout.read_resource_batches import _check_batch_file_schemas
+
+
+def scan_resource_batches(
+    resource_properties: ResourceProperties, paths: list[Path] | None = None
+) -> pl.LazyFrame:
+    """Lazily scan all batch resource file(s) into one LazyFrame.
+
+    Use this function instead of `read_resource_batches()` when the batch files
+    are too large to read into memory all at once. No data is read when
+    calling this function. Only the Parquet footers are read, to check that the
+    schema of all batch files matches the `resource_properties`. The timestamp
+    of each batch file is added as a Datetime column in UTC, taken from the
+    file name, so that later steps can drop duplicate observational units
+    across batches.
+
+    Because the result is a Polars LazyFrame, any column selections or filters
+    applied to it are pushed down to the Parquet files when the data is finally
+    collected.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource you want to check the data against.
+        paths: A list of paths for all the Parquet files in the resource's
+            `batch/` folder. Use `PackagePath().resource_batch_files()` to help
+            provide the correct paths to the batch files. Defaults to the batch
+            files of the given resource.
+
+    Returns:
+        A single LazyFrame over all the batch files, including the timestamp
+            column.
+
+    Raises:
+        ValueError: If there are no batch files to scan.
+        ValueError: If the batch file name is not in the expected pattern.
+        ValueError: If the timestamp column name matches a field in the
+            `resource_properties`.
+        ExceptionGroup: If the column names or types of any of the batch files
+            don't match the `resource_properties`.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            batch_path = sp.PackagePath().resource_batch("example-resource")
+            batch_path.mkdir()
+            sp.example_data().write_parquet(
+                batch_path / "2025-03-26T100346Z-example.parquet"
+            )
+            data = sp.scan_resource_batches(sp.example_resource_properties())
+            print(data.collect())
+        ```
+    """
+    checker = DataChecker(resource_properties)
+    if paths is None:
+        paths = PackagePath().resource_batch_files(str(resource_properties.name))
+
+    if paths == []:
+        raise ValueError(
+            "Could not scan resource batches because no batch files were found for "
+            f"the resource '{resource_properties.name}'. The batch folder for the "
+            "resource may be empty."
+        )
+
+    _check_no_timestamp_field(resource_properties)
+    fmap(paths, _check_is_file)
+    timestamps = _extract_batch_file_timestamps(paths).to_list()
+    _check_batch_file_schemas(paths, checker)
+    return pl.concat(
+        pairwise_fmap(paths, timestamps, _scan_parquet_batch_file), how="vertical"
+    )
+
+
+def _check_no_timestamp_field(
+    resource_properties: ResourceProperties,
+) -> ResourceProperties:
+    """Checks that no field has the name of the internal timestamp column.
+
+    Since the schemas of the batch files must match the properties, this
+    also makes sure that none of the batch files have a timestamp column.
+
+    Args:
+        resource_properties: The resource properties to check.
+
+    Returns:
+        The resource properties, if none of the fields are named like the
+            timestamp column.
+
+    Raises:
+        ValueError: If a field has the same name as the timestamp column.
+    """
+    fields = cast(
+        list[FieldProperties],
+        _get_nested_attr(resource_properties, "schema.fields", default=[]),
+    )
+    if any(field.name == BATCH_TIMESTAMP_COLUMN_NAME for field in fields):
+        raise ValueError(
+            "The resource properties contain a field named "
+            f"'{BATCH_TIMESTAMP_COLUMN_NAME}'. This column is used internally in "
+            "Sprout to remove duplicate rows across batches. Please rename it in the "
+            "batch files and resource properties to scan the resource batches."
+        )
+    return resource_properties
+
+
+def _scan_parquet_batch_file(path: Path, timestamp: str) -> pl.LazyFrame:
+    """Scans a Parquet batch file and adds the timestamp as a column.
+
+    The timestamp is added as a literal column, so it doesn't require reading
+    any data.
+
+    Args:
+        path: Path to the Parquet batch file.
+        timestamp: The timestamp from the batch file name.
+
+    Returns:
+        The Parquet file as a LazyFrame with a timestamp column added.
+    """
+    return pl.scan_parquet(path).with_columns(_create_batch_timestamp_column(timestamp))
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.ipc_sidecar import _is_ipc_sidecar_current
+from seedcase_sprout.paths import PackagePath
+
+
+def scan_resource_data(
+    resource_name: str,
+    path: Path | None = None,
+) -> pl.LazyFrame:
+    """Lazily scan the resource's `data.parquet` file.
+
+    Use this function instead of `read_resource_data()` to build a query on
+    the resource's data before reading it. No data is read when calling this
+    function. When the query is collected, only the selected columns are read,
+    filters are used to skip row groups based on their statistics, and
+    reading stops once enough rows have been found for a `head()`.
+
+    If the resource's data is partitioned (see `write_resource_data()`), all
+    files in its `data/` folder are scanned, and the partition field is read
+    from the folder names. Filters on the partition field then skip all files
+    in the other partitions.
+
+    If the data was written with an Arrow IPC sidecar (see
+    `write_resource_data()`) and `data.parquet` hasn't changed since, the
+    sidecar is memory-mapped instead of reading the Parquet file.
+
+    Args:
+        resource_name: The name of the resource. This should match the name
+            found in the `datapackage.json` file under the `resource.name` key
+            for the resource.
+        path: The path to the data package folder, where the `datapackage.json`
+            file is located. If not provided, it defaults to the current
+            working directory. Use `PackagePath().properties()` to help get the
+            correct path.
+
+    Returns:
+        A Polars LazyFrame over the resource's data file.
+
+    Raises:
+        FileNotFoundError: If the resource's data file does not exist in the
+            specified path.
+
+    Examples:
+        ```{python}
+        import polars as pl
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            data = (
+                sp.scan_resource_data("example-resource")
+                .filter(pl.col("value") > 0)
+                .select("name")
+                .collect()
+            )
+            print(data)
+        ```
+    """
+    package_path = PackagePath(path)
+    partitioned_data_path = package_path.resource_partitioned_data(resource_name)
+    if partitioned_data_path.is_dir():
+        return pl.scan_parquet(partitioned_data_path, hive_partitioning=True)
+
+    data_path = package_path.resource_data(resource_name)
+    sidecar_path = package_path.resource_data_sidecar(resource_name)
+    if _is_ipc_sidecar_current(sidecar_path, data_path):
+        return pl.scan_ipc(sidecar_path, memory_map=True)
+
+    if not data_path.is_file():
+        raise FileNotFoundError(
+            f"Resource '{resource_name}' not found in the package, so we couldn't "
+            "read the data."
+        )
+
+    return pl.scan_parquet(data_path)
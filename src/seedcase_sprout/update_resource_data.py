@@ -0,0 +1,208 @@
+from pathlib import Path
+
+import polars as pl
+
+from seedcase_sprout.batch_manifest import (
+    _BatchFileEntry,
+    _create_batch_manifest,
+    _read_batch_manifest,
+    _write_batch_manifest,
+)
+from seedcase_sprout.check_properties import check_resource_properties
+from seedcase_sprout.internals import _get_nested_attr
+from seedcase_sprout.join_resource_batches import _stream_latest_obs_units
+from seedcase_sprout.parquet_write_profile import ParquetWriteProfile
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.rebuild_resource_data import (
+    _sink_resource_data,
+    rebuild_resource_data,
+)
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+from seedcase_sprout.write_resource_data import _get_partition_field
+
+
+def update_resource_data(
+    resource_properties: ResourceProperties,
+    package_path: Path | None = None,
+    chunk_size: int | None = None,
+    write_profile: ParquetWriteProfile | str | None = None,
+) -> Path:
+    """Update the resource's `data.parquet` file with any new batch files.
+
+    Only the batch files that have been added since the data file was last
+    built are read. Duplicate observational units are only dropped within these
+    new batch files, following the same rule as `join_resource_batches()`,
+    where the most recent observational unit is kept. They are then added to
+    the existing data, replacing any existing observational units with the same
+    primary key. Since the existing data has no duplicates and is older than
+    the new batch files, it only needs to be checked against the keys of the
+    new observational units. So the time and memory needed to find the latest
+    observational units grow with the size of the new batch files rather than
+    with all the data. As with `rebuild_resource_data()`, the updated data is
+    checked with `check_data()` and `check_keys()` before it replaces the
+    existing data file, and partitioned data stays partitioned by the same
+    field.
+
+    Note that Parquet files can't be appended to, so the existing data is still
+    read once and the whole data file is written again. For partitioned data,
+    all partitions are written again too.
+
+    The batch files that have already been merged into the data file are
+    listed in the resource's `batch-manifest.json` file, together with their
+    timestamp, size, and modification time. The data file is rebuilt from all
+    batch files with `rebuild_resource_data()` instead, if:
+
+    - there is no manifest or no data file,
+    - a batch file in the manifest has been changed or removed, or
+    - a new batch file is older than the newest batch file in the manifest.
+
+    Args:
+        resource_properties: The `ResourceProperties` object that contains the
+            properties of the resource you want to update the data for.
+        package_path: The path to the data package root folder (where
+            `datapackage.json` is located). Defaults to the current working
+            directory.
+        chunk_size: The number of rows the streaming engine processes at a
+            time. See `rebuild_resource_data()` for more details.
+        write_profile: The settings to write the Parquet file with. See
+            `write_resource_data()` for more details.
+
+    Returns:
+        The path of the updated Parquet file, or of the folder with the
+            partitioned data files.
+
+    Raises:
+        ValueError: If there are no batch files for the resource.
+        ValueError: If the `path` of the `resource_properties` is set to
+            partitioned data, but there is no partitioned data to get the
+            partition field from.
+        ExceptionGroup[ValueError]: If values in the updated data don't meet
+            the constraints in the `resource_properties`.
+        ExceptionGroup[ValueError]: If the primary key of the updated data has
+            missing values or the unique keys aren't unique.
+
+    Examples:
+        ```{python}
+        import seedcase_sprout as sp
+
+        with sp.ExamplePackage():
+            batch_path = sp.PackagePath().resource_batch("example-resource")
+            batch_path.mkdir()
+            sp.example_data().write_parquet(
+                batch_path / "2025-03-26T100346Z-example.parquet"
+            )
+            sp.update_resource_data(sp.example_resource_properties())
+        ```
+    """
+    check_resource_properties(resource_properties)
+    resource_name = str(resource_properties.name)
+    package_path_object = PackagePath(package_path)
+    partition_by = _get_partition_field(resource_properties, package_path_object)
+    data_path = (
+        package_path_object.resource_data(resource_name)
+        if partition_by is None
+        else package_path_object.resource_partitioned_data(resource_name)
+    )
+    manifest_path = package_path_object.resource_batch_manifest(resource_name)
+
+    merged_entries = _read_batch_manifest(manifest_path)
+    if merged_entries is None or not data_path.exists():
+        return rebuild_resource_data(
+            resource_properties, package_path, chunk_size, write_profile
+        )
+
+    merged_entry_set = set(merged_entries)
+    batch_paths = package_path_object.resource_batch_files(resource_name)
+    entries = _create_batch_manifest(batch_paths)
+    if not _can_update_incrementally(merged_entry_set, entries):
+        return rebuild_resource_data(
+            resource_properties, package_path, chunk_size, write_profile
+        )
+
+    new_paths = [
+        path
+        for path, entry in zip(batch_paths, entries)
+        if entry not in merged_entry_set
+    ]
+    if not new_paths:
+        return data_path
+
+    primary_key = _get_nested_attr(resource_properties, "schema.primary_key")
+    new_data = _stream_latest_obs_units(
+        scan_resource_batches(resource_properties, new_paths), primary_key
+    )
+    existing_data = pl.scan_parquet(
+        data_path, hive_partitioning=partition_by is not None
+    )
+    data = _replace_obs_units(existing_data, new_data, primary_key)
+
+    data_path = _sink_resource_data(
+        data,
+        package_path_object,
+        resource_properties,
+        chunk_size,
+        write_profile,
+        partition_by,
+    )
+    _write_batch_manifest(entries, manifest_path)
+    return data_path
+
+
+def _can_update_incrementally(
+    merged_entries: set[_BatchFileEntry], entries: list[_BatchFileEntry]
+) -> bool:
+    """Checks if the new batch files can be added to the existing data file.
+
+    This is only possible if all the merged batch files are unchanged and all
+    the new batch files are more recent than the merged batch files. Otherwise,
+    observational units in the data file might not be the most recent ones.
+
+    Args:
+        merged_entries: The manifest entries of the merged batch files.
+        entries: The manifest entries of the current batch files.
+
+    Returns:
+        Whether the new batch files can be added to the existing data file.
+    """
+    if not merged_entries or not merged_entries.issubset(entries):
+        return False
+
+    latest_timestamp = max(entry.timestamp for entry in merged_entries)
+    return all(
+        entry.timestamp > latest_timestamp
+        for entry in entries
+        if entry not in merged_entries
+    )
+
+
+def _replace_obs_units(
+    existing_data: pl.LazyFrame,
+    new_data: pl.LazyFrame,
+    primary_key: list[str] | str | None,
+) -> pl.LazyFrame:
+    """Adds new observational units to the data, replacing existing ones.
+
+    Only the keys of the new observational units are held in memory, to drop
+    the existing observational units with the same primary key. Without a
+    primary key, existing rows that are identical to a new row are dropped.
+
+    Args:
+        existing_data: The existing data, without duplicate observational
+            units.
+        new_data: The newer observational units, without duplicates.
+        primary_key: The primary key of the resource, if any.
+
+    Returns:
+        A query with the existing observational units that aren't in the new
+            data, followed by the new observational units.
+    """
+    columns = new_data.collect_schema().names()
+    if not primary_key:
+        key = columns
+    else:
+        key = [primary_key] if isinstance(primary_key, str) else primary_key
+    kept_data = existing_data.select(columns).join(
+        new_data.select(key), on=key, how="anti", nulls_equal=True
+    )
+    return pl.concat([kept_data, new_data], how="vertical")
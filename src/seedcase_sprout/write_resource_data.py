@@ -1,16 +1,31 @@
+import shutil
 from pathlib import Path
+from typing import Any, cast
 
 import polars as pl
 
 from seedcase_sprout.check_data import check_data
+from seedcase_sprout.check_keys import check_keys
+from seedcase_sprout.internals import _create_resource_data_path, _get_nested_attr
+from seedcase_sprout.ipc_sidecar import _remove_ipc_sidecar, _write_ipc_sidecar
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _get_write_options,
+    _get_write_profile,
+    _sort_by_primary_key,
+)
 from seedcase_sprout.paths import PackagePath
-from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.pipeline_spans import _span
+from seedcase_sprout.properties import FieldProperties, ResourceProperties
 
 
 def write_resource_data(
     data: pl.DataFrame,
     resource_properties: ResourceProperties,
     package_path: Path | None = None,
+    write_profile: ParquetWriteProfile | str | None = None,
+    partition_by: str | None = None,
+    ipc_sidecar: bool = False,
 ) -> Path:
     """Check and write the resource data into a file.
 
@@ -20,7 +35,41 @@ def write_resource_data(
     file is saved based on the path found in `ResourceProperties.path` and is
     always overwritten.  Before writing, this function does a check against the
     `resource_properties` to ensure that the data is correctly structured and
-    tidy.
+    tidy, and that the primary key and unique keys are unique.
+
+    The Parquet file is written with the settings in `write_profile`, which
+    are also recorded in the file. If no `write_profile` is given, the settings
+    recorded in the existing `data.parquet` file are used, so that the file is
+    always written the same way.
+
+    For very large resources, use `partition_by` to split the data into one
+    folder per value of a field, stored as
+    `resources/<name>/data/<field>=<value>/*.parquet`. Only the files of the
+    needed partitions are then read when `read_resource_data()` or
+    `scan_resource_data()` filter on that field. The names of the files
+    within each partition folder are chosen by Polars. Writing the data
+    without `partition_by` replaces any partitioned data with a single
+    `data.parquet` file again, and vice versa.
+
+    The layout is recorded in the `path` of the `resource_properties`, which
+    is set to `resources/<name>/data` for partitioned data and to
+    `resources/<name>/data.parquet` otherwise. Write the properties to
+    `datapackage.json` afterwards, e.g., with `write_properties()`, to keep
+    it. `rebuild_resource_data()` and `update_resource_data()` then keep
+    writing partitioned data, partitioned by the same field.
+
+    Use `ipc_sidecar` for resources that are read many times, e.g., by
+    services. An uncompressed Arrow IPC copy of the data is then also written
+    to `data.arrow`, next to `data.parquet`. `read_resource_data()` and
+    `scan_resource_data()` memory-map this copy instead of decoding the
+    Parquet file, so loading the data is almost instant and the pages are
+    shared between processes. The copy takes more space on disk, and it is
+    only used while `data.parquet` hasn't changed since it was written.
+
+    Since the written data may not match the batch files recorded in the
+    resource's `batch-manifest.json` file, the manifest is removed. The next
+    call to `update_resource_data()` then rebuilds the data file from all the
+    batch files.
 
     Args:
         data: A DataFrame object with the resources data from the files in its
@@ -30,12 +79,198 @@ def write_resource_data(
         package_path: The path to the data package root folder (where
             `datapackage.json` is located). Defaults to the current working
             directory.
+        write_profile: The settings to write the Parquet file with. Either a
+            `ParquetWriteProfile` or the name of one of its named profiles:
+            `"balanced"`, `"fast-read"`, or `"small"`. Defaults to the profile
+            recorded in the existing data file, or `"balanced"` if there is
+            none.
+        partition_by: The name of the field to partition the data by. Its
+            values are stored in the names of the partition folders, so it
+            can't be a `time` field or a field with lists of values, e.g., a
+            `geopoint` field. Defaults to writing a single `data.parquet` file.
+        ipc_sidecar: Whether to also write an Arrow IPC copy of the data that
+            can be memory-mapped when reading. Can't be used together with
+            `partition_by`.
 
     Returns:
-        The path of the created Parquet file.
+        The path of the created Parquet file, or of the folder with the
+            partitioned data files.
+
+    Raises:
+        ExceptionGroup[ValueError]: If the data doesn't match the properties,
+            or if the primary key or unique keys aren't unique.
+        ValueError: If there is no write profile with the given name.
+        ValueError: If `partition_by` isn't a field in the properties.
+        ValueError: If the values of the `partition_by` field can't be stored
+            in the names of the partition folders.
+        ValueError: If both `partition_by` and `ipc_sidecar` are used.
+    """
+    with _span("write_resource_data") as span:
+        check_data(data, resource_properties)
+        check_keys(data, resource_properties)
+        if partition_by is not None:
+            _check_partition_field(partition_by, data, resource_properties)
+            if ipc_sidecar:
+                raise ValueError(
+                    "Can't write an Arrow IPC sidecar for partitioned data. Use "
+                    "either `partition_by` or `ipc_sidecar`."
+                )
+        resource_name = str(resource_properties.name)
+        package_path_object = PackagePath(package_path)
+        data_path = package_path_object.resource_data(resource_name)
+        partitioned_data_path = package_path_object.resource_partitioned_data(
+            resource_name
+        )
+
+        write_profile = _get_write_profile(
+            write_profile,
+            partitioned_data_path if partitioned_data_path.is_dir() else data_path,
+        )
+        with _span("write_resource_data.sort"):
+            data = _sort_by_primary_key(data, write_profile, resource_properties)
+        write_options = _get_write_options(write_profile)
+        sidecar_path = package_path_object.resource_data_sidecar(resource_name)
+        _remove_ipc_sidecar(sidecar_path)
+        if partition_by is None:
+            with _span("write_resource_data.write_parquet") as write_span:
+                data.write_parquet(data_path, **write_options)
+                write_span.add_rows(data)
+                write_span.add_file(data_path)
+            shutil.rmtree(partitioned_data_path, ignore_errors=True)
+            if ipc_sidecar:
+                with _span("write_resource_data.write_ipc_sidecar") as sidecar_span:
+                    _write_ipc_sidecar(data, sidecar_path, data_path)
+                    sidecar_span.add_rows(data)
+                    sidecar_span.add_file(sidecar_path)
+        else:
+            with _span("write_resource_data.write_parquet") as write_span:
+                _write_partitioned_data(
+                    data, partitioned_data_path, partition_by, write_options
+                )
+                write_span.add_rows(data)
+                write_span.add_file(partitioned_data_path)
+            data_path.unlink(missing_ok=True)
+            data_path = partitioned_data_path
+
+        package_path_object.resource_batch_manifest(resource_name).unlink(
+            missing_ok=True
+        )
+        resource_properties.path = _create_resource_data_path(
+            resource_name, partitioned=partition_by is not None
+        )
+        span.add_rows(data)
+        return data_path
+
+
+def _check_partition_field(
+    name: str, data: pl.DataFrame, resource_properties: ResourceProperties
+) -> str:
+    """Checks that the data can be partitioned by the field with the name.
+
+    The values of the field are written to the names of the partition folders
+    and read back from them. This only works for values that Polars can turn
+    into a string and parse again, which excludes times and nested values,
+    e.g., lists and arrays.
+
+    Args:
+        name: The name to check.
+        data: The data to partition.
+        resource_properties: The properties with the fields.
+
+    Returns:
+        The name, if it is the name of a field that can be partitioned by.
+
+    Raises:
+        ValueError: If there is no field with the name.
+        ValueError: If the values of the field can't be stored in the names of
+            the partition folders.
+    """
+    fields = cast(
+        list[FieldProperties],
+        _get_nested_attr(resource_properties, "schema.fields", default=[]),
+    )
+    field_names = [str(field.name) for field in fields]
+    if name not in field_names:
+        raise ValueError(
+            f"Can't partition the data by '{name}', since it isn't a field in the "
+            f"resource properties. Use one of: {', '.join(field_names)}."
+        )
+    polars_type = data.schema[name]
+    if polars_type.is_nested() or polars_type == pl.Time:
+        raise ValueError(
+            f"Can't partition the data by '{name}', since its values of type "
+            f"{polars_type} can't be stored in the names of the partition folders. "
+            "Use a field with, e.g., strings, numbers, or dates instead."
+        )
+    return name
+
+
+def _write_partitioned_data(
+    data: pl.DataFrame,
+    partitioned_data_path: Path,
+    partition_by: str,
+    write_options: dict[str, Any],
+) -> Path:
+    """Writes the data as one folder of Parquet files per partition.
+
+    The partitions are written to a temporary folder first, which then
+    replaces the existing folder. This way, a failed write keeps the old data.
+
+    Args:
+        data: The data to write.
+        partitioned_data_path: The path to the folder with the partitions.
+        partition_by: The name of the field to partition the data by.
+        write_options: The arguments for `write_parquet()`.
+
+    Returns:
+        The path to the folder with the partitions.
+    """
+    temporary_path = partitioned_data_path.with_suffix(".tmp")
+    shutil.rmtree(temporary_path, ignore_errors=True)
+    data.write_parquet(temporary_path, partition_by=partition_by, **write_options)
+
+    shutil.rmtree(partitioned_data_path, ignore_errors=True)
+    return temporary_path.rename(partitioned_data_path)
+
+
+def _get_partition_field(
+    resource_properties: ResourceProperties, package_path: PackagePath
+) -> str | None:
+    """Gets the field that the resource's data is partitioned by, if any.
+
+    The data is partitioned if the `path` in the properties is the folder of
+    partitioned data. The field is then read from the names of the partition
+    folders, which are named `<field>=<value>`.
+
+    Args:
+        resource_properties: The properties of the resource.
+        package_path: The path to the data package.
+
+    Returns:
+        The name of the field the data is partitioned by, or None if the data
+            isn't partitioned.
+
+    Raises:
+        ValueError: If the path is the folder of partitioned data, but there
+            are no partition folders to get the field from.
     """
-    check_data(data, resource_properties)
-    data_path = PackagePath(package_path).resource_data(str(resource_properties.name))
+    resource_name = str(resource_properties.name)
+    if resource_properties.path != _create_resource_data_path(
+        resource_name, partitioned=True
+    ):
+        return None
 
-    data.write_parquet(data_path)
-    return data_path
+    partitioned_data_path = package_path.resource_partitioned_data(resource_name)
+    partition_paths = (
+        [path for path in partitioned_data_path.iterdir() if "=" in path.name]
+        if partitioned_data_path.is_dir()
+        else []
+    )
+    if not partition_paths:
+        raise ValueError(
+            f"The path of resource '{resource_name}' is set to partitioned data, "
+            f"but there are no partitions in '{partitioned_data_path}' to get the "
+            "partition field from. Use `write_resource_data()` with "
+            "`partition_by` to partition the data first."
+        )
+    return partition_paths[0].name.split("=", 1)[0]
@@ -1,10 +1,12 @@
 import re
+from datetime import UTC, date, datetime, time
+from unittest.mock import patch
 
 import polars as pl
 from polars.testing import assert_frame_equal
 from pytest import fixture, mark, raises
 
-from seedcase_sprout.check_data import check_data
+from seedcase_sprout.check_data import DataChecker, check_data
 from seedcase_sprout.check_properties import DataResourceError
 from seedcase_sprout.examples import (
     example_data,
@@ -12,6 +14,7 @@ from seedcase_sprout.examples import (
 )
 from seedcase_sprout.map_data_types import _get_allowed_polars_types
 from seedcase_sprout.properties import (
+    ConstraintsProperties,
     FieldProperties,
     ResourceProperties,
     TableSchemaProperties,
@@ -219,3 +222,334 @@ def test_rejects_incorrect_resource_properties():
     """Should throw an error if the resource properties are incorrect."""
     with raises(DataResourceError):
         check_data(example_data(), ResourceProperties())
+
+
+def test_data_checker_can_be_reused():
+    """A checker should give the same result for each DataFrame it checks."""
+    resource_properties = example_resource_properties()
+    checker = DataChecker(resource_properties)
+    incorrect_data = example_data().with_columns(pl.col("id").cast(pl.String))
+
+    for _ in range(2):
+        assert_frame_equal(checker.check(example_data()), example_data())
+        assert_raises_errors(lambda: checker.check(incorrect_data), ValueError, 1)
+
+
+def test_data_checker_checks_properties_once():
+    """The properties should only be checked when creating the checker."""
+    with patch(
+        "seedcase_sprout.check_data.check_resource_properties"
+    ) as check_resource_properties:
+        checker = DataChecker(example_resource_properties())
+        checker.check(example_data())
+        checker.check(example_data())
+
+    check_resource_properties.assert_called_once()
+
+
+def test_data_checker_checks_schema_without_data():
+    """The checker should be able to check a schema without any data."""
+    checker = DataChecker(example_resource_properties())
+    schema = example_data().schema
+
+    assert checker.check_schema(schema) is schema
+    with raises(ValueError):
+        checker.check_schema(pl.Schema({"id": pl.Int64}))
+
+
+def test_data_checker_rejects_incorrect_resource_properties():
+    """Should throw an error when creating a checker for incorrect properties."""
+    with raises(DataResourceError):
+        DataChecker(ResourceProperties())
+
+
+@mark.parametrize(
+    "field, values",
+    [
+        (
+            FieldProperties(
+                name="my_field",
+                type="string",
+                constraints=ConstraintsProperties(required=True),
+            ),
+            ["a", None, "c"],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="string",
+                constraints=ConstraintsProperties(unique=True),
+            ),
+            ["a", "b", "a"],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="string",
+                constraints=ConstraintsProperties(pattern="[a-z]+"),
+            ),
+            ["a", "b1", "c"],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="string",
+                constraints=ConstraintsProperties(enum=["a", "b"]),
+            ),
+            ["a", "b", "c"],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="string",
+                constraints=ConstraintsProperties(min_length=2, max_length=3),
+            ),
+            ["ab", "a", "abcd"],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="integer",
+                constraints=ConstraintsProperties(minimum=0, maximum=10),
+            ),
+            [-1, 5, 11],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="number",
+                constraints=ConstraintsProperties(
+                    exclusive_minimum=0, exclusive_maximum=1
+                ),
+            ),
+            [0.0, 0.5, 1.0],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="date",
+                constraints=ConstraintsProperties(minimum="2025-01-01"),
+            ),
+            [date(2024, 12, 31), date(2025, 1, 1), date(2025, 1, 2)],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="yearmonth",
+                constraints=ConstraintsProperties(minimum="2025-01"),
+            ),
+            [date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1)],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="datetime",
+                constraints=ConstraintsProperties(minimum="2025-01-01T00:00:00Z"),
+            ),
+            [datetime(2024, 12, 31, 23), datetime(2025, 1, 1), datetime(2025, 1, 2)],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="datetime",
+                constraints=ConstraintsProperties(maximum="2025-01-01T00:00:00+01:00"),
+            ),
+            [
+                datetime(2024, 12, 31, 23, tzinfo=UTC),
+                datetime(2024, 12, 31, 23, 30, tzinfo=UTC),
+            ],
+        ),
+        (
+            FieldProperties(
+                name="my_field",
+                type="time",
+                constraints=ConstraintsProperties(exclusive_maximum="12:00:00"),
+            ),
+            [time(11, 59, 59), time(12)],
+        ),
+        (
+            FieldProperties(name="my_field", type="integer", categories=[1, 2]),
+            [1, 2, 3],
+        ),
+    ],
+)
+def test_rejects_values_not_meeting_constraints(resource_properties, field, values):
+    """Should raise an error for each column with values not meeting a constraint."""
+    # Given
+    resource_properties.schema.fields = [field]
+    data = pl.DataFrame({"my_field": values})
+
+    # When, Then
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    errors = error_info.value.exceptions
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert all("my_field" in str(error) for error in errors)
+
+
+def test_reports_all_constraint_errors_with_row_indices(resource_properties):
+    """Should report each constraint not met, with the number of values and rows."""
+    # Given
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_string",
+            type="string",
+            constraints=ConstraintsProperties(required=True, max_length=1),
+        ),
+        FieldProperties(
+            name="my_number",
+            type="number",
+            constraints=ConstraintsProperties(minimum=0),
+        ),
+    ]
+    data = pl.DataFrame(
+        {
+            "my_string": [None, "ab", "c", "de"],
+            "my_number": [-1.0, 1.0, -2.0, None],
+        }
+    )
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    # Then
+    messages = [str(error) for error in error_info.value.exceptions]
+    assert len(messages) == 3
+    assert "`required`" in messages[0] and "1 value(s)" in messages[0]
+    assert "[0]" in messages[0]
+    assert "`max_length=1`" in messages[1] and "[1, 3]" in messages[1]
+    assert "`minimum=0`" in messages[2] and "[0, 2]" in messages[2]
+
+
+def test_limits_number_of_reported_rows(resource_properties):
+    """Should only report the first few rows with values not meeting a constraint."""
+    # Given
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_number",
+            type="integer",
+            constraints=ConstraintsProperties(maximum=0),
+        ),
+    ]
+    data = pl.DataFrame({"my_number": range(1, 101)})
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        check_data(data, resource_properties)
+
+    # Then
+    message = str(error_info.value.exceptions[0])
+    assert "100 value(s)" in message
+    assert "[0, 1, 2, 3, 4]" in message
+
+
+def test_accepts_values_meeting_constraints(resource_properties):
+    """Should return the data if all values meet the constraints."""
+    # Given
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_string",
+            type="string",
+            constraints=ConstraintsProperties(
+                required=True, unique=True, pattern="[a-z]", enum=["a", "b"]
+            ),
+        ),
+        FieldProperties(
+            name="my_number",
+            type="number",
+            constraints=ConstraintsProperties(minimum=0, exclusive_maximum=1),
+        ),
+        FieldProperties(
+            name="my_yearmonth",
+            type="yearmonth",
+            constraints=ConstraintsProperties(enum=["2025-01", "2025-02"]),
+        ),
+        FieldProperties(
+            name="my_datetime",
+            type="datetime",
+            constraints=ConstraintsProperties(
+                minimum="2025-01-01T01:00:00+01:00", maximum="2025-01-01T00:00:00"
+            ),
+        ),
+    ]
+    data = pl.DataFrame(
+        {
+            "my_string": ["a", "b"],
+            "my_number": [0.0, None],
+            "my_yearmonth": [date(2025, 1, 1), date(2025, 2, 1)],
+            "my_datetime": [datetime(2025, 1, 1, tzinfo=UTC)] * 2,
+        }
+    )
+
+    # When, Then
+    assert_frame_equal(check_data(data, resource_properties), data)
+
+
+def test_does_not_check_length_of_json_text(resource_properties):
+    """Should not check the length of `array` and `object` fields stored as
+    JSON text, since their length is the number of items.
+    """
+    # Given
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_array",
+            type="array",
+            constraints=ConstraintsProperties(min_length=1, max_length=2),
+        ),
+        FieldProperties(
+            name="my_object",
+            type="object",
+            constraints=ConstraintsProperties(max_length=1),
+        ),
+    ]
+    data = pl.DataFrame({"my_array": ["[1, 2]"], "my_object": ['{"a": 1}']})
+
+    # When, Then
+    assert_frame_equal(check_data(data, resource_properties), data)
+
+
+def test_accepts_correct_lazy_frame():
+    """Should return the LazyFrame as is if it matches the properties."""
+    data = example_data().lazy()
+
+    assert check_data(data, example_resource_properties()) is data
+
+
+def test_rejects_lazy_frame_with_incorrect_schema_without_collecting():
+    """Should check the column names of a LazyFrame without reading the data."""
+    # Given
+    data = example_data().lazy().rename({"id": "not-id"})
+
+    # When, Then
+    with patch.object(pl.LazyFrame, "collect") as collect, raises(ValueError):
+        check_data(data, example_resource_properties())
+
+    collect.assert_not_called()
+
+
+def test_rejects_lazy_frame_with_values_not_meeting_constraints(
+    tmp_path, resource_properties
+):
+    """Should check the constraints of a scanned Parquet file."""
+    # Given
+    resource_properties.schema.fields = [
+        FieldProperties(
+            name="my_number",
+            type="integer",
+            constraints=ConstraintsProperties(required=True, maximum=10),
+        ),
+    ]
+    data_path = tmp_path / "data.parquet"
+    pl.DataFrame({"my_number": [1, None, 11, 12]}).write_parquet(data_path)
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        check_data(pl.scan_parquet(data_path), resource_properties)
+
+    # Then
+    messages = [str(error) for error in error_info.value.exceptions]
+    assert len(messages) == 2
+    assert "[1]" in messages[0]
+    assert "[2, 3]" in messages[1]
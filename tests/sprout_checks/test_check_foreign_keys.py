@@ -0,0 +1,169 @@
+import os
+
+import polars as pl
+from pytest import fixture, raises
+
+from seedcase_sprout.check_foreign_keys import (
+    check_foreign_keys,
+    check_foreign_keys_cache_info,
+    clear_check_foreign_keys_cache,
+)
+from seedcase_sprout.examples import (
+    ExamplePackage,
+    example_data,
+    example_package_properties,
+    example_resource_properties,
+)
+from seedcase_sprout.properties import (
+    FieldProperties,
+    ReferenceProperties,
+    ResourceProperties,
+    SproutProperties,
+    TableSchemaForeignKeyProperties,
+    TableSchemaProperties,
+)
+from seedcase_sprout.write_resource_data import write_resource_data
+from tests.assert_raises_errors import assert_raises_errors
+
+
+def child_resource_properties(name: str) -> ResourceProperties:
+    return ResourceProperties(
+        name=name,
+        title="Child resource",
+        description="A resource that refers to the example resource.",
+        schema=TableSchemaProperties(
+            fields=[
+                FieldProperties(name="child_id", type="integer"),
+                FieldProperties(name="parent_id", type="integer"),
+            ],
+            foreign_keys=[
+                TableSchemaForeignKeyProperties(
+                    fields=["parent_id"],
+                    reference=ReferenceProperties(
+                        resource="example-resource", fields=["id"]
+                    ),
+                )
+            ],
+        ),
+    )
+
+
+@fixture(autouse=True)
+def clear_cache():
+    clear_check_foreign_keys_cache()
+    yield
+    clear_check_foreign_keys_cache()
+
+
+@fixture
+def package_path():
+    with ExamplePackage() as package_path:
+        yield package_path
+
+
+@fixture
+def properties(package_path) -> SproutProperties:
+    properties = example_package_properties()
+    properties.resources = [example_resource_properties()]
+    for name in ["child-1", "child-2"]:
+        properties.resources.append(child_resource_properties(name))
+        package_path.resource(name).mkdir()
+        pl.DataFrame(
+            {"child_id": [0, 1, 2], "parent_id": [34, 99, None]}
+        ).write_parquet(package_path.resource_data(name))
+    return properties
+
+
+def test_accepts_existing_foreign_keys(properties):
+    """Should return the properties if all foreign keys exist."""
+    assert check_foreign_keys(properties) is properties
+
+
+def test_accepts_properties_without_foreign_keys(package_path):
+    """Should return the properties if there are no foreign keys."""
+    properties = example_package_properties()
+    properties.resources = [example_resource_properties()]
+
+    assert check_foreign_keys(properties) is properties
+
+
+def test_rejects_orphaned_foreign_keys(package_path, properties):
+    """Should report each foreign key with values that don't exist."""
+    # Given
+    pl.DataFrame({"child_id": [0, 1, 2], "parent_id": [34, 10, 10]}).write_parquet(
+        package_path.resource_data("child-2")
+    )
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        check_foreign_keys(properties)
+
+    # Then
+    errors = error_info.value.exceptions
+    assert len(errors) == 1
+    assert "child-2" in str(errors[0])
+    assert "2 row(s)" in str(errors[0])
+    assert "{'parent_id': 10}" in str(errors[0])
+
+
+def test_checks_foreign_keys_to_same_resource(package_path, properties):
+    """Should use the resource itself if there is no referenced resource."""
+    # Given
+    foreign_key = properties.resources[1].schema.foreign_keys[0]
+    foreign_key.reference = ReferenceProperties(fields=["child_id"])
+    pl.DataFrame({"child_id": [0, 1, 2], "parent_id": [0, 1, 3]}).write_parquet(
+        package_path.resource_data("child-1")
+    )
+
+    # When, Then
+    assert_raises_errors(lambda: check_foreign_keys(properties), ValueError, 1)
+
+
+def test_reads_referenced_keys_once(properties):
+    """Should only read the keys of a referenced resource once."""
+    # When
+    check_foreign_keys(properties)
+    check_foreign_keys(properties)
+
+    # Then
+    cache_info = check_foreign_keys_cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 3
+    assert cache_info.size == 1
+
+
+def test_reads_referenced_keys_again_when_data_changes(package_path, properties):
+    """Should read the keys again when the referenced data file has changed."""
+    # Given
+    check_foreign_keys(properties)
+    data_path = package_path.resource_data("example-resource")
+    pl.DataFrame({"id": [5], "name": ["a"], "value": [1.0]}).write_parquet(data_path)
+    stat = data_path.stat()
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    # When, Then
+    with raises(ExceptionGroup):
+        check_foreign_keys(properties)
+    assert check_foreign_keys_cache_info().misses == 2
+
+
+def test_raises_error_when_data_file_is_missing(package_path, properties):
+    """Should raise an error if a data file doesn't exist."""
+    package_path.resource_data("child-1").unlink()
+
+    with raises(FileNotFoundError):
+        check_foreign_keys(properties)
+
+
+def test_checks_foreign_keys_to_partitioned_data(package_path, properties):
+    """Should read the keys from all partitions of partitioned data."""
+    # Given
+    write_resource_data(
+        example_data(), properties.resources[0], package_path.root(), partition_by="id"
+    )
+    pl.DataFrame({"child_id": [0, 1, 2], "parent_id": [34, 10, 10]}).write_parquet(
+        package_path.resource_data("child-2")
+    )
+
+    # When, Then
+    assert_raises_errors(lambda: check_foreign_keys(properties), ValueError, 1)
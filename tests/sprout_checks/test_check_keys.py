@@ -0,0 +1,125 @@
+import polars as pl
+from pytest import fixture, raises
+
+from seedcase_sprout.check_keys import check_keys
+from seedcase_sprout.check_properties import DataResourceError
+from seedcase_sprout.properties import (
+    FieldProperties,
+    ResourceProperties,
+    TableSchemaProperties,
+)
+from tests.assert_raises_errors import assert_raises_errors
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    return ResourceProperties(
+        name="data",
+        title="data",
+        description="My data...",
+        schema=TableSchemaProperties(
+            fields=[
+                FieldProperties(name="id", type="integer"),
+                FieldProperties(name="date", type="string"),
+                FieldProperties(name="email", type="string"),
+            ],
+            primary_key=["id", "date"],
+            unique_keys=[["email"]],
+        ),
+    )
+
+
+@fixture
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "id": [1, 1, 2],
+            "date": ["2025-01-01", "2025-01-02", "2025-01-01"],
+            "email": ["a@example.com", None, None],
+        }
+    )
+
+
+def test_accepts_unique_keys(data, resource_properties):
+    """Should return the data if the keys are unique."""
+    assert check_keys(data, resource_properties) is data
+
+
+def test_accepts_data_without_keys(data, resource_properties):
+    """Should return the data if there are no keys in the properties."""
+    resource_properties.schema.primary_key = None
+    resource_properties.schema.unique_keys = None
+    data = pl.concat([data, data])
+
+    assert check_keys(data, resource_properties) is data
+
+
+def test_accepts_single_field_primary_key(data, resource_properties):
+    """Should accept the primary key as the name of a single field."""
+    resource_properties.schema.primary_key = "date"
+    resource_properties.schema.unique_keys = None
+
+    with raises(ExceptionGroup) as error_info:
+        check_keys(data, resource_properties)
+
+    assert "['date']" in str(error_info.value.exceptions[0])
+
+
+def test_rejects_duplicate_primary_keys(data, resource_properties):
+    """Should report the number of duplicate rows and a sample of the keys."""
+    # Given
+    data = pl.concat([data, data.head(1)])
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        check_keys(data, resource_properties)
+
+    # Then
+    errors = error_info.value.exceptions
+    assert len(errors) == 2
+    assert "primary_key" in str(errors[0])
+    assert "2 row(s)" in str(errors[0])
+    assert "{'id': 1, 'date': '2025-01-01'}" in str(errors[0])
+    assert "unique_keys" in str(errors[1])
+
+
+def test_rejects_missing_values_in_primary_key(data, resource_properties):
+    """Should reject rows with missing values in the primary key."""
+    data = data.with_columns(pl.Series("date", ["2025-01-01", None, None]))
+
+    with raises(ExceptionGroup) as error_info:
+        check_keys(data, resource_properties)
+
+    assert len(error_info.value.exceptions) == 1
+    assert "2 row(s) with missing values" in str(error_info.value.exceptions[0])
+
+
+def test_rejects_duplicate_unique_keys(data, resource_properties):
+    """Should reject duplicates in each of the unique keys, but not missing ones."""
+    # Given
+    resource_properties.schema.unique_keys = [["email"], ["id"]]
+    data = data.with_columns(pl.lit("a@example.com").alias("email"))
+
+    # When, Then
+    assert_raises_errors(
+        lambda: check_keys(data, resource_properties), ValueError, error_count=2
+    )
+
+
+def test_checks_lazy_frame(tmp_path, data, resource_properties):
+    """Should check the keys of a scanned Parquet file."""
+    # Given
+    data_path = tmp_path / "data.parquet"
+    pl.concat([data, data]).write_parquet(data_path)
+    data = pl.scan_parquet(data_path)
+
+    # When, Then
+    assert_raises_errors(
+        lambda: check_keys(data, resource_properties), ValueError, error_count=2
+    )
+
+
+def test_rejects_incorrect_resource_properties(data):
+    """Should throw an error if the resource properties are incorrect."""
+    with raises(DataResourceError):
+        check_keys(data, ResourceProperties())
@@ -8,6 +8,8 @@ from seedcase_sprout.check_properties import (
     check_package_properties,
     check_properties,
     check_resource_properties,
+    check_resource_properties_cache_info,
+    clear_check_resource_properties_cache,
 )
 from seedcase_sprout.examples import example_resource_properties
 from seedcase_sprout.properties import (
@@ -192,6 +194,48 @@ def test_data_resource_error():
     assert "resources[0]" not in str(error.value)
 
 
+def test_repeated_checks_of_unchanged_properties_use_cache():
+    """Checking the same properties again should use the cached result."""
+    clear_check_resource_properties_cache()
+    properties = example_resource_properties()
+
+    check_resource_properties(properties)
+    check_resource_properties(example_resource_properties())
+
+    cache_info = check_resource_properties_cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.size) == (1, 1, 1)
+
+
+def test_changed_properties_are_checked_again():
+    """Changing the properties should not use the cached result."""
+    clear_check_resource_properties_cache()
+    properties = example_resource_properties()
+    check_resource_properties(properties)
+
+    properties.name = None
+
+    with raises(DataResourceError):
+        check_resource_properties(properties)
+    # Failed checks are also cached
+    with raises(DataResourceError):
+        check_resource_properties(properties)
+    cache_info = check_resource_properties_cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.size) == (1, 2, 2)
+
+
+def test_cache_removes_least_recently_used_results():
+    """The cache should not grow beyond its maximum size."""
+    clear_check_resource_properties_cache()
+    max_size = check_resource_properties_cache_info().max_size
+    properties = example_resource_properties()
+
+    for number in range(max_size + 1):
+        properties.title = f"Resource {number}"
+        check_resource_properties(properties)
+
+    assert check_resource_properties_cache_info().size == max_size
+
+
 def test_errors_flagged_for_fields_with_multipart_name():
     """Errors should be flagged when the name of the field has more than one word."""
     properties = example_resource_properties()
@@ -251,6 +295,15 @@ def test_error_no_resource_name_in_path(properties, path):
         check_resource_properties(properties.resources[0])
 
 
+def test_accepts_partitioned_data_path(properties):
+    """Should accept the path to the folder of partitioned data files."""
+    resource_name = properties.resources[0].name
+    properties.resources[0].path = str(Path("resources", resource_name, "data"))
+
+    assert check_properties(properties) == properties
+    assert check_resource_properties(properties.resources[0])
+
+
 def test_excludes_path_or_data_required(properties):
     """When both path and data are missing, only path should be flagged."""
     delattr(properties.resources[0], "path")
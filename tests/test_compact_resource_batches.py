@@ -0,0 +1,216 @@
+import json
+from datetime import datetime
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import fixture, raises
+
+from seedcase_sprout.compact_resource_batches import compact_resource_batches
+from seedcase_sprout.examples import ExamplePackage, example_resource_properties
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _read_write_profile,
+)
+from seedcase_sprout.properties import ResourceProperties
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.rebuild_resource_data import rebuild_resource_data
+from seedcase_sprout.update_resource_data import update_resource_data
+
+batch_data_1 = pl.DataFrame(
+    {
+        "id": [0, 1],
+        "name": ["anne", "belinda"],
+        "value": [0.0, 1.1],
+    }
+)
+
+batch_data_2 = pl.DataFrame(
+    {
+        "id": [2, 0],
+        "name": ["catherine", "alberta"],
+        "value": [2.2, 9.9],
+    }
+)
+
+batch_data_3 = pl.DataFrame(
+    {
+        "id": [1, 3],
+        "name": ["bertha", "dorothy"],
+        "value": [1.2, 3.3],
+    }
+)
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    resource_properties = example_resource_properties()
+    resource_properties.schema.primary_key = "id"
+    return resource_properties
+
+
+@fixture
+def package_path(resource_properties):
+    with ExamplePackage() as package_path:
+        batch_path = package_path.resource_batch(str(resource_properties.name))
+        batch_path.mkdir()
+        batch_data_1.write_parquet(batch_path / "2024-03-26T100000Z-1.parquet")
+        batch_data_2.write_parquet(batch_path / "2025-03-26T100000Z-2.parquet")
+        batch_data_3.write_parquet(batch_path / "2026-03-26T100000Z-3.parquet")
+        yield package_path
+
+
+def joined_data(resource_properties) -> pl.DataFrame:
+    return join_resource_batches(
+        read_resource_batches(resource_properties), resource_properties
+    ).sort("id")
+
+
+def batch_file_names(package_path, resource_properties) -> list[str]:
+    return [
+        path.name
+        for path in package_path.resource_batch_files(resource_properties.name)
+    ]
+
+
+def test_merges_all_batch_files_into_one(package_path, resource_properties):
+    """Should merge all batch files into one with the latest timestamp, and
+    joining the batches should give the same data as before.
+    """
+    # Given
+    expected_data = joined_data(resource_properties)
+
+    # When
+    compacted_path = compact_resource_batches(resource_properties)
+
+    # Then
+    assert batch_file_names(package_path, resource_properties) == [compacted_path.name]
+    assert compacted_path.name.startswith("2026-03-26T100000Z-")
+    assert_frame_equal(joined_data(resource_properties), expected_data)
+
+
+def test_writes_merged_batch_file_with_write_profile(package_path, resource_properties):
+    """Should write the merged batch file with the profile recorded in the data
+    file, or with the given profile.
+    """
+    # When
+    compacted_path = compact_resource_batches(
+        resource_properties,
+        end=datetime(2025, 3, 26, 10),
+        write_profile="fast-read",
+    )
+
+    # Then
+    assert _read_write_profile(compacted_path) == ParquetWriteProfile.from_name(
+        "fast-read"
+    )
+    assert pl.read_parquet(compacted_path)["id"].to_list() == [0, 1, 2]
+
+    # Given
+    rebuild_resource_data(resource_properties, write_profile="small")
+
+    # When
+    compacted_path = compact_resource_batches(resource_properties)
+
+    # Then
+    assert _read_write_profile(compacted_path) == ParquetWriteProfile.from_name("small")
+
+
+def test_merges_batch_files_up_to_end(package_path, resource_properties):
+    """Should only merge the batch files up to `end`, keeping the latest
+    observational units from later batch files when joining.
+    """
+    # Given
+    expected_data = joined_data(resource_properties)
+
+    # When
+    compacted_path = compact_resource_batches(
+        resource_properties, end=datetime(2025, 12, 31)
+    )
+
+    # Then
+    assert compacted_path.name.startswith("2025-03-26T100000Z-")
+    assert batch_file_names(package_path, resource_properties) == [
+        compacted_path.name,
+        "2026-03-26T100000Z-3.parquet",
+    ]
+    assert_frame_equal(
+        pl.read_parquet(compacted_path).sort("id"),
+        pl.DataFrame(
+            {
+                "id": [0, 1, 2],
+                "name": ["alberta", "belinda", "catherine"],
+                "value": [9.9, 1.1, 2.2],
+            }
+        ),
+    )
+    assert_frame_equal(joined_data(resource_properties), expected_data)
+
+
+def test_leaves_single_batch_file_as_is(package_path, resource_properties):
+    """Should not rewrite the batch file if there is only one to merge."""
+    # When
+    compacted_path = compact_resource_batches(
+        resource_properties, end=datetime(2024, 12, 31)
+    )
+
+    # Then
+    assert compacted_path.name == "2024-03-26T100000Z-1.parquet"
+    assert len(batch_file_names(package_path, resource_properties)) == 3
+
+
+def test_raises_error_when_there_are_no_batch_files(resource_properties):
+    """Should raise an error if there are no batch files to merge."""
+    with ExamplePackage(), raises(ValueError):
+        compact_resource_batches(resource_properties)
+
+
+def test_updates_manifest_of_merged_batch_files(package_path, resource_properties):
+    """Should replace the merged batch files in the manifest, so the data file
+    can still be updated without rebuilding it.
+    """
+    # Given
+    rebuild_resource_data(resource_properties)
+    data_path = package_path.resource_data(resource_properties.name)
+    expected_data = pl.read_parquet(data_path).sort("id")
+    compacted_path = compact_resource_batches(resource_properties)
+    data_mtime_ns = data_path.stat().st_mtime_ns
+
+    # When
+    update_resource_data(resource_properties)
+
+    # Then
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    manifest = json.loads(manifest_path.read_text())
+    assert [entry["name"] for entry in manifest["batch_files"]] == [compacted_path.name]
+    assert data_path.stat().st_mtime_ns == data_mtime_ns
+    assert_frame_equal(pl.read_parquet(data_path).sort("id"), expected_data)
+
+
+def test_keeps_manifest_when_not_all_batch_files_were_merged(
+    package_path, resource_properties
+):
+    """Should leave the manifest as is if some of the compacted batch files
+    weren't merged into the data file, so the data is rebuilt on update.
+    """
+    # Given
+    batch_path = package_path.resource_batch(resource_properties.name)
+    latest_batch_path = batch_path / "2026-03-26T100000Z-3.parquet"
+    latest_batch_path.rename(batch_path.parent / "later.parquet")
+    rebuild_resource_data(resource_properties)
+    (batch_path.parent / "later.parquet").rename(latest_batch_path)
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    manifest = manifest_path.read_text()
+
+    # When
+    compact_resource_batches(resource_properties)
+
+    # Then
+    assert manifest_path.read_text() == manifest
+    update_resource_data(resource_properties)
+    assert_frame_equal(
+        pl.read_parquet(package_path.resource_data(resource_properties.name)).sort(
+            "id"
+        ),
+        joined_data(resource_properties),
+    )
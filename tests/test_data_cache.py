@@ -0,0 +1,125 @@
+import os
+from unittest.mock import patch
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import fixture
+
+from seedcase_sprout.data_cache import (
+    data_cache_info,
+    disable_data_cache,
+    enable_data_cache,
+)
+from seedcase_sprout.examples import (
+    ExamplePackage,
+    example_data,
+    example_resource_properties,
+)
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.read_resource_data import read_resource_data
+
+
+@fixture
+def data_cache():
+    enable_data_cache()
+    yield
+    disable_data_cache()
+
+
+@fixture
+def package_path():
+    with ExamplePackage() as package_path:
+        yield package_path
+
+
+def test_cache_is_disabled_by_default(package_path):
+    """Should not cache any data unless the cache is enabled."""
+    read_resource_data("example-resource")
+    read_resource_data("example-resource")
+
+    info = data_cache_info()
+    assert not info.enabled
+    assert info.hits == 0
+    assert info.size == 0
+
+
+def test_reads_resource_data_from_cache(data_cache, package_path):
+    """Should only read the data file once while it hasn't changed."""
+    # When
+    first = read_resource_data("example-resource")
+    with patch.object(pl.LazyFrame, "collect") as collect:
+        second = read_resource_data("example-resource")
+
+    # Then
+    collect.assert_not_called()
+    assert_frame_equal(first, second)
+    info = data_cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+    assert info.bytes == example_data().estimated_size()
+
+
+def test_returned_data_does_not_change_cache(data_cache, package_path):
+    """Changes to the returned DataFrame should not change the cached data."""
+    data = read_resource_data("example-resource")
+    data.drop_in_place("name")
+
+    assert_frame_equal(read_resource_data("example-resource"), example_data())
+
+
+def test_reads_changed_data_file_again(data_cache, package_path):
+    """Should read the data file again once it has changed."""
+    # Given
+    read_resource_data("example-resource")
+    data_path = package_path.resource_data("example-resource")
+    example_data().head(1).write_parquet(data_path)
+    stat = data_path.stat()
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    # When
+    data = read_resource_data("example-resource")
+
+    # Then
+    assert data.height == 1
+    assert data_cache_info().misses == 2
+
+
+def test_does_not_cache_partial_reads(data_cache, package_path):
+    """Should not use the cache when only reading part of the data."""
+    read_resource_data("example-resource", n_rows=1)
+
+    assert data_cache_info().misses == 0
+
+
+def test_removes_least_recently_used_data(package_path):
+    """Should remove the least recently used data when the cache is full."""
+    # Given
+    batch_path = package_path.resource_batch("example-resource")
+    batch_path.mkdir()
+    paths = [batch_path / f"2025-03-2{i}T100000Z-{i}.parquet" for i in range(3)]
+    for path in paths:
+        example_data().write_parquet(path)
+    enable_data_cache(max_bytes=int(example_data().estimated_size() * 2))
+
+    # When
+    read_resource_batches(example_resource_properties(), paths)
+    read_resource_batches(example_resource_properties(), paths[2:])
+    read_resource_batches(example_resource_properties(), paths[:1])
+    info = data_cache_info()
+    disable_data_cache()
+
+    # Then
+    assert info.size == 2
+    assert info.hits == 1
+    assert info.misses == 4
+
+
+def test_does_not_cache_data_larger_than_cache(package_path):
+    """Should not cache a DataFrame larger than the whole cache."""
+    enable_data_cache(max_bytes=1)
+
+    read_resource_data("example-resource")
+    info = data_cache_info()
+    disable_data_cache()
+
+    assert info.size == 0
+    assert info.bytes == 0
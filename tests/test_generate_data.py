@@ -0,0 +1,381 @@
+from datetime import UTC, date, datetime, time
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import fixture, mark, raises
+
+from seedcase_sprout.check_data import check_data
+from seedcase_sprout.examples import (
+    ExamplePackage,
+    example_resource_properties,
+    example_resource_properties_all_types,
+)
+from seedcase_sprout.generate_data import generate_data, generate_resource_batches
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _read_write_profile,
+)
+from seedcase_sprout.properties import (
+    ConstraintsProperties,
+    FieldProperties,
+    ResourceProperties,
+    TableSchemaProperties,
+)
+from seedcase_sprout.read_resource_batches import read_resource_batches
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    resource_properties = example_resource_properties()
+    resource_properties.schema.primary_key = "id"
+    return resource_properties
+
+
+def properties_with_fields(*fields: FieldProperties, **schema) -> ResourceProperties:
+    return ResourceProperties(
+        name="generated",
+        path="resources/generated/data.parquet",
+        title="Generated",
+        description="Generated data.",
+        schema=TableSchemaProperties(fields=list(fields), **schema),
+    )
+
+
+@mark.parametrize("n_rows", [0, 1, 1000])
+def test_generates_data_that_passes_checks(n_rows):
+    """Should generate data of all types that passes the checks."""
+    # Given
+    resource_properties = example_resource_properties_all_types()
+
+    # When
+    data = generate_data(resource_properties, n_rows, seed=1)
+
+    # Then
+    assert data.height == n_rows
+    assert data.columns == [field.name for field in resource_properties.schema.fields]
+    assert check_data(data, resource_properties) is data
+
+
+def test_same_seed_gives_same_data(resource_properties):
+    """Should generate the same data with the same seed, and different data
+    with a different seed.
+    """
+    # When
+    data = generate_data(resource_properties, 100, seed=42)
+
+    # Then
+    assert_frame_equal(data, generate_data(resource_properties, 100, seed=42))
+    assert not data.equals(generate_data(resource_properties, 100, seed=43))
+
+
+def test_generates_unique_primary_key(resource_properties):
+    """Should generate a unique primary key, even with a small range."""
+    # Given
+    resource_properties.schema.fields[0].constraints = ConstraintsProperties(
+        minimum=1, maximum=1000
+    )
+
+    # When
+    data = generate_data(resource_properties, 1000, seed=1)
+
+    # Then
+    assert data["id"].is_unique().all()
+    assert data["id"].min() == 1
+    assert data["id"].max() == 1000
+
+
+def test_generates_unique_multi_field_primary_key():
+    """Should make a key with more than one field unique through one of its
+    fields that can have unique values.
+    """
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(name="flag", type="boolean"),
+        FieldProperties(name="code", type="string", categories=["a", "b"]),
+        FieldProperties(name="id", type="integer"),
+        primary_key=["flag", "code", "id"],
+    )
+
+    # When
+    data = generate_data(resource_properties, 500, seed=1)
+
+    # Then
+    assert data["id"].is_unique().all()
+    check_data(data, resource_properties)
+
+
+def test_generates_unique_key_through_field_with_enough_values():
+    """Should make a key unique through a field that can have as many distinct
+    values as there are rows, and not just the first field that can be unique.
+    """
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(
+            name="year",
+            type="year",
+            constraints=ConstraintsProperties(minimum=2020, maximum=2025),
+        ),
+        FieldProperties(name="id", type="integer"),
+        primary_key=["year", "id"],
+    )
+
+    # When
+    data = generate_data(resource_properties, 100, seed=1)
+
+    # Then
+    assert data["id"].is_unique().all()
+    check_data(data, resource_properties)
+
+
+def test_raises_error_if_no_key_field_has_enough_values():
+    """Should raise an error if none of the fields of a key can have as many
+    distinct values as there are rows.
+    """
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(name="flag", type="boolean"),
+        FieldProperties(
+            name="code", type="string", constraints=ConstraintsProperties(max_length=1)
+        ),
+        primary_key=["flag", "code"],
+    )
+
+    # When, Then
+    with raises(ValueError, match="key"):
+        generate_data(resource_properties, 20)
+
+
+def test_meets_constraints():
+    """Should generate values that meet the minimum, maximum, and length
+    constraints of the fields.
+    """
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(
+            name="integer",
+            type="integer",
+            constraints=ConstraintsProperties(exclusive_minimum=0, maximum=3),
+        ),
+        FieldProperties(
+            name="number",
+            type="number",
+            constraints=ConstraintsProperties(
+                exclusive_minimum=0.0, exclusive_maximum=0.5
+            ),
+        ),
+        FieldProperties(
+            name="date",
+            type="date",
+            constraints=ConstraintsProperties(
+                minimum="2025-01-01", maximum="2025-01-31"
+            ),
+        ),
+        FieldProperties(
+            name="datetime",
+            type="datetime",
+            constraints=ConstraintsProperties(minimum="2025-01-01T00:00:00"),
+        ),
+        FieldProperties(
+            name="time",
+            type="time",
+            constraints=ConstraintsProperties(exclusive_maximum="12:00:00"),
+        ),
+        FieldProperties(
+            name="string",
+            type="string",
+            constraints=ConstraintsProperties(min_length=5, max_length=5),
+        ),
+    )
+
+    # When
+    data = generate_data(resource_properties, 2000, seed=1)
+
+    # Then
+    check_data(data, resource_properties)
+    assert set(data["integer"]) == {1, 2, 3}
+    assert 0 < data["number"].min() and data["number"].max() < 0.5
+    assert data["date"].min() >= date(2025, 1, 1)
+    assert data["date"].max() <= date(2025, 1, 31)
+    assert data["datetime"].min() >= datetime(2025, 1, 1)
+    assert data["time"].max() < time(12)
+    assert (data["string"].str.len_chars() == 5).all()
+
+
+def test_picks_values_from_enum_and_categories():
+    """Should only generate values from the enum and categories of the fields."""
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(
+            name="category",
+            type="integer",
+            categories=[1, 2],
+        ),
+        FieldProperties(
+            name="enum",
+            type="date",
+            constraints=ConstraintsProperties(enum=["2025-01-01", "2025-06-01"]),
+        ),
+        FieldProperties(
+            name="yearmonth",
+            type="yearmonth",
+            constraints=ConstraintsProperties(enum=["2025-01", "2025-06"]),
+        ),
+        FieldProperties(
+            name="datetime",
+            type="datetime",
+            constraints=ConstraintsProperties(enum=["2025-01-01T10:00:00Z"]),
+        ),
+        FieldProperties(
+            name="letter",
+            type="string",
+            constraints=ConstraintsProperties(pattern="^[a-c]$", enum=["a", "b"]),
+        ),
+    )
+
+    # When
+    data = generate_data(resource_properties, 100, seed=1)
+
+    # Then
+    check_data(data, resource_properties)
+    assert set(data["category"]) == {1, 2}
+    assert set(data["enum"]) == {date(2025, 1, 1), date(2025, 6, 1)}
+    assert set(data["yearmonth"]) == {date(2025, 1, 1), date(2025, 6, 1)}
+    assert set(data["datetime"]) == {datetime(2025, 1, 1, 10)}
+    assert set(data["letter"]) == {"a", "b"}
+
+
+def test_raises_error_for_pattern_without_enum():
+    """Should raise an error if the values must match a pattern, since the
+    values can't be generated from the pattern.
+    """
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(
+            name="code",
+            type="string",
+            constraints=ConstraintsProperties(pattern="^[A-Z]{3}$"),
+        )
+    )
+
+    # When, Then
+    with raises(ValueError, match="pattern"):
+        generate_data(resource_properties, 10)
+
+
+def test_raises_error_if_min_length_is_larger_than_max_length():
+    """Should raise an error if a field's values must be longer than they
+    can be.
+    """
+    # Given
+    resource_properties = properties_with_fields(
+        FieldProperties(
+            name="code",
+            type="string",
+            constraints=ConstraintsProperties(min_length=5, max_length=3),
+        )
+    )
+
+    # When, Then
+    with raises(ValueError, match="min_length"):
+        generate_data(resource_properties, 10)
+
+
+@mark.parametrize(
+    "field",
+    [
+        FieldProperties(
+            name="id",
+            type="integer",
+            constraints=ConstraintsProperties(minimum=1, maximum=5),
+        ),
+        FieldProperties(
+            name="id",
+            type="string",
+            constraints=ConstraintsProperties(max_length=1),
+        ),
+        FieldProperties(name="id", type="string", categories=["a", "b"]),
+        FieldProperties(name="id", type="boolean"),
+    ],
+)
+def test_raises_error_if_too_few_unique_values(field):
+    """Should raise an error if the field can't have as many unique values as
+    there are rows.
+    """
+    # Given
+    resource_properties = properties_with_fields(field, primary_key="id")
+
+    # When, Then
+    with raises(ValueError):
+        generate_data(resource_properties, 20)
+
+
+def test_writes_batch_files(resource_properties):
+    """Should split the generated data into batch files that are newer than
+    the existing ones.
+    """
+    with ExamplePackage() as package_path:
+        # Given
+        batch_path = package_path.resource_batch(resource_properties.name)
+        batch_path.mkdir()
+        existing_path = batch_path / "2999-01-01T000000Z-existing.parquet"
+        generate_data(resource_properties, 10, seed=1).write_parquet(existing_path)
+
+        # When
+        paths = generate_resource_batches(
+            resource_properties, n_rows=100, n_batches=3, seed=2
+        )
+
+        # Then
+        assert package_path.resource_batch_files(resource_properties.name) == [
+            existing_path,
+            *paths,
+        ]
+        assert paths[0].name.startswith("2999-01-01T000001Z-")
+        batches = read_resource_batches(resource_properties, paths)
+        assert [batch.height for batch in batches] == [33, 33, 34]
+        assert_frame_equal(
+            pl.concat(batches).drop("_batch_file_timestamp_"),
+            generate_data(resource_properties, 100, seed=2),
+        )
+
+
+def test_batch_timestamps_start_from_now(resource_properties):
+    """Should give the first batch file the current time if there are no
+    existing batch files.
+    """
+    with ExamplePackage():
+        # Given
+        before = datetime.now(UTC).replace(microsecond=0)
+
+        # When
+        paths = generate_resource_batches(resource_properties, 10, 2, seed=1)
+
+        # Then
+        timestamp = datetime.strptime(paths[0].name[:18], "%Y-%m-%dT%H%M%SZ")
+        assert timestamp.replace(tzinfo=UTC) >= before
+
+
+def test_writes_batch_files_with_write_profile(resource_properties):
+    """Should write the batch files with the profile recorded in the data file,
+    or with the given profile.
+    """
+    with ExamplePackage():
+        # When
+        paths = generate_resource_batches(resource_properties, 10, 1, seed=1)
+        small_paths = generate_resource_batches(
+            resource_properties, 10, 1, seed=1, write_profile="small"
+        )
+
+        # Then
+        assert _read_write_profile(paths[0]) == ParquetWriteProfile.from_name(
+            "balanced"
+        )
+        assert _read_write_profile(small_paths[0]) == ParquetWriteProfile.from_name(
+            "small"
+        )
+
+
+def test_raises_error_for_no_batches(resource_properties):
+    """Should raise an error if less than one batch file is asked for."""
+    with ExamplePackage(), raises(ValueError):
+        generate_resource_batches(resource_properties, 10, 0)
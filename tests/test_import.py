@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+from pytest import raises
+
+import seedcase_sprout as sp
+from seedcase_sprout import _LAZY_EXPORTS
+
+# The dependencies that should only be imported when they are first needed.
+HEAVY_MODULES = [
+    "check_datapackage",
+    "dacite",
+    "jinja2",
+    "polars",
+    "seedcase_soil",
+]
+
+
+def run_python(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_import_heavy_dependencies():
+    """Should not import any of the heavy dependencies when importing the
+    package.
+    """
+    # When
+    result = run_python(
+        "import sys, seedcase_sprout; "
+        f"print([name for name in {HEAVY_MODULES} if name in sys.modules])"
+    )
+
+    # Then
+    assert result.stdout.strip() == "[]"
+
+
+def test_all_exports_can_be_used():
+    """Should import every name in `__all__` when it is first used."""
+    for name in sp.__all__:
+        assert getattr(sp, name) is not None
+    assert set(_LAZY_EXPORTS) <= set(sp.__all__)
+    assert set(sp.__all__) <= set(dir(sp))
+
+
+def test_exports_stay_functions_after_importing_their_module():
+    """Should keep the function, rather than its module with the same name,
+    after the module is imported directly.
+    """
+    # When
+    result = run_python(
+        "import seedcase_sprout.write_resource_data; "
+        "import seedcase_sprout as sp; "
+        "print(type(sp.write_resource_data).__name__, type(sp.check_keys).__name__)"
+    )
+
+    # Then
+    assert result.stdout.split() == ["function", "function"]
+
+
+def test_raises_error_for_unknown_name():
+    """Should raise an AttributeError for names that aren't exported."""
+    with raises(AttributeError):
+        sp.not_a_function  # noqa: B018
@@ -1,14 +1,26 @@
+from datetime import UTC, datetime
+
 import polars as pl
 from polars.testing import assert_frame_equal
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 
-from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_DATA_TYPE,
+)
 from seedcase_sprout.examples import example_resource_properties
-from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.join_resource_batches import (
+    _drop_duplicate_obs_units,
+    _stream_latest_obs_units,
+    join_resource_batches,
+)
 from seedcase_sprout.properties import (
     ResourceProperties,
 )
 
+timestamp_2024 = datetime(2024, 3, 26, 10, tzinfo=UTC)
+timestamp_2025 = datetime(2025, 3, 26, 10, tzinfo=UTC)
+
 
 @fixture
 def data_list() -> list[pl.DataFrame]:
@@ -19,7 +31,7 @@ def data_list() -> list[pl.DataFrame]:
                 "name": ["anne", "belinda"],
                 "value": [0.0, 1.1],
                 # timestamp col from `read_resource_batches`
-                BATCH_TIMESTAMP_COLUMN_NAME: ["2025-03-26T100000Z"] * 2,
+                BATCH_TIMESTAMP_COLUMN_NAME: [timestamp_2025] * 2,
             }
         ),
         pl.DataFrame(
@@ -28,7 +40,7 @@ def data_list() -> list[pl.DataFrame]:
                 "name": ["catherine", "dorothy", "anne", "anne", "alberta"],
                 "value": [2.2, 3.3, 0.0, 9.9, 0.0],
                 # timestamp col from `read_resource_batches` (different year than above)
-                BATCH_TIMESTAMP_COLUMN_NAME: ["2024-03-26T100000Z"] * 5,
+                BATCH_TIMESTAMP_COLUMN_NAME: [timestamp_2024] * 5,
             }
         ),
     ]
@@ -146,7 +158,7 @@ def test_throws_error_with_data_of_different_shapes(data_list, resource_properti
                 "id": [2],
                 "name": ["bertha"],
                 # value column is missing
-                BATCH_TIMESTAMP_COLUMN_NAME: ["2024-03-26T100000Z"],
+                BATCH_TIMESTAMP_COLUMN_NAME: [timestamp_2024],
             }
         )
     )
@@ -168,13 +180,13 @@ def test_throws_error_with_non_matching_data_types(data_list, resource_propertie
                 "id": [2],
                 "name": ["bertha"],
                 "value": [1.1],
-                BATCH_TIMESTAMP_COLUMN_NAME: ["2024-03-26T100000Z"],
+                BATCH_TIMESTAMP_COLUMN_NAME: [timestamp_2024],
             },
             schema={
                 "id": pl.Int64,
                 "name": pl.String,
                 "value": pl.Object,  # different type than the other dataframes
-                BATCH_TIMESTAMP_COLUMN_NAME: pl.String,
+                BATCH_TIMESTAMP_COLUMN_NAME: BATCH_TIMESTAMP_DATA_TYPE,
             },
         ),
     )
@@ -196,7 +208,7 @@ def test_throws_error_with_non_matching_column_names(data_list, resource_propert
                 "id": [2],
                 "unexpected_column_name": ["bertha"],
                 "value": [1.1],
-                BATCH_TIMESTAMP_COLUMN_NAME: ["2024-03-26T100000Z"],
+                BATCH_TIMESTAMP_COLUMN_NAME: [timestamp_2024],
             },
         )
     )
@@ -231,3 +243,105 @@ def test_throws_error_with_empty_data_list(resource_properties):
         join_resource_batches([], resource_properties)
 
     assert resource_properties.name in str(error)
+
+
+def test_keeps_last_of_duplicates_with_same_timestamp(data_list, resource_properties):
+    """Of duplicate observational units with the same latest timestamp, the last one
+    in the data list is kept.
+    """
+    # Given
+    resource_properties.schema.primary_key = "id"
+    data_list[1] = data_list[1].with_columns(
+        pl.lit(timestamp_2025).alias(BATCH_TIMESTAMP_COLUMN_NAME)
+    )
+
+    # When
+    joined_batches = join_resource_batches(data_list, resource_properties)
+
+    # Then
+    assert joined_batches.filter(pl.col("id") == 0)["name"].to_list() == ["alberta"]
+
+
+def test_keeps_order_of_rows_when_asked(data_list, resource_properties):
+    """Without a primary key, the rows are kept in the order of the data list
+    with `maintain_order`.
+    """
+    # When
+    joined_batches = join_resource_batches(
+        data_list, resource_properties, maintain_order=True
+    )
+
+    # Then
+    assert joined_batches["id"].to_list() == [0, 1, 2, 3, 0, 0]
+
+
+@mark.parametrize("maintain_order", [False, True])
+def test_orders_rows_by_timestamp_with_primary_key(
+    data_list, resource_properties, maintain_order
+):
+    """With a primary key, the rows are always in the order of their batch's
+    timestamp, whether or not `maintain_order` is used.
+    """
+    # Given
+    resource_properties.schema.primary_key = "id"
+
+    # When
+    joined_batches = join_resource_batches(
+        data_list, resource_properties, maintain_order=maintain_order
+    )
+
+    # Then
+    assert joined_batches["id"].to_list() == [2, 3, 0, 1]
+
+
+def test_keeps_same_rows_as_sorting_by_timestamp(resource_properties):
+    """The latest observational units are kept, the same as when sorting all rows by
+    their timestamp and keeping the last row of each primary key.
+    """
+    # Given
+    resource_properties.schema.primary_key = "id"
+    timestamps = [datetime(2025, 3, day, 10, tzinfo=UTC) for day in range(1, 29)]
+    data = pl.DataFrame(
+        {
+            "id": pl.int_range(1000, eager=True).shuffle(seed=1) % 100,
+            "name": pl.int_range(1000, eager=True).cast(pl.String),
+            "value": pl.int_range(1000, eager=True).cast(pl.Float64),
+            BATCH_TIMESTAMP_COLUMN_NAME: pl.Series(timestamps * 36)
+            .head(1000)
+            .shuffle(seed=2),
+        }
+    )
+
+    # When
+    joined_batches = join_resource_batches(
+        list(data.iter_slices(100)), resource_properties
+    )
+
+    # Then
+    expected_joined_batches = (
+        data.sort(BATCH_TIMESTAMP_COLUMN_NAME, maintain_order=True)
+        .drop(BATCH_TIMESTAMP_COLUMN_NAME)
+        .unique(subset="id", keep="last")
+    )
+    assert_frame_equal(joined_batches.sort("id"), expected_joined_batches.sort("id"))
+
+
+@mark.parametrize("primary_key", ["id", ["id", "name"]])
+def test_streaming_keeps_same_rows_as_in_memory(data_list, primary_key):
+    """Dropping duplicates in two streaming passes keeps the same rows as doing it
+    in memory, including the last of duplicates with the same timestamp.
+    """
+    # Given
+    data_list.append(
+        data_list[1]
+        .tail(2)
+        .with_columns(pl.lit(timestamp_2025).alias(BATCH_TIMESTAMP_COLUMN_NAME))
+    )
+    data = pl.concat(data_list)
+
+    # When
+    streamed_data = _stream_latest_obs_units(data.lazy(), primary_key).collect()
+
+    # Then
+    expected_data = _drop_duplicate_obs_units(data, primary_key)
+    assert_frame_equal(streamed_data, expected_data, check_row_order=False)
@@ -0,0 +1,91 @@
+import polars as pl
+from pytest import mark, raises
+
+from seedcase_sprout.examples import (
+    ExamplePackage,
+    example_data,
+    example_resource_properties,
+)
+from seedcase_sprout.parquet_write_profile import (
+    ParquetWriteProfile,
+    _read_write_profile,
+)
+from seedcase_sprout.rebuild_resource_data import rebuild_resource_data
+from seedcase_sprout.write_resource_data import write_resource_data
+
+
+@mark.parametrize("name", ["balanced", "fast-read", "small"])
+def test_gets_named_profiles(name):
+    """Should get each of the named profiles."""
+    assert isinstance(ParquetWriteProfile.from_name(name), ParquetWriteProfile)
+
+
+def test_overrides_settings_of_named_profile():
+    """Should override the given settings and keep the rest of the profile."""
+    profile = ParquetWriteProfile.from_name("small", row_group_size=10)
+
+    assert profile.row_group_size == 10
+    assert profile.compression_level == 19
+
+
+def test_raises_error_with_unknown_profile_name():
+    """Should raise an error if there is no profile with the given name."""
+    with raises(ValueError, match="fast-read"):
+        ParquetWriteProfile.from_name("fastest")
+
+
+def test_writes_data_with_profile():
+    """Should write the data with the profile and record it in the file."""
+    # Given
+    profile = ParquetWriteProfile.from_name("fast-read", row_group_size=1)
+
+    # When
+    with ExamplePackage():
+        data_path = write_resource_data(
+            example_data(), example_resource_properties(), write_profile=profile
+        )
+
+        # Then
+        assert _read_write_profile(data_path) == profile
+        assert pl.read_parquet(data_path).equals(example_data())
+
+
+def test_keeps_recorded_profile_when_profile_not_given():
+    """Should reuse the recorded profile when writing again without a profile."""
+    with ExamplePackage():
+        data_path = write_resource_data(
+            example_data(), example_resource_properties(), write_profile="small"
+        )
+
+        write_resource_data(example_data(), example_resource_properties())
+
+        assert _read_write_profile(data_path) == ParquetWriteProfile.from_name("small")
+
+
+def test_rebuild_keeps_recorded_profile():
+    """Should rebuild the data file with the profile recorded in it."""
+    # Given
+    resource_properties = example_resource_properties()
+    with ExamplePackage() as package_path:
+        data_path = write_resource_data(
+            example_data(), resource_properties, write_profile="fast-read"
+        )
+        batch_path = package_path.resource_batch(str(resource_properties.name))
+        batch_path.mkdir()
+        example_data().write_parquet(batch_path / "2025-03-26T100346Z-1.parquet")
+
+        # When
+        rebuild_resource_data(resource_properties)
+
+        # Then
+        assert _read_write_profile(data_path) == ParquetWriteProfile.from_name(
+            "fast-read"
+        )
+
+
+def test_finds_no_profile_in_files_not_written_by_sprout(tmp_path):
+    """Should not find a profile in Parquet files not written by Sprout."""
+    data_path = tmp_path / "data.parquet"
+    example_data().write_parquet(data_path)
+
+    assert _read_write_profile(data_path) is None
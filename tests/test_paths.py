@@ -1,6 +1,29 @@
-from pytest import mark
+import os
+from datetime import UTC, datetime
+
+from pytest import fixture, mark, raises
 
 from seedcase_sprout import PackagePath
+from seedcase_sprout.batch_index import _batch_index_cache
+
+BATCH_FILE_NAMES = [
+    "2025-03-26T100346Z-b.parquet",
+    "2024-01-01T000000Z-a.parquet",
+    "2025-03-26T100346Z-a.parquet",
+    "2025-01-01T120000Z-a.parquet",
+]
+
+
+@fixture
+def batch_package_path(tmp_path):
+    _batch_index_cache.clear()
+    package_path = PackagePath(tmp_path)
+    batch_path = package_path.resource_batch("test")
+    batch_path.mkdir(parents=True)
+    for name in BATCH_FILE_NAMES:
+        (batch_path / name).touch()
+    yield package_path
+    _batch_index_cache.clear()
 
 
 def test_package_path_outputs_an_absolute_path(tmp_path):
@@ -15,6 +38,7 @@ def test_package_path_outputs_an_absolute_path(tmp_path):
     assert path.resource("test").is_absolute()
     assert path.resource_data("test").is_absolute()
     assert path.resource_batch("test").is_absolute()
+    assert path.resource_batch_manifest("test").is_absolute()
 
 
 def test_methods_return_correct_path(tmp_path):
@@ -28,10 +52,22 @@ def test_methods_return_correct_path(tmp_path):
         package_path.resource_data("test")
         == tmp_path / "resources" / "test" / "data.parquet"
     )
+    assert (
+        package_path.resource_data_sidecar("test")
+        == tmp_path / "resources" / "test" / "data.arrow"
+    )
+    assert (
+        package_path.resource_partitioned_data("test")
+        == tmp_path / "resources" / "test" / "data"
+    )
 
     assert (
         package_path.resource_batch("test") == tmp_path / "resources" / "test" / "batch"
     )
+    assert (
+        package_path.resource_batch_manifest("test")
+        == tmp_path / "resources" / "test" / "batch-manifest.json"
+    )
 
 
 def test_resource_batch_files_returns_empty_list_when_no_batches(tmp_path):
@@ -51,11 +87,130 @@ def test_resource_batch_files_returns_file_paths_when_batches(tmp_path):
         batch_folder = package_path.resource_batch(resource)
         batch_folder.mkdir(parents=True)
         (batch_folder / "sub-folder").mkdir()
-        for file in ["file", "file.txt", "file.parquet"]:
+        for file in ["file", "file.txt", "2025-03-26T100346Z-a.parquet"]:
             (batch_folder / file).touch()
 
     # Only the batch file for the given resource should be returned
-    assert package_path.resource_batch_files("test2") == [batch_folder / "file.parquet"]
+    assert package_path.resource_batch_files("test2") == [
+        batch_folder / "2025-03-26T100346Z-a.parquet"
+    ]
+
+
+def test_resource_batch_files_are_sorted_by_timestamp(batch_package_path):
+    """resource_batch_files() should return the batch files sorted by timestamp."""
+    batch_path = batch_package_path.resource_batch("test")
+    assert batch_package_path.resource_batch_files("test") == [
+        batch_path / name for name in sorted(BATCH_FILE_NAMES)
+    ]
+
+
+def test_resource_batch_index_is_sorted_by_timestamp(batch_package_path):
+    """resource_batch_index() should list the batch files and their timestamps,
+    sorted by timestamp and then path.
+    """
+    # When
+    index = batch_package_path.resource_batch_index("test")
+
+    # Then
+    batch_path = batch_package_path.resource_batch("test")
+    assert index["path"].to_list() == [
+        str(batch_path / name) for name in sorted(BATCH_FILE_NAMES)
+    ]
+    assert index["timestamp"].to_list() == [
+        datetime(2024, 1, 1, tzinfo=UTC),
+        datetime(2025, 1, 1, 12, tzinfo=UTC),
+        datetime(2025, 3, 26, 10, 3, 46, tzinfo=UTC),
+        datetime(2025, 3, 26, 10, 3, 46, tzinfo=UTC),
+    ]
+
+
+def test_resource_batch_index_is_empty_when_no_batches(tmp_path):
+    """resource_batch_index() should be empty when there is no batch folder."""
+    assert PackagePath(tmp_path).resource_batch_index("test").is_empty()
+
+
+def test_resource_batch_index_filters_by_time_range(batch_package_path):
+    """resource_batch_index() should only include batch files within the start and
+    end timestamps, including both ends.
+    """
+    # When
+    index = batch_package_path.resource_batch_index(
+        "test", start=datetime(2025, 1, 1, 12), end=datetime(2025, 3, 1, tzinfo=UTC)
+    )
+
+    # Then
+    assert index["path"].to_list() == [
+        str(batch_package_path.resource_batch("test") / "2025-01-01T120000Z-a.parquet")
+    ]
+
+
+def test_resource_batch_index_is_updated_when_batch_folder_changes(
+    batch_package_path,
+):
+    """resource_batch_index() should include batch files added after it was first
+    created.
+    """
+    # Given
+    batch_path = batch_package_path.resource_batch("test")
+    assert batch_package_path.resource_batch_index("test").height == 4
+    (batch_path / "2026-01-01T000000Z-a.parquet").touch()
+    stat = batch_path.stat()
+    os.utime(batch_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    # When
+    index = batch_package_path.resource_batch_index("test")
+
+    # Then
+    assert index.height == 5
+    assert index["timestamp"][-1] == datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_resource_batch_index_is_cached(batch_package_path):
+    """resource_batch_index() should use the cached index while the batch folder
+    hasn't been modified.
+    """
+    # Given
+    batch_path = batch_package_path.resource_batch("test")
+    old_mtime_ns = batch_path.stat().st_mtime_ns - 60_000_000_000
+    os.utime(batch_path, ns=(old_mtime_ns, old_mtime_ns))
+    assert batch_package_path.resource_batch_index("test").height == 4
+    (batch_path / "2026-01-01T000000Z-a.parquet").touch()
+    os.utime(batch_path, ns=(old_mtime_ns, old_mtime_ns))
+
+    # When, Then
+    assert batch_package_path.resource_batch_index("test").height == 4
+
+
+@mark.parametrize(
+    "name",
+    ["no-timestamp.parquet", "2025-02-30T100346Z-a.parquet", "2025-03-26.parquet"],
+)
+def test_resource_batch_index_raises_error_for_incorrect_timestamps(
+    batch_package_path, name
+):
+    """resource_batch_index() should raise an error if a batch file name doesn't
+    contain a correct timestamp.
+    """
+    # Given
+    (batch_package_path.resource_batch("test") / name).touch()
+
+    # When, Then
+    with raises(ValueError, match="1 batch file name"):
+        batch_package_path.resource_batch_index("test")
+
+
+def test_resource_batch_files_raises_error_for_incorrect_timestamps(
+    batch_package_path,
+):
+    """resource_batch_files() should raise an error if a batch file name doesn't
+    contain a correct timestamp, since it uses the index of the batch files.
+    """
+    # Given
+    (batch_package_path.resource_batch("test") / "no-timestamp.parquet").touch()
+
+    # When, Then
+    with raises(ValueError, match="no-timestamp"):
+        batch_package_path.resource_batch_files("test")
 
 
 def test_path_defaults_to_cwd_at_call_time(tmp_cwd):
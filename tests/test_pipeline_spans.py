@@ -0,0 +1,133 @@
+import sys
+
+import polars as pl
+from pytest import mark, raises
+
+from seedcase_sprout.check_data import check_data
+from seedcase_sprout.examples import (
+    ExamplePackage,
+    example_data,
+    example_resource_properties,
+)
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.pipeline_spans import (
+    _NO_SPAN,
+    PipelineSpan,
+    _span,
+    _spans,
+    add_pipeline_span_callback,
+    record_pipeline_spans,
+    remove_pipeline_span_callback,
+)
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.write_resource_data import write_resource_data
+
+
+def span_names(spans: list[PipelineSpan]) -> list[str]:
+    return [span.name for span in spans]
+
+
+def test_spans_do_nothing_without_callbacks():
+    """Should not time any spans if no callbacks have been added."""
+    # When
+    span = _span("stage")
+
+    # Then
+    assert _spans.callbacks == ()
+    assert span is _NO_SPAN
+
+
+def test_records_spans_of_the_pipeline():
+    """Should record the spans of reading, joining, and writing the data,
+    with the number of rows and bytes handled.
+    """
+    # Given
+    resource_properties = example_resource_properties()
+    resource_properties.schema.primary_key = "id"
+
+    with ExamplePackage() as package_path:
+        batch_path = package_path.resource_batch(resource_properties.name)
+        batch_path.mkdir()
+        batch_file_path = batch_path / "2025-03-26T100000Z-1.parquet"
+        example_data().write_parquet(batch_file_path)
+        batch_file_size = batch_file_path.stat().st_size
+
+        # When
+        with record_pipeline_spans() as spans:
+            batches = read_resource_batches(resource_properties)
+            data = join_resource_batches(batches, resource_properties)
+            write_resource_data(data, resource_properties)
+
+    # Then
+    names = span_names(spans)
+    assert names.index("read_resource_batches.read_parquet") < names.index(
+        "read_resource_batches"
+    )
+    for name in [
+        "check_resource_properties",
+        "read_resource_batches.check_schemas",
+        "check_data",
+        "check_data.constraints",
+        "join_resource_batches.concat",
+        "join_resource_batches.drop_duplicates",
+        "check_keys",
+        "join_resource_batches",
+        "write_resource_data.sort",
+        "write_resource_data.write_parquet",
+        "write_resource_data",
+    ]:
+        assert name in names
+    spans_by_name = {span.name: span for span in spans}
+    read_span = spans_by_name["read_resource_batches.read_parquet"]
+    assert read_span.rows == example_data().height
+    assert read_span.bytes == batch_file_size
+    assert spans_by_name["join_resource_batches"].rows == example_data().height
+    assert spans_by_name["write_resource_data.write_parquet"].bytes > 0
+    assert all(span.seconds >= 0 for span in spans)
+    assert all(span.peak_memory_bytes is None for span in spans)
+    assert _spans.callbacks == ()
+
+
+def test_calls_added_callback_until_removed():
+    """Should call the callback with each span until it is removed."""
+    # Given
+    spans = []
+    callback = add_pipeline_span_callback(spans.append)
+
+    # When
+    check_data(example_data(), example_resource_properties())
+    remove_pipeline_span_callback(callback)
+    check_data(example_data(), example_resource_properties())
+
+    # Then
+    assert span_names(spans) == [
+        "check_resource_properties",
+        "check_data.constraints",
+        "check_data",
+    ]
+    assert spans[-1].rows == example_data().height
+
+
+def test_does_not_record_spans_that_fail():
+    """Should not pass spans of stages that raise an error to the callbacks."""
+    # Given
+    data = example_data().with_columns(pl.lit("not a number").alias("value"))
+
+    # When
+    with record_pipeline_spans() as spans, raises(ExceptionGroup):
+        check_data(data, example_resource_properties())
+
+    # Then
+    assert span_names(spans) == ["check_resource_properties"]
+
+
+@mark.skipif(sys.platform != "linux", reason="Memory is only tracked on Linux.")
+def test_tracks_peak_memory():
+    """Should record the peak memory of each span if asked for."""
+    # When
+    with record_pipeline_spans(track_memory=True) as spans:
+        check_data(example_data(), example_resource_properties())
+
+    # Then
+    assert all(span.peak_memory_bytes > 0 for span in spans)
+    assert _spans.track_memory is False
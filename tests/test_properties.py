@@ -163,6 +163,13 @@ def test_transforms_dict_to_properties(dict, expected_properties):
             ResourceProperties(name="test-resource", path="some/path"),
             str(Path("resources", "test-resource", "data.parquet")),
         ),
+        (
+            ResourceProperties(
+                name="test-resource",
+                path=str(Path("resources", "test-resource", "data")),
+            ),
+            str(Path("resources", "test-resource", "data")),
+        ),
     ],
 )
 def test_autogenerates_resource_data_path(resource_properties, path):
@@ -1,13 +1,20 @@
+from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 from uuid import uuid4
 
 import polars as pl
+from polars.testing import assert_frame_equal
 from pytest import fixture, mark, raises
 
 from seedcase_sprout.check_properties import DataResourceError
-from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.constants import (
+    BATCH_TIMESTAMP_COLUMN_NAME,
+    BATCH_TIMESTAMP_DATA_TYPE,
+)
 from seedcase_sprout.examples import example_resource_properties
 from seedcase_sprout.properties import (
+    ConstraintsProperties,
     FieldProperties,
     ResourceProperties,
     TableSchemaProperties,
@@ -15,6 +22,7 @@ from seedcase_sprout.properties import (
 from seedcase_sprout.read_resource_batches import (
     read_resource_batches,
 )
+from tests.assert_raises_errors import assert_raises_errors
 from tests.directory_structure_setup import (
     create_test_data_package,
 )
@@ -85,8 +93,10 @@ def test_reads_resource_batches_correctly(resource_paths, resource_properties):
     assert all(data.shape == (3, 3) for data in data_list)
     assert all(len(column.unique()) == 1 for column in timestamp_column)
     assert all(
-        column.unique()[0] == "2025-03-26T100346Z" for column in timestamp_column
+        column.unique()[0] == datetime(2025, 3, 26, 10, 3, 46, tzinfo=UTC)
+        for column in timestamp_column
     )
+    assert all(column.dtype == BATCH_TIMESTAMP_DATA_TYPE for column in timestamp_column)
 
 
 def test_raises_error_when_file_does_not_exist(resource_paths, resource_properties):
@@ -118,10 +128,14 @@ def test_raises_error_when_timestamp_column_matches_existing_column(
     """Raises ValueError when the timestamp column name matches an existing column."""
     # Given
     batch_path = resource_paths[0].parent
+    resource_properties.schema.fields.append(
+        FieldProperties(name=BATCH_TIMESTAMP_COLUMN_NAME, type="string")
+    )
 
     batch_data = pl.DataFrame(
         {
             "id": [0, 1, 2],
+            "name": ["anne", "belinda", "catherine"],
             BATCH_TIMESTAMP_COLUMN_NAME: ["2024-03-26T100346Z"] * 3,
         }
     )
@@ -178,7 +192,9 @@ def test_if_multiple_correct_timestamps_in_file_name_use_first_one(
     )
 
     # Then
-    assert data_list[0][BATCH_TIMESTAMP_COLUMN_NAME][0] == "2025-03-26T100346Z"
+    assert data_list[0][BATCH_TIMESTAMP_COLUMN_NAME][0] == datetime(
+        2025, 3, 26, 10, 3, 46, tzinfo=UTC
+    )
 
 
 def test_raises_error_when_properties_do_not_match_data(
@@ -189,11 +205,45 @@ def test_raises_error_when_properties_do_not_match_data(
     resource_properties.schema.fields[0].name = "not-id"
 
     # When, Then
-    with raises(ValueError):
-        read_resource_batches(
+    assert_raises_errors(
+        lambda: read_resource_batches(
             resource_properties=resource_properties, paths=resource_paths
+        ),
+        ValueError,
+        error_count=2,
+    )
+
+
+def test_checks_schemas_of_all_files_before_reading_data(
+    resource_paths, resource_properties
+):
+    """Reports every batch file with an incorrect schema, without reading any
+    data.
+    """
+    # Given
+    batch_path = resource_paths[0].parent
+    bad_paths = [batch_path / f"2025-03-26T100346Z-{uuid4()}.parquet" for _ in range(2)]
+    batch_data_1.rename({"name": "not-name"}).write_parquet(bad_paths[0])
+    batch_data_1.with_columns(pl.col("id").cast(pl.String)).write_parquet(bad_paths[1])
+
+    # When
+    with (
+        patch("seedcase_sprout.read_resource_batches.pl.read_parquet") as read_parquet,
+        raises(ExceptionGroup) as error_info,
+    ):
+        read_resource_batches(
+            resource_properties=resource_properties,
+            paths=resource_paths + bad_paths,
         )
 
+    # Then
+    read_parquet.assert_not_called()
+    errors = error_info.value.exceptions
+    assert isinstance(errors[0], ValueError)
+    assert isinstance(errors[1], ExceptionGroup)
+    for error, bad_path in zip(errors, bad_paths):
+        assert f"Batch file: {bad_path}" in error.__notes__
+
 
 def test_raises_error_with_empty_resource_properties(resource_paths):
     """Raises errors from checks if the resource properties are empty."""
@@ -222,3 +272,56 @@ def test_no_error_thrown_when_no_batches_using_cwd_as_default(
     data_list = read_resource_batches(resource_properties)
 
     assert len(data_list) == 0
+
+
+def test_reads_resource_batches_in_parallel(resource_paths, resource_properties):
+    """Reading in parallel gives the same DataFrames in the same order."""
+    # Given
+    batch_path = resource_paths[0].parent
+    for index in range(10):
+        batch_data_1.with_columns(pl.col("id") + index).write_parquet(
+            batch_path / f"2025-03-26T1003{index:02}Z-{uuid4()}.parquet"
+        )
+    resource_paths = sorted(batch_path.iterdir())
+
+    # When
+    data_list = read_resource_batches(
+        resource_properties=resource_properties, paths=resource_paths, max_workers=4
+    )
+
+    # Then
+    expected_data_list = read_resource_batches(
+        resource_properties=resource_properties, paths=resource_paths
+    )
+    assert len(data_list) == len(expected_data_list) == 12
+    for data, expected_data in zip(data_list, expected_data_list):
+        assert_frame_equal(data, expected_data)
+
+
+def test_reports_all_failing_files_when_reading_in_parallel(
+    resource_paths, resource_properties
+):
+    """Reading in parallel raises one error group with an error per failing file."""
+    # Given
+    resource_properties.schema.fields[0].constraints = ConstraintsProperties(maximum=10)
+    batch_path = resource_paths[0].parent
+    bad_paths = []
+    for timestamp in ["2025-03-27T100346Z", "2025-03-28T100346Z"]:
+        bad_path = batch_path / f"{timestamp}-{uuid4()}.parquet"
+        batch_data_1.with_columns(id=pl.lit(99)).write_parquet(bad_path)
+        bad_paths.append(bad_path)
+
+    # When
+    with raises(ExceptionGroup) as error_info:
+        read_resource_batches(
+            resource_properties=resource_properties,
+            paths=resource_paths + bad_paths,
+            max_workers=4,
+        )
+
+    # Then
+    errors = error_info.value.exceptions
+    assert len(errors) == 2
+    assert all(isinstance(error, ExceptionGroup) for error in errors)
+    for error, bad_path in zip(errors, bad_paths):
+        assert f"Batch file: {bad_path}" in error.__notes__
@@ -1,6 +1,14 @@
-from pytest import raises
+import polars as pl
+from pytest import fixture, raises
 
-from seedcase_sprout import ExamplePackage, example_data, read_resource_data
+from seedcase_sprout import (
+    ExamplePackage,
+    ParquetWriteProfile,
+    example_data,
+    example_resource_properties,
+    read_resource_data,
+    write_resource_data,
+)
 
 
 def test_read_resource_data():
@@ -20,3 +28,79 @@ def test_read_resource_data_with_package_path():
 def test_read_resource_data_with_wrong_resource():
     with raises(FileNotFoundError):
         read_resource_data("wrong-name")
+
+
+@fixture
+def sorted_package_path():
+    resource_properties = example_resource_properties()
+    resource_properties.schema.primary_key = ["id", "name"]
+    data = pl.DataFrame(
+        {
+            "id": pl.Series(range(1000), dtype=pl.Int32),
+            "name": [f"name-{i % 7}" for i in range(1000)],
+            "value": [float(i) for i in range(1000)],
+        }
+    ).sample(fraction=1, shuffle=True, seed=1)
+    profile = ParquetWriteProfile.from_name("fast-read", row_group_size=100)
+
+    with ExamplePackage() as package_path:
+        write_resource_data(data, resource_properties, write_profile=profile)
+        yield package_path
+
+
+def test_writes_data_sorted_by_primary_key(sorted_package_path):
+    """Should sort the data by the primary key with the fast-read profile."""
+    data = read_resource_data("example-resource")
+
+    assert data["id"].is_sorted()
+
+
+def test_reads_data_for_keys(sorted_package_path):
+    """Should only read the rows with the given keys."""
+    data = read_resource_data(
+        "example-resource",
+        keys={"id": [5, 500, 5], "name": ["name-5", "wrong", "name-5"]},
+    )
+
+    assert data["id"].to_list() == [5]
+
+
+def test_reads_data_for_single_key_field(sorted_package_path):
+    """Should read the rows for keys with one field, ignoring missing values."""
+    data = read_resource_data(
+        "example-resource", keys=pl.DataFrame({"id": [999, 3, None]})
+    )
+
+    assert sorted(data["id"].to_list()) == [3, 999]
+
+
+def test_reads_no_data_for_no_keys(sorted_package_path):
+    """Should read no rows when given no keys."""
+    data = read_resource_data("example-resource", keys={"id": []})
+
+    assert data.is_empty()
+    assert data.columns == ["id", "name", "value"]
+
+
+def test_reads_only_selected_columns_and_rows(sorted_package_path):
+    """Should apply the columns, filter, and number of rows while reading."""
+    data = read_resource_data(
+        "example-resource",
+        columns=["name"],
+        filter=pl.col("id") >= 990,
+        n_rows=5,
+    )
+
+    assert data.columns == ["name"]
+    assert data.height == 5
+
+
+def test_combines_keys_and_filter(sorted_package_path):
+    """Should only read the rows matching both the keys and the filter."""
+    data = read_resource_data(
+        "example-resource",
+        keys={"id": [1, 2, 3]},
+        filter=pl.col("value") > 1,
+    )
+
+    assert sorted(data["id"].to_list()) == [2, 3]
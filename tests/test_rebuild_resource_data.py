@@ -0,0 +1,192 @@
+from pathlib import Path
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import fixture, raises
+
+from seedcase_sprout.examples import ExamplePackage, example_resource_properties
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.paths import PackagePath
+from seedcase_sprout.properties import ConstraintsProperties, ResourceProperties
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.read_resource_data import read_resource_data
+from seedcase_sprout.rebuild_resource_data import rebuild_resource_data
+from seedcase_sprout.write_resource_data import write_resource_data
+
+batch_data_1 = pl.DataFrame(
+    {
+        "id": [0, 1],
+        "name": ["anne", "belinda"],
+        "value": [0.0, 1.1],
+    }
+)
+
+batch_data_2 = pl.DataFrame(
+    {
+        "id": [2, 3, 0],
+        "name": ["catherine", "dorothy", "alberta"],
+        "value": [2.2, 3.3, 9.9],
+    }
+)
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    resource_properties = example_resource_properties()
+    resource_properties.schema.primary_key = "id"
+    return resource_properties
+
+
+@fixture
+def package_path(resource_properties):
+    with ExamplePackage() as package_path:
+        batch_path = package_path.resource_batch(str(resource_properties.name))
+        batch_path.mkdir()
+        batch_data_1.write_parquet(batch_path / "2024-03-26T100000Z-1.parquet")
+        batch_data_2.write_parquet(batch_path / "2025-03-26T100000Z-2.parquet")
+        yield package_path
+
+
+def test_rebuilds_data_same_as_in_memory_join(package_path, resource_properties):
+    """Should write the same data as reading and joining the batches in memory."""
+    # When
+    data_path = rebuild_resource_data(resource_properties, package_path.root())
+
+    # Then
+    expected_data = join_resource_batches(
+        read_resource_batches(resource_properties), resource_properties
+    )
+    assert data_path == package_path.resource_data(str(resource_properties.name))
+    assert_frame_equal(pl.read_parquet(data_path), expected_data, check_row_order=False)
+    assert pl.read_parquet(data_path).filter(id=0)["name"].to_list() == ["alberta"]
+
+
+def test_rebuilds_data_with_small_chunk_size(package_path, resource_properties):
+    """Should give the same result when streaming in very small chunks."""
+    # When
+    data_path = rebuild_resource_data(resource_properties, chunk_size=1)
+
+    # Then
+    assert pl.read_parquet(data_path).sort("id")["id"].to_list() == [0, 1, 2, 3]
+
+
+def test_keeps_old_data_file_if_rebuild_fails(package_path, resource_properties):
+    """Should keep the old data file if the batches don't match the properties."""
+    # Given
+    data_path = PackagePath().resource_data(str(resource_properties.name))
+    old_data = pl.read_parquet(data_path)
+    resource_properties.schema.fields[1].name = "not-name"
+
+    # When
+    with raises(ExceptionGroup):
+        rebuild_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(pl.read_parquet(data_path), old_data)
+
+
+def test_removes_ipc_sidecar_of_old_data_file(package_path, resource_properties):
+    """Should remove the Arrow IPC sidecar, since it has the old data."""
+    # Given
+    write_resource_data(batch_data_1, resource_properties, ipc_sidecar=True)
+    sidecar_path = package_path.resource_data_sidecar(str(resource_properties.name))
+
+    # When
+    rebuild_resource_data(resource_properties)
+
+    # Then
+    assert list(sidecar_path.parent.glob(f"{sidecar_path.name}*")) == []
+
+
+def test_raises_error_when_no_batches(resource_properties):
+    """Should raise an error if the resource has no batch files."""
+    with ExamplePackage(), raises(ValueError):
+        rebuild_resource_data(resource_properties)
+
+
+def test_keeps_old_data_file_if_keys_are_not_unique(package_path, resource_properties):
+    """Should keep the old data file if the rebuilt data has duplicate keys."""
+    # Given
+    data_path = PackagePath().resource_data(str(resource_properties.name))
+    old_data = pl.read_parquet(data_path)
+    resource_properties.schema.unique_keys = [["value"]]
+    batch_path = package_path.resource_batch(str(resource_properties.name))
+    batch_data_1.with_columns(id=pl.Series([4, 5])).write_parquet(
+        batch_path / "2026-03-26T100000Z-3.parquet"
+    )
+
+    # When
+    with raises(ExceptionGroup):
+        rebuild_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(pl.read_parquet(data_path), old_data)
+    assert not data_path.with_suffix(".parquet.tmp").exists()
+
+
+def test_keeps_old_data_file_if_values_do_not_meet_constraints(
+    package_path, resource_properties
+):
+    """Should keep the old data file if the rebuilt data has values that don't
+    meet the constraints.
+    """
+    # Given
+    data_path = rebuild_resource_data(resource_properties)
+    old_data = pl.read_parquet(data_path)
+    resource_properties.schema.fields[2].constraints = ConstraintsProperties(maximum=5)
+    batch_path = package_path.resource_batch(str(resource_properties.name))
+    batch_data_1.with_columns(id=pl.Series([4, 5]), value=99.0).write_parquet(
+        batch_path / "2026-03-26T100000Z-3.parquet"
+    )
+
+    # When
+    with raises(ExceptionGroup) as error:
+        rebuild_resource_data(resource_properties)
+
+    # Then
+    assert "maximum" in str(error.value.exceptions[0])
+    assert_frame_equal(pl.read_parquet(data_path), old_data)
+    assert not data_path.with_suffix(".parquet.tmp").exists()
+
+
+def test_keeps_data_partitioned_by_same_field(package_path, resource_properties):
+    """Should rebuild partitioned data with the same partition field."""
+    # Given
+    write_resource_data(batch_data_1, resource_properties, partition_by="name")
+
+    # When
+    data_path = rebuild_resource_data(resource_properties)
+
+    # Then
+    assert data_path == package_path.resource_partitioned_data(
+        str(resource_properties.name)
+    )
+    assert not package_path.resource_data(str(resource_properties.name)).exists()
+    assert {path.name for path in data_path.iterdir()} == {
+        "name=alberta",
+        "name=belinda",
+        "name=catherine",
+        "name=dorothy",
+    }
+    assert_frame_equal(
+        read_resource_data(str(resource_properties.name)),
+        join_resource_batches(
+            read_resource_batches(resource_properties), resource_properties
+        ),
+        check_row_order=False,
+        check_column_order=False,
+    )
+
+
+def test_raises_error_when_partitioned_data_is_missing(
+    package_path, resource_properties
+):
+    """Should raise an error if the path is set to partitioned data, but there is
+    no partitioned data to get the partition field from.
+    """
+    # Given
+    resource_properties.path = str(Path("resources", "example-resource", "data"))
+
+    # When, Then
+    with raises(ValueError, match="partition"):
+        rebuild_resource_data(resource_properties)
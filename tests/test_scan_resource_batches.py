@@ -0,0 +1,185 @@
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import fixture, raises
+
+from seedcase_sprout.check_properties import DataResourceError
+from seedcase_sprout.constants import BATCH_TIMESTAMP_COLUMN_NAME
+from seedcase_sprout.properties import (
+    FieldProperties,
+    ResourceProperties,
+    TableSchemaProperties,
+)
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.scan_resource_batches import scan_resource_batches
+from tests.assert_raises_errors import assert_raises_errors
+from tests.directory_structure_setup import (
+    create_test_data_package,
+)
+
+batch_data_1 = pl.DataFrame(
+    {
+        "id": [0, 1, 2],
+        "name": ["anne", "belinda", "catherine"],
+    }
+)
+
+batch_data_2 = pl.DataFrame(
+    {
+        "id": [3, 4, 5],
+        "name": ["dorothy", "figaro", "gabrielle"],
+    }
+)
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    return ResourceProperties(
+        name="1",
+        title="Test resource",
+        description="A test resource",
+        schema=TableSchemaProperties(
+            fields=[
+                FieldProperties(name="id", type="integer"),
+                FieldProperties(name="name", type="string"),
+            ]
+        ),
+    )
+
+
+@fixture
+def test_package(tmp_path):
+    create_test_data_package(tmp_path)
+    batch_path = tmp_path / "resources" / "1" / "batch"
+    batch_path.mkdir(parents=True)
+
+    for timestamp, batch_data in [
+        ("2025-03-26T100346Z", batch_data_1),
+        ("2025-03-27T100346Z", batch_data_2),
+    ]:
+        batch_data.write_parquet(batch_path / f"{timestamp}-{uuid4()}.parquet")
+
+    return tmp_path
+
+
+@fixture
+def resource_paths(test_package):
+    return sorted((test_package / "resources" / "1" / "batch").iterdir())
+
+
+def test_scans_resource_batches_correctly(resource_paths, resource_properties):
+    """Scans all batches into one LazyFrame with the expected timestamp column."""
+    # When
+    data = scan_resource_batches(
+        resource_properties=resource_properties, paths=resource_paths
+    )
+
+    # Then
+    assert isinstance(data, pl.LazyFrame)
+    expected_data = pl.concat(
+        read_resource_batches(
+            resource_properties=resource_properties, paths=resource_paths
+        )
+    )
+    assert_frame_equal(data.collect(), expected_data, check_row_order=False)
+
+
+def test_timestamp_column_can_be_filtered(resource_paths, resource_properties):
+    """Filters on the timestamp column only keep rows from the matching batch."""
+    # When
+    data = (
+        scan_resource_batches(
+            resource_properties=resource_properties, paths=resource_paths
+        )
+        .filter(
+            pl.col(BATCH_TIMESTAMP_COLUMN_NAME)
+            == datetime(2025, 3, 27, 10, 3, 46, tzinfo=UTC)
+        )
+        .select("name")
+        .collect()
+    )
+
+    # Then
+    assert data["name"].to_list() == batch_data_2["name"].to_list()
+
+
+def test_uses_cwd_if_no_paths(tmp_cwd, test_package, resource_properties):
+    """If no paths are provided, should scan the batch files in the cwd package."""
+    data = scan_resource_batches(resource_properties)
+
+    assert data.collect().height == 6
+
+
+def test_raises_error_when_no_batches(tmp_cwd, resource_properties):
+    """Raises ValueError when there are no batch files to scan."""
+    with raises(ValueError) as error:
+        scan_resource_batches(resource_properties)
+
+    assert str(resource_properties.name) in str(error.value)
+
+
+def test_raises_error_when_file_does_not_exist(resource_paths, resource_properties):
+    """Raises FileNotFoundError when a file in the list of paths doesn't exist."""
+    resource_paths.append(Path("non-existent-file.parquet"))
+
+    with raises(FileNotFoundError):
+        scan_resource_batches(
+            resource_properties=resource_properties, paths=resource_paths
+        )
+
+
+def test_raises_error_when_file_name_has_no_timestamp(
+    resource_paths, resource_properties
+):
+    """Raises ValueError when the batch file name doesn't contain a timestamp."""
+    batch_file_path = resource_paths[0].parent / f"{uuid4()}.parquet"
+    batch_data_1.write_parquet(batch_file_path)
+
+    with raises(ValueError):
+        scan_resource_batches(
+            resource_properties=resource_properties, paths=[batch_file_path]
+        )
+
+
+def test_raises_error_when_timestamp_column_matches_existing_column(
+    resource_paths, resource_properties
+):
+    """Raises ValueError when the timestamp column name matches an existing column."""
+    resource_properties.schema.fields.append(
+        FieldProperties(name=BATCH_TIMESTAMP_COLUMN_NAME, type="string")
+    )
+    batch_file_path = resource_paths[0].parent / f"2025-03-26T100346Z-{uuid4()}.parquet"
+    batch_data_1.with_columns(
+        pl.lit("2024-03-26T100346Z").alias(BATCH_TIMESTAMP_COLUMN_NAME)
+    ).write_parquet(batch_file_path)
+
+    with raises(ValueError):
+        scan_resource_batches(
+            resource_properties=resource_properties, paths=[batch_file_path]
+        )
+
+
+def test_raises_error_when_properties_do_not_match_data(
+    resource_paths, resource_properties
+):
+    """Raises errors from checks when the resource properties don't match the data."""
+    resource_properties.schema.fields[0].name = "not-id"
+
+    assert_raises_errors(
+        lambda: scan_resource_batches(
+            resource_properties=resource_properties, paths=resource_paths
+        ),
+        ValueError,
+        error_count=2,
+    )
+
+
+def test_raises_error_with_empty_resource_properties(resource_paths):
+    """Raises errors from checks if the resource properties are empty."""
+    with raises(DataResourceError):
+        scan_resource_batches(
+            resource_properties=ResourceProperties(), paths=resource_paths
+        )
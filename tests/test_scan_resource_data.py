@@ -0,0 +1,101 @@
+import os
+import shutil
+from unittest.mock import patch
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import raises
+
+from seedcase_sprout.examples import (
+    ExamplePackage,
+    example_data,
+    example_resource_properties,
+)
+from seedcase_sprout.scan_resource_data import scan_resource_data
+from seedcase_sprout.write_resource_data import write_resource_data
+
+
+def test_scans_resource_data():
+    """Should scan the resource's data file into a LazyFrame."""
+    with ExamplePackage():
+        data = scan_resource_data("example-resource")
+
+        assert isinstance(data, pl.LazyFrame)
+        assert_frame_equal(data.collect(), example_data())
+
+
+def test_scans_resource_data_with_package_path():
+    """Should scan the data file in the given package."""
+    with ExamplePackage() as package_path:
+        data = scan_resource_data("example-resource", package_path.root())
+
+        assert data.collect().shape == example_data().shape
+
+
+def test_raises_error_with_wrong_resource(tmp_cwd):
+    """Should raise an error if the resource has no data file."""
+    with raises(FileNotFoundError, match="wrong-name"):
+        scan_resource_data("wrong-name")
+
+
+def test_scans_current_ipc_sidecar():
+    """Should memory-map the sidecar while the data file hasn't changed."""
+    # Given
+    with ExamplePackage() as package_path:
+        write_resource_data(
+            example_data(), example_resource_properties(), ipc_sidecar=True
+        )
+
+        # When
+        with patch("polars.scan_parquet") as scan_parquet:
+            data = scan_resource_data("example-resource")
+
+        # Then
+        scan_parquet.assert_not_called()
+        assert package_path.resource_data_sidecar("example-resource").is_file()
+        assert_frame_equal(data.collect(), example_data())
+
+
+def test_ignores_ipc_sidecar_after_data_file_changes():
+    """Should read the data file when it has changed since writing the sidecar."""
+    # Given
+    with ExamplePackage() as package_path:
+        write_resource_data(
+            example_data(), example_resource_properties(), ipc_sidecar=True
+        )
+        data_path = package_path.resource_data("example-resource")
+        new_data = example_data().head(1)
+        new_data.write_parquet(data_path)
+        stat = data_path.stat()
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        # When
+        data = scan_resource_data("example-resource")
+
+        # Then
+        assert_frame_equal(data.collect(), new_data)
+
+
+def test_ignores_ipc_sidecar_after_data_file_is_copied_over_with_same_mtime():
+    """Should read the data file when another file was copied over it, even if
+    the copy kept the modification time of the old data file.
+    """
+    # Given
+    with ExamplePackage() as package_path:
+        write_resource_data(
+            example_data(), example_resource_properties(), ipc_sidecar=True
+        )
+        data_path = package_path.resource_data("example-resource")
+        stat = data_path.stat()
+        new_data = example_data().head(1)
+        new_data_path = package_path.root() / "new-data.parquet"
+        new_data.write_parquet(new_data_path)
+        shutil.copyfile(new_data_path, data_path)
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # When
+        data = scan_resource_data("example-resource")
+
+        # Then
+        assert data_path.stat().st_mtime_ns == stat.st_mtime_ns
+        assert_frame_equal(data.collect(), new_data)
@@ -0,0 +1,275 @@
+import json
+import os
+
+import polars as pl
+from polars.testing import assert_frame_equal
+from pytest import fixture, raises
+
+from seedcase_sprout.examples import ExamplePackage, example_resource_properties
+from seedcase_sprout.ipc_sidecar import _write_ipc_sidecar
+from seedcase_sprout.join_resource_batches import join_resource_batches
+from seedcase_sprout.properties import ConstraintsProperties, ResourceProperties
+from seedcase_sprout.read_resource_batches import read_resource_batches
+from seedcase_sprout.read_resource_data import read_resource_data
+from seedcase_sprout.rebuild_resource_data import rebuild_resource_data
+from seedcase_sprout.update_resource_data import update_resource_data
+from seedcase_sprout.write_resource_data import write_resource_data
+
+batch_data_1 = pl.DataFrame(
+    {
+        "id": [0, 1],
+        "name": ["anne", "belinda"],
+        "value": [0.0, 1.1],
+    }
+)
+
+batch_data_2 = pl.DataFrame(
+    {
+        "id": [2, 0],
+        "name": ["catherine", "alberta"],
+        "value": [2.2, 9.9],
+    }
+)
+
+batch_data_3 = pl.DataFrame(
+    {
+        "id": [1, 3],
+        "name": ["bertha", "dorothy"],
+        "value": [1.2, 3.3],
+    }
+)
+
+
+@fixture
+def resource_properties() -> ResourceProperties:
+    resource_properties = example_resource_properties()
+    resource_properties.schema.primary_key = "id"
+    return resource_properties
+
+
+@fixture
+def package_path(resource_properties):
+    with ExamplePackage() as package_path:
+        batch_path = package_path.resource_batch(str(resource_properties.name))
+        batch_path.mkdir()
+        batch_data_1.write_parquet(batch_path / "2024-03-26T100000Z-1.parquet")
+        batch_data_2.write_parquet(batch_path / "2025-03-26T100000Z-2.parquet")
+        yield package_path
+
+
+def expected_data(resource_properties) -> pl.DataFrame:
+    return join_resource_batches(
+        read_resource_batches(resource_properties), resource_properties
+    )
+
+
+def read_manifest_names(package_path, resource_properties) -> list[str]:
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    manifest = json.loads(manifest_path.read_text())
+    return sorted(entry["name"] for entry in manifest["batch_files"])
+
+
+def test_rebuilds_data_when_there_is_no_manifest(package_path, resource_properties):
+    """Should build the data from all batches and create the manifest."""
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(
+        pl.read_parquet(data_path),
+        expected_data(resource_properties),
+        check_row_order=False,
+    )
+    assert read_manifest_names(package_path, resource_properties) == [
+        "2024-03-26T100000Z-1.parquet",
+        "2025-03-26T100000Z-2.parquet",
+    ]
+
+
+def test_adds_only_new_batches_to_data(package_path, resource_properties):
+    """Should add new batches to the data, with the newest units replacing old."""
+    # Given
+    rebuild_resource_data(resource_properties)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_data_3.write_parquet(batch_path / "2026-03-26T100000Z-3.parquet")
+
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(
+        pl.read_parquet(data_path),
+        expected_data(resource_properties),
+        check_row_order=False,
+    )
+    assert pl.read_parquet(data_path).filter(id=1)["name"].to_list() == ["bertha"]
+    assert read_manifest_names(package_path, resource_properties)[-1] == (
+        "2026-03-26T100000Z-3.parquet"
+    )
+
+
+def test_adds_new_batches_to_data_without_primary_key(
+    package_path, resource_properties
+):
+    """Should only drop existing rows that are identical to new rows when there
+    is no primary key.
+    """
+    # Given
+    resource_properties.schema.primary_key = None
+    rebuild_resource_data(resource_properties)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_data_1.write_parquet(batch_path / "2026-03-26T100000Z-3.parquet")
+
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(
+        pl.read_parquet(data_path),
+        expected_data(resource_properties),
+        check_row_order=False,
+    )
+    assert pl.read_parquet(data_path).height == 4
+
+
+def test_removes_ipc_sidecar_of_old_data_file(package_path, resource_properties):
+    """Should remove the Arrow IPC sidecar, since it has the old data."""
+    # Given
+    data_path = rebuild_resource_data(resource_properties)
+    sidecar_path = package_path.resource_data_sidecar(resource_properties.name)
+    _write_ipc_sidecar(pl.read_parquet(data_path), sidecar_path, data_path)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_data_3.write_parquet(batch_path / "2026-03-26T100000Z-3.parquet")
+
+    # When
+    update_resource_data(resource_properties)
+
+    # Then
+    assert list(sidecar_path.parent.glob(f"{sidecar_path.name}*")) == []
+
+
+def test_does_not_read_merged_batches(package_path, resource_properties):
+    """Should not read batches that are already merged into the data."""
+    # Given
+    rebuild_resource_data(resource_properties)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    merged_path = batch_path / "2024-03-26T100000Z-1.parquet"
+    # Keep the same size and mtime, but make the file unreadable as Parquet
+    stat = merged_path.stat()
+    merged_path.write_bytes(b"x" * stat.st_size)
+    os.utime(merged_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    batch_data_3.write_parquet(batch_path / "2026-03-26T100000Z-3.parquet")
+
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert pl.read_parquet(data_path).height == 4
+
+
+def test_does_nothing_without_new_batches(package_path, resource_properties):
+    """Should keep the data file as is if there are no new batches."""
+    # Given
+    data_path = rebuild_resource_data(resource_properties)
+    mtime = data_path.stat().st_mtime_ns
+
+    # When
+    update_resource_data(resource_properties)
+
+    # Then
+    assert data_path.stat().st_mtime_ns == mtime
+
+
+def test_rebuilds_data_when_new_batch_is_older(package_path, resource_properties):
+    """Should rebuild from all batches if a new batch is older than merged ones."""
+    # Given
+    rebuild_resource_data(resource_properties)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_data_3.write_parquet(batch_path / "2023-03-26T100000Z-3.parquet")
+
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(
+        pl.read_parquet(data_path),
+        expected_data(resource_properties),
+        check_row_order=False,
+    )
+    assert pl.read_parquet(data_path).filter(id=1)["name"].to_list() == ["belinda"]
+
+
+def test_rebuilds_data_when_merged_batch_is_removed(package_path, resource_properties):
+    """Should rebuild from all batches if a merged batch has been removed."""
+    # Given
+    rebuild_resource_data(resource_properties)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    (batch_path / "2025-03-26T100000Z-2.parquet").unlink()
+
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(pl.read_parquet(data_path), batch_data_1, check_row_order=False)
+
+
+def test_write_resource_data_removes_manifest(package_path, resource_properties):
+    """Writing the data directly should remove the outdated manifest."""
+    # Given
+    rebuild_resource_data(resource_properties)
+
+    # When
+    write_resource_data(batch_data_1, resource_properties)
+
+    # Then
+    manifest_path = package_path.resource_batch_manifest(resource_properties.name)
+    assert not manifest_path.exists()
+
+
+def test_keeps_data_file_if_new_values_do_not_meet_constraints(
+    package_path, resource_properties
+):
+    """Should not add new batches with values that don't meet the constraints."""
+    # Given
+    data_path = rebuild_resource_data(resource_properties)
+    old_data = pl.read_parquet(data_path)
+    resource_properties.schema.fields[2].constraints = ConstraintsProperties(maximum=10)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_data_3.with_columns(value=99.0).write_parquet(
+        batch_path / "2026-03-26T100000Z-3.parquet"
+    )
+
+    # When
+    with raises(ExceptionGroup):
+        update_resource_data(resource_properties)
+
+    # Then
+    assert_frame_equal(pl.read_parquet(data_path), old_data)
+    assert read_manifest_names(package_path, resource_properties)[-1] == (
+        "2025-03-26T100000Z-2.parquet"
+    )
+
+
+def test_adds_new_batches_to_partitioned_data(package_path, resource_properties):
+    """Should add new batches to partitioned data without rebuilding it."""
+    # Given
+    write_resource_data(batch_data_1, resource_properties, partition_by="name")
+    rebuild_resource_data(resource_properties)
+    batch_path = package_path.resource_batch(resource_properties.name)
+    batch_data_3.write_parquet(batch_path / "2026-03-26T100000Z-3.parquet")
+
+    # When
+    data_path = update_resource_data(resource_properties)
+
+    # Then
+    assert data_path == package_path.resource_partitioned_data(resource_properties.name)
+    assert "name=bertha" in {path.name for path in data_path.iterdir()}
+    assert_frame_equal(
+        read_resource_data(resource_properties.name),
+        expected_data(resource_properties),
+        check_row_order=False,
+        check_column_order=False,
+    )
+    assert read_manifest_names(package_path, resource_properties)[-1] == (
+        "2026-03-26T100000Z-3.parquet"
+    )
@@ -1,8 +1,9 @@
+from pathlib import Path
 from typing import cast
 
 import polars as pl
 from polars.testing import assert_frame_equal
-from pytest import raises
+from pytest import mark, raises
 
 from seedcase_sprout.check_properties import DataResourceError
 from seedcase_sprout.examples import (
@@ -14,6 +15,7 @@ from seedcase_sprout.examples import (
 )
 from seedcase_sprout.properties import ResourceProperties
 from seedcase_sprout.read_properties import read_properties
+from seedcase_sprout.read_resource_data import read_resource_data
 from seedcase_sprout.write_resource_data import write_resource_data
 from tests.assert_raises_errors import (
     assert_raises_errors,
@@ -79,3 +81,138 @@ def test_throws_error_if_properties_do_not_match_data():
     assert_raises_errors(
         lambda: write_resource_data(example_data(), resource_properties), ValueError
     )
+
+
+def test_throws_error_if_keys_are_not_unique():
+    """Should throw an error if the primary key of the data isn't unique."""
+    resource_properties = example_resource_properties()
+    assert resource_properties.schema
+    resource_properties.schema.primary_key = "id"
+    data = pl.concat([example_data(), example_data()])
+
+    with ExamplePackage():
+        assert_raises_errors(
+            lambda: write_resource_data(data, resource_properties), ValueError, 1
+        )
+
+
+def test_writes_partitioned_data():
+    """Should write one folder per value of the partition field."""
+    # Given
+    resource_properties = example_resource_properties()
+    data = pl.concat(
+        [example_data(), example_data().with_columns(id=pl.lit(1, dtype=pl.Int64))]
+    )
+
+    with ExamplePackage() as package_path:
+        # When
+        data_path = write_resource_data(data, resource_properties, partition_by="id")
+
+        # Then
+        assert data_path == package_path.resource_partitioned_data("example-resource")
+        assert not package_path.resource_data("example-resource").exists()
+        assert {path.name for path in data_path.iterdir()} == {
+            "id=1",
+            "id=34",
+            "id=99",
+            "id=100",
+        }
+        assert_frame_equal(
+            read_resource_data("example-resource"), data, check_row_order=False
+        )
+        assert (
+            read_resource_data("example-resource", filter=pl.col("id") == 1).height
+            == example_data().height
+        )
+        assert resource_properties.path == str(
+            Path("resources", "example-resource", "data")
+        )
+
+
+def test_replaces_partitioned_data_with_single_file():
+    """Should remove the partitioned data when writing without partitions."""
+    resource_properties = example_resource_properties()
+
+    with ExamplePackage() as package_path:
+        write_resource_data(example_data(), resource_properties, partition_by="id")
+
+        data_path = write_resource_data(example_data(), resource_properties)
+
+        assert data_path == package_path.resource_data("example-resource")
+        assert not package_path.resource_partitioned_data("example-resource").exists()
+        assert_frame_equal(read_resource_data("example-resource"), example_data())
+        assert resource_properties.path == str(
+            Path("resources", "example-resource", "data.parquet")
+        )
+
+
+def test_throws_error_if_partition_field_does_not_exist():
+    """Should throw an error if the partition field isn't in the properties."""
+    with ExamplePackage(), raises(ValueError, match="not-a-field"):
+        write_resource_data(
+            example_data(), example_resource_properties(), partition_by="not-a-field"
+        )
+
+
+@mark.parametrize("field_name", ["my_time", "my_geopoint", "my_any", "my_none"])
+def test_throws_error_if_partition_field_values_cannot_be_folder_names(field_name):
+    """Should throw an error before writing anything if the values of the
+    partition field can't be stored in the names of the partition folders.
+    """
+    resource_properties = example_resource_properties_all_types()
+
+    with ExamplePackage() as package_path:
+        with raises(ValueError, match=field_name):
+            write_resource_data(
+                example_data_all_types(),
+                resource_properties,
+                partition_by=field_name,
+            )
+
+        assert not package_path.resource_partitioned_data(
+            str(resource_properties.name)
+        ).exists()
+
+
+@mark.parametrize("field_name", ["my_date", "my_datetime_tz", "my_string"])
+def test_partitioned_data_can_be_read_back(field_name):
+    """Should read the same data as written when partitioning by a field with
+    values that can be stored in folder names.
+    """
+    resource_properties = example_resource_properties_all_types()
+
+    with ExamplePackage():
+        write_resource_data(
+            example_data_all_types(), resource_properties, partition_by=field_name
+        )
+
+        assert_frame_equal(
+            read_resource_data(str(resource_properties.name)),
+            example_data_all_types(),
+            check_row_order=False,
+            check_column_order=False,
+        )
+
+
+def test_removes_ipc_sidecar_when_written_without_it():
+    """Should remove the sidecar when writing the data without a sidecar."""
+    resource_properties = example_resource_properties()
+
+    with ExamplePackage() as package_path:
+        write_resource_data(example_data(), resource_properties, ipc_sidecar=True)
+
+        write_resource_data(example_data(), resource_properties)
+
+        sidecar_path = package_path.resource_data_sidecar("example-resource")
+        assert list(sidecar_path.parent.glob(f"{sidecar_path.name}*")) == []
+
+
+def test_throws_error_with_ipc_sidecar_for_partitioned_data():
+    """Should throw an error when asking for a sidecar for partitioned data."""
+    with ExamplePackage(), raises(ValueError, match="ipc_sidecar"):
+        write_resource_data(
+            example_data(),
+            example_resource_properties(),
+            partition_by="id",
+            ipc_sidecar=True,
+        )